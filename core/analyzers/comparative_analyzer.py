@@ -3,27 +3,99 @@ Comparative Analyzer
 여러 프로덕트의 데이터를 비교 분석하고 리소스 배분 추천을 제공합니다.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from google import genai
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from ..storage.metrics_store import MetricsStore
+from ..utils.llm_cache import LLMResponseCache, generate_text, get_llm_cache, stream_text
+from ..utils.report_stream import ReportStream
+from .delta_engine import DeltaEngine, format_delta_table
+from .metrics_frame import (
+    GOAL_SPECS, LEVEL_FLAGS, LEVEL_STATUS, THRESHOLD_LABELS,
+    achievement_flags, build_metrics_frame, format_goal_actual, format_threshold_value,
+    goal_achievement, health_scores, metric_config_frames, metric_row, threshold_levels
+)
+from .page_join import product_page_gaps
+from .prompt_budget import SUMMARY_ROW_LIMITS, budget_report, estimate_tokens, fit_sections, fit_summary
+from .structured_output import STRUCTURED_OUTPUT_INSTRUCTIONS, parse_structured_report, response_config
+
+
+# 마크다운 모드 리포트의 자동화용 액션 JSON 블록 안내 (ActionExtractor가 파싱)
+MACHINE_READABLE_ACTIONS_SECTION = """## 🤖 Machine-Readable Actions (DO NOT MODIFY)
+아래는 자동화를 위한 데이터입니다. 반드시 정확한 JSON 형식을 유지하세요.
+- **new_value**: 전 세계 여러 국가의 사용자를 고려하여 반드시 범용적이고 이해하기 쉬운 **영문(English)**으로 작성해야 하며, 15자 이상의 구체적이고 매력적인 SEO 문구여야 합니다. (예: "Image Converter | Convert JPG to PNG Online for Free")
+- "white", "btn", "click" 같이 짧거나 의미 없는 단어는 절대 금지입니다.
+
+```json
+[
+  {
+    "product_id": "qr-generator",
+    "action_type": "update_meta_title",
+    "target_file": "src/app/layout.tsx",
+    "parameters": {"new_title": "Free Online QR Code Generator | Fast & Easy", "new_value": "Free Online QR Code Generator | Fast & Easy"},
+    "description": "메인 페이지 메타 타이틀 최적화"
+  },
+  {
+    "product_id": "convert-image",
+    "action_type": "update_meta_title",
+    "target_file": "pages/Home.tsx",
+    "parameters": {"new_title": "Image Converter | Compress & Convert JPG PNG Free", "new_value": "Image Converter | Compress & Convert JPG PNG Free"},
+    "description": "랜딩 페이지 SEO 타이틀 강화"
+  }
+]
+```
+"""
 
 
 class ComparativeAnalyzer:
     """여러 프로덕트를 비교 분석하는 클래스"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        metrics_store: Optional[MetricsStore] = None,
+        delta_windows: int = 4,
+        llm_cache: Optional[LLMResponseCache] = None,
+        prompt_token_budget: Optional[int] = None,
+        analysis_mode: str = 'single',
+        analysis_workers: int = 4,
+        analysis_output: str = 'markdown',
+        client: Optional[genai.Client] = None
+    ):
         """
         Args:
             api_key: Google Gemini API 키
+            metrics_store: 이전 스냅샷을 읽을 로컬 저장소 (없으면 이번 실행 데이터만 사용)
+            delta_windows: 변화량을 계산할 이전 기간 수
+            llm_cache: Gemini 응답 캐시 (없으면 configure_llm_cache()로 설정한 공유 캐시)
+            prompt_token_budget: 분석 프롬프트의 추정 토큰 예산 (넘으면 요약 목록을 줄임, None이면 제한 없음)
+            analysis_mode: 'single' (한 프롬프트로 분석) 또는 'map_reduce' (프로덕트별 분석 후 비교)
+            analysis_workers: map_reduce에서 동시에 실행할 프로덕트별 분석 수
+            analysis_output: 'markdown' (analyze_products) 또는 'json' (analyze_products_structured, 액션 목록 포함)
+            client: 사용할 Gemini 클라이언트 (없으면 api_key로 생성, 테스트에서 가짜 클라이언트 주입용)
         """
-        self.client = genai.Client(api_key=api_key)
+        self.client = client if client is not None else genai.Client(api_key=api_key)
+        self.metrics_store = metrics_store
+        self.llm_cache = llm_cache if llm_cache is not None else get_llm_cache()
+        self.prompt_token_budget = prompt_token_budget
+        self.analysis_mode = analysis_mode
+        self.analysis_workers = analysis_workers
+        self.analysis_output = analysis_output
+        self.delta_engine = DeltaEngine(metrics_store, windows=delta_windows) if metrics_store is not None else None
         # Gemini 2.0 Flash - 최신 안정 모델
         self.model_id = 'gemini-2.0-flash'
 
-    def analyze_products(self, products_data: List[Dict]) -> str:
+    def analyze_products(self, products_data: List[Dict], stream: Optional[ReportStream] = None) -> str:
         """
         여러 프로덕트를 비교 분석하고 통합 리포트 생성
 
+        stream을 주면 generate_content_stream으로 받은 청크를 도착하는 즉시 stream에 씁니다.
+        analysis_mode가 'map_reduce'이면 프로덕트별 개별 분석을 동시에 실행하고,
+        수집 데이터 요약 대신 그 결과를 모아 비교 분석을 요청합니다.
+
         Args:
             products_data: 각 프로덕트의 수집된 데이터 리스트
                 [{
@@ -34,44 +106,242 @@ class ComparativeAnalyzer:
                     'trends': {...},
                     'adsense': {...}
                 }]
+            stream: 리포트 파일 스트림 (없으면 전체 응답을 받은 뒤 반환)
 
         Returns:
-            마크다운 형식의 비교 분석 리포트
+            마크다운 형식의 비교 분석 리포트 (스트리밍한 경우 스트림에 쓴 전체 내용)
         """
-        # 데이터 요약
-        summary = self._build_summary(products_data)
-
-        # 각 프로덕트의 지표 플래그 계산
-        metrics_analysis = self._analyze_metrics(products_data)
-
-        # Gemini에 분석 요청
-        prompt = self._build_analysis_prompt(summary, products_data, metrics_analysis)
+        prompt, summary, tokens = self._prepare_analysis_prompt(products_data)
 
         try:
+            print(f"   📏 프롬프트 추정: {budget_report(tokens, self.prompt_token_budget)}")
             print(f"   💬 Gemini AI 분석 요청 중... (프롬프트 크기: {len(prompt)}자)")
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
+            if stream is not None:
+                text = stream_text(self.client, self.model_id, prompt, on_text=stream.write, cache=self.llm_cache)
+                stream.close()
+                first_chunk = f", 첫 청크 {stream.first_chunk_seconds:.1f}s" if stream.first_chunk_seconds is not None else ""
+                print(f"   ✅ Gemini AI 분석 완료 (스트리밍 {stream.chunks}개 청크{first_chunk})")
+                return text
+            text = generate_text(self.client, self.model_id, prompt, cache=self.llm_cache)
             print(f"   ✅ Gemini AI 분석 완료")
-            return response.text
+            return text
 
         except Exception as e:
             return f"❌ 분석 중 오류 발생: {str(e)}\n\n수집된 데이터:\n{summary}"
 
-    def _build_summary(self, products_data: List[Dict]) -> str:
+    def analyze_products_structured(self, products_data: List[Dict]) -> Tuple[str, List[Dict]]:
+        """
+        JSON 모드(response_schema)로 비교 분석을 요청해 리포트와 액션 목록을 함께 받음
+
+        프롬프트는 analyze_products와 같되 리포트 안 액션 JSON 블록 안내 대신 응답 형식 안내가 들어가며
+        (토큰 예산에도 포함), 응답은 structured_output.REPORT_SCHEMA 형식입니다.
+        액션은 models.Action 필드 그대로의 딕셔너리라 ActionExtractor가 파싱 없이 불러올 수 있습니다.
+
+        Args:
+            products_data: 각 프로덕트의 수집된 데이터 리스트 (analyze_products와 동일)
+
+        Returns:
+            (마크다운 리포트, 액션 딕셔너리 리스트). 실패하면 ('❌ ...' 오류 메시지, [])
+        """
+        prompt, summary, tokens = self._prepare_analysis_prompt(products_data, structured=True)
+
+        try:
+            print(f"   📏 프롬프트 추정: {budget_report(tokens, self.prompt_token_budget)}")
+            print(f"   💬 Gemini AI 분석 요청 중... (JSON 모드, 프롬프트 크기: {len(prompt)}자)")
+            text = generate_text(self.client, self.model_id, prompt, config=response_config(), cache=self.llm_cache)
+            report, actions = parse_structured_report(text)
+            print(f"   ✅ Gemini AI 분석 완료 (액션 {len(actions)}개)")
+            return report, actions
+
+        except Exception as e:
+            return f"❌ 분석 중 오류 발생: {str(e)}\n\n수집된 데이터:\n{summary}", []
+
+    def _prepare_analysis_prompt(
+        self,
+        products_data: List[Dict],
+        structured: bool = False
+    ) -> Tuple[str, str, Dict[str, int]]:
+        """
+        지표 분석, 변화량, 요약(또는 프로덕트별 개별 분석)을 모아 비교 분석 프롬프트 생성
+
+        Args:
+            products_data: 각 프로덕트의 수집된 데이터 리스트
+            structured: JSON 모드 프롬프트 여부 (응답 형식 안내도 지시문 토큰에 포함)
+
+        Returns:
+            (프롬프트, 요약 섹션 문자열, 섹션별 추정 토큰 수)
+        """
+        if self.analysis_mode == 'map_reduce':
+            # 프로덕트별 개별 분석(지표, 변화량 포함)을 모아 짧은 비교 프롬프트로 요청
+            reports = self._map_product_reports(products_data)
+            return self._fit_reduce_prompt(products_data, reports, structured=structured)
+
+        # 프로덕트 x 지표 프레임 (요약, 지표 분석, 변화량 계산에 함께 사용)
+        metrics = build_metrics_frame(products_data)
+
+        # 각 프로덕트의 지표 플래그 계산
+        metrics_analysis = self._analyze_metrics(products_data, metrics)
+
+        # 저장된 이력 기반 이전 기간 대비 변화량
+        delta_analysis = self._analyze_deltas(products_data, metrics)
+
+        # 데이터 요약 (토큰 예산 안으로 목록 축소)
+        summary, tokens = self._fit_prompt_budget(
+            products_data, metrics, metrics_analysis, delta_analysis, structured=structured
+        )
+        if 'deltas' not in tokens:
+            delta_analysis = ""
+
+        # Gemini에 보낼 프롬프트
+        prompt = self._build_analysis_prompt(
+            summary, products_data, metrics_analysis, delta_analysis, structured=structured
+        )
+
+        return prompt, summary, tokens
+
+    def _map_product_reports(self, products_data: List[Dict]) -> List[str]:
+        """
+        프로덕트별 개별 분석을 최대 analysis_workers개씩 동시에 실행하고 결과를 하나로 합침
+
+        개별 분석이 실패한 프로덕트는 해당 프로덕트의 수집 데이터 요약으로 대신하므로
+        한 프로덕트의 오류가 전체 리포트를 막지 않습니다.
+
+        Returns:
+            프로덕트 순서대로 '## 이름 (id)' 제목을 붙인 개별 분석 결과 리스트
+        """
+        workers = max(1, min(self.analysis_workers, len(products_data)))
+        print(f"   🗺️  프로덕트별 개별 분석 {len(products_data)}개 (동시 {workers}개)...")
+
+        reports: List[Optional[str]] = [None] * len(products_data)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.generate_individual_report, data): index
+                for index, data in enumerate(products_data)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                data = products_data[index]
+                name = data.get('name', 'Unknown')
+                try:
+                    reports[index] = future.result()
+                    print(f"      ✅ {name} 개별 분석 완료")
+                except Exception as e:
+                    print(f"      ⚠️  {name} 개별 분석 실패, 수집 데이터 요약으로 대체: {e}")
+                    reports[index] = (
+                        f"(⚠️ 개별 분석 실패: {e} - 수집 데이터 요약으로 대체)\n"
+                        f"{self._build_summary([data])}"
+                    )
+
+        return [
+            f"## {data.get('name', 'Unknown')} ({data.get('id', 'Unknown')})\n{report.strip()}"
+            for data, report in zip(products_data, reports)
+        ]
+
+    def _fit_reduce_prompt(
+        self,
+        products_data: List[Dict],
+        reports: List[str],
+        structured: bool = False
+    ) -> Tuple[str, str, Dict[str, int]]:
+        """
+        프로덕트별 개별 분석을 토큰 예산 안으로 줄여 비교 단계 프롬프트 생성
+
+        지시문을 뺀 남은 예산으로, 가장 긴 개별 분석의 마지막 줄부터 잘라냅니다.
+
+        Returns:
+            (프롬프트, 합친 개별 분석 문자열, 섹션별 추정 토큰 수)
+        """
+        tokens = {'instructions': estimate_tokens(self._build_reduce_prompt('', products_data, structured))}
+        budget = self.prompt_token_budget
+        remaining = budget - tokens['instructions'] if budget is not None else None
+
+        sections, removed = fit_sections(reports, remaining)
+        summary = "\n\n".join(sections)
+        tokens['product_reports'] = estimate_tokens(summary)
+
+        if removed:
+            print(f"   ✂️  토큰 예산에 맞춰 프로덕트별 개별 분석 {removed}줄 축소")
+        if budget is not None and sum(tokens.values()) > budget:
+            print(f"   ⚠️  최대로 줄여도 토큰 예산({budget:,})을 넘습니다 (추정 {sum(tokens.values()):,})")
+
+        return self._build_reduce_prompt(summary, products_data, structured), summary, tokens
+
+    def _fit_prompt_budget(
+        self,
+        products_data: List[Dict],
+        metrics: pd.DataFrame,
+        metrics_analysis: str,
+        delta_analysis: str,
+        structured: bool = False
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        섹션별 토큰을 추정해 요약 섹션을 예산 안으로 축소
+
+        지시문(고정 텍스트 + 프로덕트 환경 정보), 지표 분석, 변화량은 그대로 두고
+        남은 예산으로 요약 목록을 줄입니다. 요약을 최대한 줄여도 넘으면 변화량 섹션을 뺍니다.
+
+        Returns:
+            (요약 문자열, 섹션별 추정 토큰 수), 변화량을 뺀 경우 'deltas' 키가 없음
+        """
+        tokens = {
+            'instructions': estimate_tokens(self._build_analysis_prompt('', products_data, '', structured=structured)),
+            'metrics': estimate_tokens(metrics_analysis),
+            'deltas': estimate_tokens(delta_analysis),
+        }
+        budget = self.prompt_token_budget
+
+        def _fit():
+            fixed = sum(count for name, count in tokens.items() if name != 'summary')
+            remaining = budget - fixed if budget is not None else None
+            return fit_summary(lambda limits: self._build_summary(products_data, metrics, limits), remaining)
+
+        summary, limits, tokens['summary'] = _fit()
+        if budget is not None and sum(tokens.values()) > budget and tokens['deltas']:
+            print(f"   ⚠️  프롬프트가 토큰 예산({budget:,})을 넘어 변화량 섹션을 제외합니다.")
+            del tokens['deltas']
+            summary, limits, tokens['summary'] = _fit()
+
+        trimmed = {name: rows for name, rows in limits.items() if rows != SUMMARY_ROW_LIMITS[name]}
+        if trimmed:
+            print(f"   ✂️  토큰 예산에 맞춰 요약 목록 축소: "
+                  + ", ".join(f"{name} {rows}행" for name, rows in trimmed.items()))
+        if budget is not None and sum(tokens.values()) > budget:
+            print(f"   ⚠️  최대로 줄여도 토큰 예산({budget:,})을 넘습니다 (추정 {sum(tokens.values()):,})")
+        return summary, tokens
+
+    def _build_summary(
+        self,
+        products_data: List[Dict],
+        metrics: Optional[pd.DataFrame] = None,
+        row_limits: Optional[Dict[str, Optional[int]]] = None
+    ) -> str:
         """
         수집된 데이터를 요약 문자열로 변환
 
+        합계/평균은 지표 프레임 값을 사용하므로 summarize_product()로 상위 행만 남긴 데이터도 같은 요약이 됩니다.
+
         Args:
             products_data: 프로덕트 데이터 리스트
+            metrics: build_metrics_frame() 결과 (없으면 여기서 계산)
+            row_limits: 목록별 표시 행 수 (기본: SUMMARY_ROW_LIMITS, 0이면 목록 생략, None이면 전체)
 
         Returns:
             요약 문자열
         """
+        if metrics is None:
+            metrics = build_metrics_frame(products_data)
+        limits = {**SUMMARY_ROW_LIMITS, **(row_limits or {})}
+
+        def _rows(df: Optional[pd.DataFrame], name: str) -> pd.DataFrame:
+            """목록에 표시할 행 (없거나 생략된 목록은 빈 DataFrame)"""
+            if df is None or df.empty or limits[name] == 0:
+                return pd.DataFrame()
+            return df if limits[name] is None else df.head(limits[name])
+
         lines = []
 
-        for data in products_data:
+        for position, data in enumerate(products_data):
+            actual = metric_row(metrics, position)
             product_name = data.get('name', 'Unknown')
             config = data.get('config', {})
 
@@ -79,6 +349,12 @@ class ComparativeAnalyzer:
             lines.append(f"## {product_name}")
             lines.append(f"우선순위: {config.get('priority', 'N/A')}")
             lines.append(f"AdSense: {'있음' if config.get('has_adsense') else '없음'}")
+            if self.metrics_store is not None:
+                dates = self.metrics_store.snapshot_dates(data.get('id', ''))
+                if dates:
+                    lines.append(f"저장된 이력: {len(dates)}개 스냅샷 ({dates[0]} ~ {dates[-1]})")
+            if data.get('timed_out'):
+                lines.append(f"⚠️ 수집 시간 초과로 누락된 소스: {', '.join(data['timed_out'])} (부분 데이터)")
             lines.append(f"{'='*60}\n")
 
             # GSC 데이터
@@ -86,10 +362,10 @@ class ComparativeAnalyzer:
             if gsc_data and gsc_data.get('top_queries') is not None:
                 top_queries = gsc_data['top_queries']
                 if not top_queries.empty:
-                    total_clicks = int(top_queries['clicks'].sum())
-                    total_impressions = int(top_queries['impressions'].sum())
-                    avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-                    avg_position = float(top_queries['position'].mean())
+                    total_clicks = int(actual['gsc_clicks'])
+                    total_impressions = int(actual['gsc_impressions'])
+                    avg_ctr = actual['ctr_percent']
+                    avg_position = actual['avg_position']
 
                     lines.append("### Google Search Console")
                     lines.append(f"- 총 클릭: {total_clicks:,}")
@@ -97,39 +373,79 @@ class ComparativeAnalyzer:
                     lines.append(f"- 평균 CTR: {avg_ctr:.2f}%")
                     lines.append(f"- 평균 순위: {avg_position:.1f}")
 
-                    # 상위 5개 검색어
-                    lines.append("\n상위 검색어:")
-                    for idx, row in top_queries.head(5).iterrows():
-                        lines.append(f"  {idx+1}. '{row['query']}' - {int(row['clicks'])}회 클릭, 순위 {row['position']:.1f}")
+                    # 상위 검색어
+                    shown_queries = _rows(top_queries, 'top_queries')
+                    if not shown_queries.empty:
+                        lines.append("\n상위 검색어:")
+                        for idx, row in shown_queries.iterrows():
+                            lines.append(f"  {idx+1}. '{row['query']}' - {int(row['clicks'])}회 클릭, 순위 {row['position']:.1f}")
 
                     # 기회 키워드
-                    opportunities = gsc_data.get('opportunities')
-                    if opportunities is not None and not opportunities.empty:
+                    opportunities = _rows(gsc_data.get('opportunities'), 'opportunities')
+                    if not opportunities.empty:
                         lines.append("\n기회 키워드 (노출 많지만 순위 낮음):")
-                        for idx, row in opportunities.head(3).iterrows():
+                        for idx, row in opportunities.iterrows():
                             lines.append(f"  - '{row['query']}' - {int(row['impressions'])}회 노출, 순위 {row['position']:.1f}")
 
+                    # 순위 구간 기회 (4~20위, 조금만 올려도 클릭이 크게 늘어나는 검색어)
+                    position_opportunities = _rows(gsc_data.get('position_opportunities'), 'position_opportunities')
+                    if not position_opportunities.empty:
+                        lines.append(f"\n순위 상승 기회 (4~20위, 노출 상위 {len(position_opportunities)}개):")
+                        for _, row in position_opportunities.iterrows():
+                            lines.append(f"  - '{row['query']}' - {int(row['impressions'])}회 노출, 순위 {row['position']:.1f}")
+
+                    # 국가별 / 디바이스별 성과 (GSC 큐브 롤업)
+                    countries = _rows(gsc_data.get('country_performance'), 'countries')
+                    if not countries.empty:
+                        lines.append(f"\n국가별 성과 (클릭 상위 {len(countries)}개):")
+                        for _, row in countries.iterrows():
+                            lines.append(
+                                f"  - {row['country']}: {int(row['clicks']):,}회 클릭, "
+                                f"CTR {row['ctr'] * 100:.2f}%, 순위 {row['position']:.1f}"
+                            )
+
+                    devices = _rows(gsc_data.get('device_performance'), 'devices')
+                    if not devices.empty:
+                        lines.append("\n디바이스별 CTR:")
+                        for _, row in devices.iterrows():
+                            lines.append(
+                                f"  - {row['device']}: CTR {row['ctr'] * 100:.2f}% "
+                                f"({int(row['clicks']):,}회 클릭, {int(row['impressions']):,}회 노출)"
+                            )
+
             # GA4 데이터
             ga4_data = data.get('ga4')
             if ga4_data:
                 pages = ga4_data.get('pages')
                 if pages is not None and not pages.empty:
-                    total_sessions = int(pages['sessions'].sum())
-                    avg_engagement_rate = float(pages['engagement_rate'].mean()) if 'engagement_rate' in pages.columns else 0
+                    total_sessions = int(actual['sessions'])
+                    avg_engagement_rate = actual['engagement_rate']
 
                     lines.append("\n### Google Analytics 4")
                     lines.append(f"- 총 세션: {total_sessions:,}")
                     lines.append(f"- 평균 참여율: {avg_engagement_rate:.1f}%")
 
                     # 상위 페이지
-                    lines.append("\n상위 페이지:")
-                    for idx, row in pages.head(5).iterrows():
-                        sessions = int(row['sessions'])
-                        lines.append(f"  {idx+1}. {row['page_path']} - {sessions:,} 세션")
+                    shown_pages = _rows(pages, 'ga4_pages')
+                    if not shown_pages.empty:
+                        lines.append("\n상위 페이지:")
+                        for idx, row in shown_pages.iterrows():
+                            sessions = int(row['sessions'])
+                            lines.append(f"  {idx+1}. {row['page_path']} - {sessions:,} 세션")
+
+                # 검색 노출은 많지만 참여율이 낮은 페이지 (GSC page x GA4 page_path 조인)
+                page_gaps = _rows(product_page_gaps(data), 'page_gaps')
+                if not page_gaps.empty:
+                    lines.append("\n검색 노출 대비 참여율이 낮은 페이지:")
+                    for _, row in page_gaps.iterrows():
+                        lines.append(
+                            f"  - {row['page_key']} - {int(row['impressions']):,}회 노출, "
+                            f"{int(row['sessions']):,} 세션, 참여율 {row['engagement_rate']:.2f}"
+                        )
 
                 # 디바이스 분석
-                devices = ga4_data.get('devices')
-                if devices is not None and not devices.empty:
+                devices = _rows(ga4_data.get('devices'), 'ga4_devices')
+                if not devices.empty:
                     lines.append("\n디바이스 분석:")
                     for idx, row in devices.iterrows():
                         sessions = int(row['sessions'])
@@ -142,10 +458,11 @@ class ComparativeAnalyzer:
             if trends_data is not None and not trends_data.empty:
                 lines.append("\n### Google Trends")
                 # 관심도가 높은 키워드
-                top_trends = trends_data.nlargest(3, trends_data.columns[-1])
-                lines.append("최근 관심도 높은 키워드:")
-                for keyword in top_trends.index:
-                    lines.append(f"  - {keyword}")
+                if limits['trends'] != 0:
+                    top_trends = trends_data.nlargest(limits['trends'] or len(trends_data), trends_data.columns[-1])
+                    lines.append("최근 관심도 높은 키워드:")
+                    for keyword in top_trends.index:
+                        lines.append(f"  - {keyword}")
 
             # AdSense (있는 경우)
             adsense_data = data.get('adsense')
@@ -160,22 +477,33 @@ class ComparativeAnalyzer:
 
         return "\n".join(lines)
 
-    def _analyze_metrics(self, products_data: List[Dict]) -> str:
+    def _analyze_metrics(self, products_data: List[Dict], metrics: Optional[pd.DataFrame] = None) -> str:
         """
         각 프로덕트의 지표를 분석하고 플래그 생성
 
+        목표 달성률, 임계값 플래그, Health Score는 모든 프로덕트에 대해 한 번에 계산합니다.
+
         Args:
             products_data: 프로덕트 데이터 리스트
+            metrics: build_metrics_frame() 결과 (없으면 여기서 계산)
 
         Returns:
             지표 분석 결과 문자열
         """
+        if metrics is None:
+            metrics = build_metrics_frame(products_data)
+        config_frames = metric_config_frames(products_data)
+        rates = goal_achievement(metrics, config_frames['goals'])
+        rate_flags = achievement_flags(rates)
+        levels = threshold_levels(metrics, config_frames['critical'], config_frames['warning'])
+        scores = health_scores(metrics, config_frames['critical'], config_frames['warning'], config_frames['weights'])
+
         lines = []
         lines.append("\n" + "=" * 60)
         lines.append("📊 지표 기반 자동 분석 (Metrics Analysis)")
         lines.append("=" * 60)
 
-        for data in products_data:
+        for position, data in enumerate(products_data):
             product_name = data.get('name', 'Unknown')
             config = data.get('config', {})
 
@@ -186,27 +514,33 @@ class ComparativeAnalyzer:
 
             lines.append(f"\n## {product_name}")
 
-            # 실제 지표 수집
-            actual_metrics = self._extract_actual_metrics(data)
-
             # 목표 대비 달성률
             if goals:
                 lines.append("\n### 🎯 목표 대비 달성률")
-                achievement = self._calculate_goal_achievement(actual_metrics, goals)
-                for metric, info in achievement.items():
-                    flag = info['flag']
-                    lines.append(f"  {flag} {info['label']}: {info['actual']} / {info['target']} ({info['achievement_rate']:.1f}%)")
+                for key, goal_key, metric, label, value_format in GOAL_SPECS:
+                    rate = rates[key].iat[position]
+                    if pd.isna(rate):
+                        continue
+                    actual = format_goal_actual(value_format, metrics[metric].iat[position])
+                    target = value_format.format(goals[goal_key])
+                    lines.append(f"  {rate_flags[key].iat[position]} {label}: {actual} / {target} ({rate:.1f}%)")
 
             # 임계값 기반 플래그
             if thresholds:
                 lines.append("\n### 🚦 지표 상태 플래그")
-                flags = self._calculate_threshold_flags(actual_metrics, thresholds)
-                for metric, info in flags.items():
-                    lines.append(f"  {info['flag']} {info['label']}: {info['value']} - {info['status']}")
-
-            # Health Score 계산
+                for metric in thresholds:
+                    level = levels[metric].iat[position]
+                    if pd.isna(level):
+                        continue
+                    level = int(level)
+                    value = format_threshold_value(metric, metrics[metric].iat[position])
+                    lines.append(
+                        f"  {LEVEL_FLAGS[level]} {THRESHOLD_LABELS.get(metric, metric)}: {value} - {LEVEL_STATUS[level]}"
+                    )
+
+            # Health Score
             if health_weights:
-                health_score = self._calculate_health_score(actual_metrics, thresholds, health_weights)
+                health_score = scores.iat[position]
                 lines.append(f"\n### 💯 Health Score: {health_score:.1f}/100")
 
                 if health_score >= 70:
@@ -218,269 +552,124 @@ class ComparativeAnalyzer:
 
         return "\n".join(lines)
 
-    def _extract_actual_metrics(self, data: Dict) -> Dict:
-        """실제 수집된 데이터에서 지표 추출"""
-        metrics = {}
-
-        # GSC 데이터
-        gsc_data = data.get('gsc')
-        if gsc_data and gsc_data.get('top_queries') is not None:
-            top_queries = gsc_data['top_queries']
-            if not top_queries.empty:
-                metrics['gsc_clicks'] = int(top_queries['clicks'].sum())
-                metrics['gsc_impressions'] = int(top_queries['impressions'].sum())
-                metrics['ctr_percent'] = (metrics['gsc_clicks'] / metrics['gsc_impressions'] * 100) if metrics['gsc_impressions'] > 0 else 0
-                metrics['avg_position'] = float(top_queries['position'].mean())
-
-        # GA4 데이터
-        ga4_data = data.get('ga4')
-        if ga4_data:
-            pages = ga4_data.get('pages')
-            if pages is not None and not pages.empty:
-                metrics['sessions'] = int(pages['sessions'].sum())
-                metrics['engagement_rate'] = float(pages['engagement_rate'].mean()) if 'engagement_rate' in pages.columns else 0
-
-        # AdSense 데이터
-        adsense_data = data.get('adsense')
-        if adsense_data:
-            metrics['revenue'] = adsense_data.get('revenue', 0)
-            metrics['adsense_rpm'] = adsense_data.get('rpm', 0)
-
-        return metrics
-
-    def _calculate_goal_achievement(self, actual: Dict, goals: Dict) -> Dict:
-        """목표 대비 달성률 계산"""
-        achievement = {}
-
-        # 세션
-        if 'sessions' in actual and 'weekly_sessions' in goals:
-            rate = (actual['sessions'] / goals['weekly_sessions'] * 100) if goals['weekly_sessions'] > 0 else 0
-            flag = "🟢" if rate >= 100 else "🟡" if rate >= 50 else "🔴"
-            achievement['sessions'] = {
-                'label': '주간 세션',
-                'actual': f"{actual['sessions']:,}",
-                'target': f"{goals['weekly_sessions']:,}",
-                'achievement_rate': rate,
-                'flag': flag
-            }
+    def _analyze_deltas(self, products_data: List[Dict], metrics: Optional[pd.DataFrame] = None) -> str:
+        """
+        저장된 이전 기간 스냅샷 대비 지표 변화량 표 생성
 
-        # GSC 클릭
-        if 'gsc_clicks' in actual and 'weekly_gsc_clicks' in goals:
-            rate = (actual['gsc_clicks'] / goals['weekly_gsc_clicks'] * 100) if goals['weekly_gsc_clicks'] > 0 else 0
-            flag = "🟢" if rate >= 100 else "🟡" if rate >= 50 else "🔴"
-            achievement['gsc_clicks'] = {
-                'label': '주간 GSC 클릭',
-                'actual': f"{actual['gsc_clicks']:,}",
-                'target': f"{goals['weekly_gsc_clicks']:,}",
-                'achievement_rate': rate,
-                'flag': flag
-            }
+        Args:
+            products_data: 프로덕트 데이터 리스트
+            metrics: build_metrics_frame() 결과 (없으면 여기서 계산)
 
-        # CTR
-        if 'ctr_percent' in actual and 'target_ctr_percent' in goals:
-            rate = (actual['ctr_percent'] / goals['target_ctr_percent'] * 100) if goals['target_ctr_percent'] > 0 else 0
-            flag = "🟢" if rate >= 100 else "🟡" if rate >= 50 else "🔴"
-            achievement['ctr'] = {
-                'label': 'CTR',
-                'actual': f"{actual['ctr_percent']:.2f}%",
-                'target': f"{goals['target_ctr_percent']:.2f}%",
-                'achievement_rate': rate,
-                'flag': flag
-            }
+        Returns:
+            프로덕트별 변화량 표 문자열 (저장소가 없거나 이전 스냅샷이 없으면 빈 문자열)
+        """
+        if self.delta_engine is None:
+            return ""
+        if metrics is None:
+            metrics = build_metrics_frame(products_data)
 
-        # 참여율
-        if 'engagement_rate' in actual and 'target_engagement_rate' in goals:
-            rate = (actual['engagement_rate'] / goals['target_engagement_rate'] * 100) if goals['target_engagement_rate'] > 0 else 0
-            flag = "🟢" if rate >= 100 else "🟡" if rate >= 50 else "🔴"
-            achievement['engagement'] = {
-                'label': '참여율',
-                'actual': f"{actual['engagement_rate']:.1f}%",
-                'target': f"{goals['target_engagement_rate']:.1f}%",
-                'achievement_rate': rate,
-                'flag': flag
-            }
+        lines = []
+        for position, data in enumerate(products_data):
+            deltas = self.delta_engine.compute(
+                data.get('id', ''),
+                metric_row(metrics, position),
+                window_days=data.get('config', {}).get('analysis_days', 7),
+                as_of=data.get('snapshot_date')
+            )
+            table = format_delta_table(deltas)
+            if table:
+                lines.append(f"\n## {data.get('name', 'Unknown')}")
+                lines.extend(table)
 
-        # 수익 (AdSense가 있는 경우)
-        if 'revenue' in actual and 'weekly_revenue_usd' in goals:
-            rate = (actual['revenue'] / goals['weekly_revenue_usd'] * 100) if goals['weekly_revenue_usd'] > 0 else 0
-            flag = "🟢" if rate >= 100 else "🟡" if rate >= 50 else "🔴"
-            achievement['revenue'] = {
-                'label': '주간 수익',
-                'actual': f"${actual['revenue']:.2f}",
-                'target': f"${goals['weekly_revenue_usd']:.2f}",
-                'achievement_rate': rate,
-                'flag': flag
-            }
+        return "\n".join(lines)
 
-        return achievement
+    def _product_contexts(self, products_data: List[Dict]) -> str:
+        """프로덕트별 환경 정보 (프레임워크, 수정할 파일 경로 예시) 목록"""
+        product_contexts = []
+        for data in products_data:
+            name = data.get('name', 'Unknown')
+            id = data.get('id', 'Unknown')
+            framework = data.get('config', {}).get('framework', 'unknown')
 
-    def _calculate_threshold_flags(self, actual: Dict, thresholds: Dict) -> Dict:
-        """임계값 기반 플래그 계산"""
-        flags = {}
+            path_hint = "src/app/layout.tsx" if framework == "nextjs" else "pages/Home.tsx (or layouts/MainLayout.tsx)"
+            product_contexts.append(f"- {name} ({id}): Framework={framework}, Best path example={path_hint}")
 
-        for metric, threshold in thresholds.items():
-            if metric not in actual:
-                continue
+        return "\n".join(product_contexts)
 
-            value = actual[metric]
-            critical = threshold.get('critical', 0)
-            warning = threshold.get('warning', 0)
+    def _build_reduce_prompt(self, product_reports: str, products_data: List[Dict], structured: bool = False) -> str:
+        """
+        map_reduce 비교 단계 프롬프트 생성
 
-            # avg_position은 낮을수록 좋음 (역방향)
-            if metric == 'avg_position':
-                if value >= critical:
-                    flag = "🔴"
-                    status = "위험"
-                elif value >= warning:
-                    flag = "🟡"
-                    status = "주의"
-                else:
-                    flag = "🟢"
-                    status = "양호"
-            else:
-                # 나머지는 높을수록 좋음
-                if value < critical:
-                    flag = "🔴"
-                    status = "위험"
-                elif value < warning:
-                    flag = "🟡"
-                    status = "주의"
-                else:
-                    flag = "🟢"
-                    status = "양호"
-
-            # 라벨 매핑
-            labels = {
-                'gsc_clicks': 'GSC 클릭',
-                'ctr_percent': 'CTR',
-                'engagement_rate': '참여율',
-                'adsense_rpm': 'AdSense RPM',
-                'avg_position': '평균 순위',
-                'sessions': 'GA4 세션'
-            }
+        개별 분석에 지표와 변화량이 이미 들어 있으므로 지표 분석/변화량 섹션 없이
+        리포트 형식만 짧게 안내합니다. 액션 형식(파일 경로, JSON 블록 또는 JSON 모드 안내)은 단일 분석과 같습니다.
+        """
+        actions_section = "" if structured else MACHINE_READABLE_ACTIONS_SECTION
 
-            # 값 포맷팅
-            if metric in ['ctr_percent', 'engagement_rate']:
-                value_str = f"{value:.2f}%"
-            elif metric == 'adsense_rpm':
-                value_str = f"${value:.2f}"
-            elif metric == 'avg_position':
-                value_str = f"{value:.1f}위"
-            else:
-                value_str = f"{int(value):,}"
-
-            flags[metric] = {
-                'flag': flag,
-                'label': labels.get(metric, metric),
-                'value': value_str,
-                'status': status
-            }
+        prompt = f"""
+당신은 글로벌 웹 프로덕트를 운영하는 마케팅 팀의 데이터 분석가이자 시니어 개발자입니다.
+아래 프로덕트별 개별 분석을 비교해 **실행 가능한 비교 분석 리포트**를 작성하세요.
+개별 분석에 없는 수치는 추측하지 마세요.
+
+프로덕트 환경 정보:
+{self._product_contexts(products_data)}
+
+# 프로덕트별 개별 분석 결과
+{product_reports}
+
+# 리포트 형식
+- 액션에는 반드시 Framework에 맞는 실제 파일 경로를 백틱으로 포함하고, 🔴 High Priority는 프로덕트별 1-2개씩 작성하세요.
+- 메타 태그 문구(value)는 실제 검색어를 반영한 **영문**이어야 합니다.
 
-        return flags
-
-    def _calculate_health_score(self, actual: Dict, thresholds: Dict, weights: Dict) -> float:
-        """가중치 기반 Health Score 계산 (0-100)"""
-        score = 0.0
-        total_weight = 0.0
-
-        # Traffic Score (GSC 클릭 + GA4 세션)
-        if 'traffic' in weights:
-            weight = weights['traffic']
-            traffic_score = 0.0
-
-            if 'gsc_clicks' in actual and 'gsc_clicks' in thresholds:
-                clicks = actual['gsc_clicks']
-                if clicks >= thresholds['gsc_clicks'].get('warning', 0):
-                    traffic_score += 50
-                elif clicks >= thresholds['gsc_clicks'].get('critical', 0):
-                    traffic_score += 25
-
-            if 'sessions' in actual and 'sessions' in thresholds:
-                sessions = actual['sessions']
-                if sessions >= thresholds['sessions'].get('warning', 0):
-                    traffic_score += 50
-                elif sessions >= thresholds['sessions'].get('critical', 0):
-                    traffic_score += 25
-
-            score += (traffic_score / 100) * weight
-            total_weight += weight
-
-        # Engagement Score
-        if 'engagement' in weights and 'engagement_rate' in actual and 'engagement_rate' in thresholds:
-            weight = weights['engagement']
-            engagement = actual['engagement_rate']
-
-            if engagement >= thresholds['engagement_rate'].get('warning', 0):
-                engagement_score = 100
-            elif engagement >= thresholds['engagement_rate'].get('critical', 0):
-                engagement_score = 50
-            else:
-                engagement_score = 20
-
-            score += (engagement_score / 100) * weight
-            total_weight += weight
-
-        # SEO Score (CTR + 평균 순위)
-        if 'seo' in weights:
-            weight = weights['seo']
-            seo_score = 0.0
-
-            if 'ctr_percent' in actual and 'ctr_percent' in thresholds:
-                ctr = actual['ctr_percent']
-                if ctr >= thresholds['ctr_percent'].get('warning', 0):
-                    seo_score += 50
-                elif ctr >= thresholds['ctr_percent'].get('critical', 0):
-                    seo_score += 25
-
-            if 'avg_position' in actual and 'avg_position' in thresholds:
-                pos = actual['avg_position']
-                # 순위는 낮을수록 좋음
-                if pos <= thresholds['avg_position'].get('warning', 0):
-                    seo_score += 50
-                elif pos <= thresholds['avg_position'].get('critical', 0):
-                    seo_score += 25
-
-            score += (seo_score / 100) * weight
-            total_weight += weight
-
-        # Revenue Score
-        if 'revenue' in weights and 'adsense_rpm' in actual and 'adsense_rpm' in thresholds:
-            weight = weights['revenue']
-            rpm = actual['adsense_rpm']
-
-            if rpm >= thresholds['adsense_rpm'].get('warning', 0):
-                revenue_score = 100
-            elif rpm >= thresholds['adsense_rpm'].get('critical', 0):
-                revenue_score = 50
-            else:
-                revenue_score = 0
-
-            score += (revenue_score / 100) * weight
-            total_weight += weight
-
-        # 정규화
-        if total_weight > 0:
-            return (score / total_weight) * 100
-        return 0.0
-
-    def _build_analysis_prompt(self, summary: str, products_data: List[Dict], metrics_analysis: str) -> str:
+# Multi-Product Analysis Report
+
+## 📊 Executive Summary (핵심 요약)
+## 🏆 Product Performance Comparison (프로덕트 성과 비교)
+| 프로덕트 | Health Score | 위험/주의 지표 | 우선순위 |
+## 🎯 Resource Allocation Recommendations (리소스 배분 추천)
+## ✅ This Week's Action Plan (이번 주 실행 계획)
+
+### 🔴 High Priority (긴급 - 즉시 실행)
+1. **[프로덕트명]** 액션내용 - File: `파일경로`
+   - 예상 효과: 구체적인 기대 효과
+
+{actions_section}
+### 🟡 Medium Priority (중요 - 다음 주)
+### 🟢 Low Priority (건의 - 장기)
+"""
+        if structured:
+            prompt += STRUCTURED_OUTPUT_INSTRUCTIONS
+        return prompt
+
+    def _build_analysis_prompt(
+        self,
+        summary: str,
+        products_data: List[Dict],
+        metrics_analysis: str,
+        delta_analysis: str = "",
+        structured: bool = False
+    ) -> str:
         """
         Gemini에게 보낼 분석 프롬프트 생성
+
+        structured=True(JSON 모드)이면 리포트 안 액션 JSON 블록 안내를 빼고 응답 형식 안내를 붙입니다.
         """
         product_names = [data.get('name', 'Unknown') for data in products_data]
         product_list = ", ".join(product_names)
         
         # 프레임워크 정보 포함한 상세 설명 생성
-        product_contexts = []
-        for data in products_data:
-            name = data.get('name', 'Unknown')
-            id = data.get('id', 'Unknown')
-            framework = data.get('config', {}).get('framework', 'unknown')
-            
-            path_hint = "src/app/layout.tsx" if framework == "nextjs" else "pages/Home.tsx (or layouts/MainLayout.tsx)"
-            product_contexts.append(f"- {name} ({id}): Framework={framework}, Best path example={path_hint}")
-        
-        context_str = "\n".join(product_contexts)
+        context_str = self._product_contexts(products_data)
+
+        # 이전 기간 대비 변화량 (저장된 이력이 있을 때만)
+        delta_section = ""
+        if delta_analysis:
+            delta_section = f"""
+# 이전 기간 대비 변화 (저장된 이력 기반, 실제 값)
+아래 표는 저장된 이전 기간 스냅샷으로 계산한 실제 변화량입니다. 추세(상승/하락)는 추측하지 말고 이 표를 근거로 서술하세요.
+{delta_analysis}
+"""
+
+        # JSON 모드에서는 액션을 응답의 actions 필드로 받으므로 리포트 안 JSON 블록 안내 대신 응답 형식 안내를 붙임
+        actions_section = "" if structured else MACHINE_READABLE_ACTIONS_SECTION
 
         prompt = f"""
 당신은 글로벌 웹 프로덕트를 운영하는 마케팅 팀의 데이터 분석가이자 시니어 개발자입니다.
@@ -493,7 +682,7 @@ class ComparativeAnalyzer:
 
 # 지표 기반 자동 분석
 {metrics_analysis}
-
+{delta_section}
 # 요청사항
 위 데이터와 **지표 기반 자동 분석**을 바탕으로 **실행 가능한 비교 분석 리포트**를 작성해주세요.
 
@@ -543,30 +732,7 @@ class ComparativeAnalyzer:
 
 ---
 
-## 🤖 Machine-Readable Actions (DO NOT MODIFY)
-아래는 자동화를 위한 데이터입니다. 반드시 정확한 JSON 형식을 유지하세요.
-- **new_value**: 전 세계 여러 국가의 사용자를 고려하여 반드시 범용적이고 이해하기 쉬운 **영문(English)**으로 작성해야 하며, 15자 이상의 구체적이고 매력적인 SEO 문구여야 합니다. (예: "Image Converter | Convert JPG to PNG Online for Free")
-- "white", "btn", "click" 같이 짧거나 의미 없는 단어는 절대 금지입니다.
-
-```json
-[
-  {{
-    "product_id": "qr-generator",
-    "action_type": "update_meta_title",
-    "target_file": "src/app/layout.tsx",
-    "parameters": {{"new_title": "Free Online QR Code Generator | Fast & Easy", "new_value": "Free Online QR Code Generator | Fast & Easy"}},
-    "description": "메인 페이지 메타 타이틀 최적화"
-  }},
-  {{
-    "product_id": "convert-image",
-    "action_type": "update_meta_title",
-    "target_file": "pages/Home.tsx",
-    "parameters": {{"new_title": "Image Converter | Compress & Convert JPG PNG Free", "new_value": "Image Converter | Compress & Convert JPG PNG Free"}},
-    "description": "랜딩 페이지 SEO 타이틀 강화"
-  }}
-]
-```
-
+{actions_section}
 ### 🟡 Medium Priority (중요 - 다음 주)
 1. [액션 내용] - 담당: [프로덕트]
 
@@ -579,21 +745,66 @@ class ComparativeAnalyzer:
 1. **파일 경로(`path/to/file`)가 없는 액션은 파서가 무시합니다. 반드시 포함하세요.**
 2. 제안하는 메타 태그(Title, Description)는 실제 검색어 데이터를 기반으로 가장 효과적인 키워드를 포함해야 하며, 내용(value)은 반드시 **영문**이어야 합니다.
 """
+        if structured:
+            prompt += STRUCTURED_OUTPUT_INSTRUCTIONS
         return prompt
 
     def generate_individual_report(self, product_data: Dict) -> str:
         """
-        개별 프로덕트에 대한 상세 리포트 생성
-        (기존 claude_analyzer_v2와 유사하지만 단일 프로덕트 전용)
+        개별 프로덕트에 대한 간결한 분석 생성 (map_reduce 모드의 프로덕트별 단계)
+
+        해당 프로덕트의 수집 데이터 요약, 지표 분석, 변화량만으로 프롬프트를 만들고,
+        비교 단계 프롬프트에 그대로 들어갈 수 있도록 짧은 결과를 요청합니다.
 
         Args:
             product_data: 단일 프로덕트 데이터
 
         Returns:
-            개별 프로덕트 리포트
+            개별 프로덕트 분석 (마크다운)
+
+        Raises:
+            ValueError: Gemini가 빈 응답을 돌려준 경우
+        """
+        products = [product_data]
+        metrics = build_metrics_frame(products)
+        summary = self._build_summary(products, metrics)
+        metrics_analysis = self._analyze_metrics(products, metrics)
+        delta_analysis = self._analyze_deltas(products, metrics)
+
+        prompt = self._build_individual_prompt(product_data, summary, metrics_analysis, delta_analysis)
+        text = generate_text(self.client, self.model_id, prompt, cache=self.llm_cache)
+        if not text or not text.strip():
+            raise ValueError("Gemini 응답이 비어 있습니다")
+        return text
+
+    def _build_individual_prompt(
+        self,
+        product_data: Dict,
+        summary: str,
+        metrics_analysis: str,
+        delta_analysis: str = ""
+    ) -> str:
+        """
+        개별 프로덕트 분석 프롬프트 생성 (비교 단계의 입력으로 쓸 짧은 결과 요청)
         """
-        # 기존 claude_analyzer_v2의 로직을 재사용하거나
-        # 여기서 간단한 버전을 구현
-        product_name = product_data.get('name', 'Unknown Product')
+        name = product_data.get('name', 'Unknown')
+        framework = product_data.get('config', {}).get('framework', 'unknown')
+        delta_section = f"\n# 이전 기간 대비 변화 (실제 값)\n{delta_analysis}\n" if delta_analysis else ""
+
+        return f"""
+당신은 글로벌 웹 프로덕트를 운영하는 마케팅 팀의 데이터 분석가입니다.
+아래는 프로덕트 **{name}** (Framework={framework}) 한 개의 데이터입니다.
+이 결과는 여러 프로덕트를 비교하는 다음 단계의 입력으로 쓰이므로 **15줄 이내로 간결하게** 작성하세요.
+
+# 수집된 데이터
+{summary}
 
-        return f"# {product_name} Detailed Report\n\n(상세 분석 내용)"
+# 지표 기반 자동 분석
+{metrics_analysis}
+{delta_section}
+# 출력 형식 (마크다운 목록만, 제목 없이, 아래 순서 그대로 - 토큰 예산을 넘으면 뒤에서부터 잘림)
+- 현재 상태: Health Score와 🔴 위험 / 🟡 주의 지표
+- 개선 제안: 1-3개, 각각 수정할 파일 경로를 백틱으로 포함
+- 핵심 기회: 검색어, 페이지 등 데이터 근거 2-3개
+- 추세: 변화량 표가 있을 때만, 표의 실제 값을 근거로
+"""
@@ -0,0 +1,207 @@
+"""
+Delta Engine
+
+로컬 지표 저장소(MetricsStore)에 쌓인 이전 스냅샷으로 이번 기간 지표의 변화량을 계산합니다.
+이전 N개 기간의 지표를 한 번에 불러와 모든 지표의 절대/퍼센트 변화량을
+행렬 연산 한 번으로 구하므로, 과거 기간을 API로 다시 수집할 필요가 없습니다.
+
+기간 정의:
+    기준일(이번 스냅샷 날짜)에서 analysis_days씩 거슬러 올라간 날짜마다
+    그 날짜 이전의 가장 가까운 스냅샷(반 기간 이내)을 해당 기간 값으로 사용합니다.
+"""
+
+import warnings
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..storage.metrics_store import MetricsStore
+
+
+# metrics_frame.build_metrics_frame()의 지표 열과 같은 이름
+METRIC_LABELS = {
+    'gsc_clicks': 'GSC 클릭',
+    'gsc_impressions': 'GSC 노출',
+    'ctr_percent': 'CTR',
+    'avg_position': '평균 순위',
+    'sessions': 'GA4 세션',
+    'engagement_rate': '참여율',
+    'revenue': '수익',
+    'adsense_rpm': 'AdSense RPM'
+}
+
+
+class DeltaEngine:
+    """이전 기간 대비 지표 변화량 계산기"""
+
+    def __init__(self, store: MetricsStore, windows: int = 4):
+        """
+        Args:
+            store: 이전 스냅샷을 읽을 로컬 저장소
+            windows: 비교할 이전 기간 수
+        """
+        self.store = store
+        self.windows = windows
+
+    def metric_history(self, product_id: str) -> pd.DataFrame:
+        """
+        저장된 모든 스냅샷의 지표 (행: 스냅샷 날짜, 열: 지표)
+
+        스냅샷마다 반복하지 않고 데이터셋별 이력을 한 번에 읽어 groupby로 집계합니다.
+        지표 정의는 metrics_frame.build_metrics_frame()과 같습니다.
+        """
+        parts = []
+
+        queries = self.store.history(product_id, 'gsc_top_queries')
+        if not queries.empty:
+            gsc = queries.groupby('snapshot_date').agg(
+                gsc_clicks=('clicks', 'sum'),
+                gsc_impressions=('impressions', 'sum'),
+                avg_position=('position', 'mean')
+            )
+            impressions = gsc['gsc_impressions'].where(gsc['gsc_impressions'] > 0)
+            gsc['ctr_percent'] = (gsc['gsc_clicks'] / impressions * 100).fillna(0.0)
+            parts.append(gsc)
+
+        pages = self.store.history(product_id, 'ga4_pages')
+        if not pages.empty:
+            aggregations = {'sessions': ('sessions', 'sum')}
+            if 'engagement_rate' in pages.columns:
+                aggregations['engagement_rate'] = ('engagement_rate', 'mean')
+            parts.append(pages.groupby('snapshot_date').agg(**aggregations))
+
+        adsense = self.store.history(product_id, 'adsense')
+        if not adsense.empty:
+            parts.append(
+                adsense.groupby('snapshot_date')[['revenue', 'rpm']].last()
+                .rename(columns={'rpm': 'adsense_rpm'})
+            )
+
+        if not parts:
+            return pd.DataFrame(columns=list(METRIC_LABELS))
+
+        history = pd.concat(parts, axis=1).astype(float)
+        history.index = pd.to_datetime(history.index)
+        return history.sort_index().reindex(columns=list(METRIC_LABELS))
+
+    def compute(
+        self,
+        product_id: str,
+        current: Dict[str, float],
+        window_days: int = 7,
+        as_of: Optional[Union[str, date, datetime]] = None
+    ) -> pd.DataFrame:
+        """
+        이번 기간 지표와 이전 N개 기간의 변화량
+
+        Args:
+            product_id: 프로덕트 식별자
+            current: 이번 기간 지표 (metrics_frame.metric_row() 결과)
+            window_days: 한 기간의 일수 (analysis_days)
+            as_of: 이번 스냅샷 날짜 (기본: 오늘)
+
+        Returns:
+            행: 지표, 열:
+                current, prev_1..prev_N (k기간 전 값),
+                delta_1..delta_N (절대 변화량), pct_1..pct_N (퍼센트 변화량),
+                baseline (이전 기간 평균), baseline_pct (평균 대비 퍼센트 변화량)
+            이전 스냅샷이 하나도 없으면 빈 DataFrame
+        """
+        metrics = [metric for metric in METRIC_LABELS if metric in current]
+        history = self.metric_history(product_id)
+        if not metrics or history.empty:
+            return pd.DataFrame()
+
+        as_of = pd.Timestamp(as_of if as_of is not None else date.today()).normalize()
+        targets = pd.DatetimeIndex([as_of - pd.Timedelta(days=window_days * k) for k in range(1, self.windows + 1)])
+        previous = history.reindex(
+            targets,
+            method='ffill',
+            tolerance=pd.Timedelta(days=window_days // 2)
+        )[metrics]
+        if previous.isna().all().all():
+            return pd.DataFrame()
+
+        # (지표 M개) x (기간 N개) 행렬로 한 번에 계산
+        now = np.array([float(current[metric]) for metric in metrics])[:, None]
+        before = previous.to_numpy(dtype=float).T
+        delta = now - before
+        with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+            # 이전 값이 하나도 없는 지표의 평균은 NaN (경고 없이)
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            pct = np.where(before != 0, delta / np.abs(before) * 100, np.nan)
+            baseline = np.nanmean(before, axis=1)
+            baseline_pct = np.where(baseline != 0, (now[:, 0] - baseline) / np.abs(baseline) * 100, np.nan)
+
+        columns = {'current': now[:, 0]}
+        for k in range(self.windows):
+            columns[f'prev_{k + 1}'] = before[:, k]
+        for k in range(self.windows):
+            columns[f'delta_{k + 1}'] = delta[:, k]
+        for k in range(self.windows):
+            columns[f'pct_{k + 1}'] = pct[:, k]
+        columns['baseline'] = baseline
+        columns['baseline_pct'] = baseline_pct
+
+        return pd.DataFrame(columns, index=pd.Index(metrics, name='metric'))
+
+
+def _format_value(metric: str, value: float) -> str:
+    if pd.isna(value):
+        return '-'
+    if metric in ('ctr_percent', 'engagement_rate'):
+        return f"{value:.2f}%"
+    if metric in ('revenue', 'adsense_rpm'):
+        return f"${value:.2f}"
+    if metric == 'avg_position':
+        return f"{value:.1f}"
+    return f"{value:,.0f}"
+
+
+def _format_delta(metric: str, value: float) -> str:
+    if pd.isna(value):
+        return '-'
+    sign = '+' if value > 0 else ''
+    if metric in ('ctr_percent', 'engagement_rate'):
+        return f"{sign}{value:.2f}%p"
+    if metric in ('revenue', 'adsense_rpm'):
+        return f"{sign}${value:.2f}"
+    if metric == 'avg_position':
+        return f"{sign}{value:.1f}"
+    return f"{sign}{value:,.0f}"
+
+
+def _format_pct(value: float) -> str:
+    if pd.isna(value):
+        return '-'
+    return f"{value:+.1f}%"
+
+
+def format_delta_table(deltas: pd.DataFrame) -> List[str]:
+    """
+    프롬프트용 간결한 마크다운 변화량 표
+
+    Args:
+        deltas: DeltaEngine.compute() 결과
+
+    Returns:
+        표의 각 줄 (변화량이 없으면 빈 리스트)
+    """
+    if deltas.empty:
+        return []
+
+    windows = len([column for column in deltas.columns if column.startswith('prev_')])
+    lines = [
+        f"| 지표 | 현재 | 직전 기간 | Δ | Δ% | 이전 {windows}기간 평균 | 평균 대비 Δ% |",
+        "|------|------|----------|---|----|----------------|-------------|"
+    ]
+    for metric, row in deltas.iterrows():
+        lines.append(
+            f"| {METRIC_LABELS[metric]} | {_format_value(metric, row['current'])} "
+            f"| {_format_value(metric, row['prev_1'])} | {_format_delta(metric, row['delta_1'])} "
+            f"| {_format_pct(row['pct_1'])} | {_format_value(metric, row['baseline'])} "
+            f"| {_format_pct(row['baseline_pct'])} |"
+        )
+    return lines
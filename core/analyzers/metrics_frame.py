@@ -0,0 +1,292 @@
+"""
+Metrics Frame
+
+프로덕트별 지표를 (행: 프로덕트, 열: 지표) DataFrame 하나로 모으고,
+products.yaml의 goals / thresholds / health_score_weights도 같은 행에 맞춘 프레임으로 펼쳐
+목표 달성률, 임계값 플래그, Health Score를 모든 프로덕트에 대해 NumPy 연산 몇 번으로 계산합니다.
+
+없는 값(수집되지 않은 소스, 설정하지 않은 목표/임계값/가중치)은 NaN으로 두며,
+NaN인 칸은 기존 프로덕트별 계산에서 해당 분기를 건너뛰던 것과 같게 취급합니다.
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .delta_engine import METRIC_LABELS
+
+
+# 지표 프레임의 열 (DeltaEngine과 같은 지표 이름)
+METRIC_COLUMNS = list(METRIC_LABELS)
+
+# 목표 달성률: (결과 키, goals 키, 지표, 라벨, 값 포맷)
+GOAL_SPECS: List[Tuple[str, str, str, str, str]] = [
+    ('sessions', 'weekly_sessions', 'sessions', '주간 세션', '{:,}'),
+    ('gsc_clicks', 'weekly_gsc_clicks', 'gsc_clicks', '주간 GSC 클릭', '{:,}'),
+    ('ctr', 'target_ctr_percent', 'ctr_percent', 'CTR', '{:.2f}%'),
+    ('engagement', 'target_engagement_rate', 'engagement_rate', '참여율', '{:.1f}%'),
+    ('revenue', 'weekly_revenue_usd', 'revenue', '주간 수익', '${:.2f}'),
+]
+
+# 임계값 플래그 라벨 (없는 지표는 지표 이름 그대로 표시)
+THRESHOLD_LABELS = {
+    'gsc_clicks': 'GSC 클릭',
+    'ctr_percent': 'CTR',
+    'engagement_rate': '참여율',
+    'adsense_rpm': 'AdSense RPM',
+    'avg_position': '평균 순위',
+    'sessions': 'GA4 세션'
+}
+
+# 낮을수록 좋은 지표
+LOWER_IS_BETTER = frozenset({'avg_position'})
+
+# 임계값 단계: 0 = 양호, 1 = 주의, 2 = 위험
+LEVEL_FLAGS = ['🟢', '🟡', '🔴']
+LEVEL_STATUS = ['양호', '주의', '위험']
+
+HEALTH_COMPONENTS = ['traffic', 'engagement', 'seo', 'revenue']
+
+
+def product_metrics(data: Dict) -> Dict:
+    """한 프로덕트의 수집 데이터에서 지표 추출 (소스가 없으면 해당 지표 없음)"""
+    metrics = {}
+
+    # GSC 데이터
+    gsc_data = data.get('gsc')
+    if gsc_data and gsc_data.get('top_queries') is not None:
+        top_queries = gsc_data['top_queries']
+        if not top_queries.empty:
+            metrics['gsc_clicks'] = int(top_queries['clicks'].sum())
+            metrics['gsc_impressions'] = int(top_queries['impressions'].sum())
+            metrics['ctr_percent'] = (metrics['gsc_clicks'] / metrics['gsc_impressions'] * 100) if metrics['gsc_impressions'] > 0 else 0
+            metrics['avg_position'] = float(top_queries['position'].mean())
+
+    # GA4 데이터
+    ga4_data = data.get('ga4')
+    if ga4_data:
+        pages = ga4_data.get('pages')
+        if pages is not None and not pages.empty:
+            metrics['sessions'] = int(pages['sessions'].sum())
+            metrics['engagement_rate'] = float(pages['engagement_rate'].mean()) if 'engagement_rate' in pages.columns else 0
+
+    # AdSense 데이터
+    adsense_data = data.get('adsense')
+    if adsense_data:
+        metrics['revenue'] = adsense_data.get('revenue', 0)
+        metrics['adsense_rpm'] = adsense_data.get('rpm', 0)
+
+    return metrics
+
+
+def _product_index(products_data: List[Dict]) -> pd.Index:
+    return pd.Index([data.get('id', '') for data in products_data], name='product_id')
+
+
+def build_metrics_frame(products_data: List[Dict]) -> pd.DataFrame:
+    """
+    프로덕트 x 지표 DataFrame
+
+    Args:
+        products_data: 프로덕트 데이터 리스트 (collect_product_data() 결과)
+
+    Returns:
+        행: 프로덕트 (products_data 순서, 인덱스는 프로덕트 id), 열: METRIC_COLUMNS (float, 없으면 NaN)
+    """
+    # summarize_product()로 줄인 데이터는 전체 데이터로 미리 계산한 'metrics'를 사용
+    records = [data['metrics'] if 'metrics' in data else product_metrics(data) for data in products_data]
+    frame = pd.DataFrame.from_records(records, columns=METRIC_COLUMNS) if records else pd.DataFrame(columns=METRIC_COLUMNS)
+    frame = frame.astype(float)
+    frame.index = _product_index(products_data)
+    return frame
+
+
+def metric_row(metrics: pd.DataFrame, position: int) -> Dict[str, float]:
+    """프레임의 한 행을 값이 있는 지표만 담은 딕셔너리로 변환 (DeltaEngine.compute() 입력)"""
+    return metrics.iloc[position].dropna().to_dict()
+
+
+def metric_config_frames(products_data: List[Dict]) -> Dict[str, pd.DataFrame]:
+    """
+    products.yaml 설정을 지표 프레임과 같은 행으로 펼친 프레임
+
+    Args:
+        products_data: 프로덕트 데이터 리스트 (각 항목의 'config' 사용)
+
+    Returns:
+        {
+            'goals': 행: 프로덕트, 열: goals 키,
+            'critical' / 'warning': 행: 프로덕트, 열: 임계값을 설정한 지표
+                (임계값은 있지만 단계 값이 빠지면 0, 임계값이 없으면 NaN),
+            'weights': 행: 프로덕트, 열: HEALTH_COMPONENTS
+        }
+    """
+    goals, critical, warning, weights = [], [], [], []
+    for data in products_data:
+        config = data.get('config') or {}
+        thresholds = config.get('thresholds') or {}
+        goals.append(config.get('goals') or {})
+        critical.append({metric: (t or {}).get('critical', 0) for metric, t in thresholds.items()})
+        warning.append({metric: (t or {}).get('warning', 0) for metric, t in thresholds.items()})
+        weights.append(config.get('health_score_weights') or {})
+
+    index = _product_index(products_data)
+
+    def _frame(records: List[Dict], columns=None) -> pd.DataFrame:
+        frame = pd.DataFrame.from_records(records, columns=columns) if records else pd.DataFrame(columns=columns)
+        frame = frame.apply(pd.to_numeric, errors='coerce').astype(float)
+        frame.index = index
+        return frame
+
+    return {
+        'goals': _frame(goals),
+        'critical': _frame(critical),
+        'warning': _frame(warning),
+        'weights': _frame(weights, columns=HEALTH_COMPONENTS)
+    }
+
+
+def _column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """열 값 배열 (열이 없으면 NaN 배열)"""
+    if name in frame.columns:
+        return frame[name].to_numpy(dtype=float)
+    return np.full(len(frame), np.nan)
+
+
+def goal_achievement(metrics: pd.DataFrame, goals: pd.DataFrame) -> pd.DataFrame:
+    """
+    목표 대비 달성률 (%)
+
+    Returns:
+        행: 프로덕트, 열: GOAL_SPECS의 결과 키.
+        지표나 목표가 없으면 NaN, 목표가 0 이하이면 0
+    """
+    rates = {}
+    for key, goal_key, metric, _, _ in GOAL_SPECS:
+        actual = _column(metrics, metric)
+        target = _column(goals, goal_key)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = np.where(target > 0, actual / target * 100, 0.0)
+        rates[key] = np.where(np.isnan(actual) | np.isnan(target), np.nan, rate)
+    return pd.DataFrame(rates, index=metrics.index)
+
+
+def achievement_flags(rates: pd.DataFrame) -> pd.DataFrame:
+    """달성률 플래그 (100% 이상 🟢, 50% 이상 🟡, 그 외 🔴, 달성률이 없으면 None)"""
+    values = rates.to_numpy(dtype=float)
+    flags = np.select([values >= 100, values >= 50], ['🟢', '🟡'], '🔴').astype(object)
+    flags[np.isnan(values)] = None
+    return pd.DataFrame(flags, index=rates.index, columns=rates.columns)
+
+
+def threshold_levels(metrics: pd.DataFrame, critical: pd.DataFrame, warning: pd.DataFrame) -> pd.DataFrame:
+    """
+    임계값 단계 (0 = 양호, 1 = 주의, 2 = 위험)
+
+    높을수록 좋은 지표는 critical 미만이면 위험, warning 미만이면 주의이고,
+    LOWER_IS_BETTER 지표는 critical 이상이면 위험, warning 이상이면 주의입니다.
+
+    Returns:
+        행: 프로덕트, 열: critical과 같은 지표. 지표나 임계값이 없으면 NaN
+    """
+    values = metrics.reindex(columns=critical.columns).to_numpy(dtype=float)
+    crit = critical.to_numpy(dtype=float)
+    warn = warning.to_numpy(dtype=float)
+    inverse = np.array([metric in LOWER_IS_BETTER for metric in critical.columns], dtype=bool)
+
+    critical_hit = np.where(inverse, values >= crit, values < crit)
+    warning_hit = np.where(inverse, values >= warn, values < warn)
+    levels = np.select([critical_hit, warning_hit], [2.0, 1.0], 0.0)
+    levels[np.isnan(values) | np.isnan(crit)] = np.nan
+    return pd.DataFrame(levels, index=metrics.index, columns=critical.columns)
+
+
+def _tier(values: np.ndarray, warn: np.ndarray, crit: np.ndarray, scores: Tuple[float, float, float],
+          lower_is_better: bool = False) -> np.ndarray:
+    """warning/critical 단계별 점수 (warning 충족, critical 충족, 미달) 배열"""
+    if lower_is_better:
+        tiers = [values <= warn, values <= crit]
+    else:
+        tiers = [values >= warn, values >= crit]
+    return np.select(tiers, scores[:2], scores[2])
+
+
+def health_scores(
+    metrics: pd.DataFrame,
+    critical: pd.DataFrame,
+    warning: pd.DataFrame,
+    weights: pd.DataFrame
+) -> pd.Series:
+    """
+    가중치 기반 Health Score (0-100)
+
+    - traffic: GSC 클릭, GA4 세션 각각 warning 이상 50점 / critical 이상 25점
+    - engagement: 참여율 warning 이상 100점 / critical 이상 50점 / 미달 20점
+    - seo: CTR(높을수록), 평균 순위(낮을수록) 각각 50점 / 25점
+    - revenue: AdSense RPM warning 이상 100점 / critical 이상 50점 / 미달 0점
+
+    traffic, seo는 가중치만 있으면 반영하고, engagement, revenue는 지표와 임계값도 있어야 반영합니다.
+    반영된 가중치 합으로 정규화하며, 반영된 항목이 없으면 0입니다.
+
+    Returns:
+        프로덕트별 점수 Series
+    """
+    def _inputs(metric: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        values = _column(metrics, metric)
+        crit = _column(critical, metric)
+        return values, _column(warning, metric), crit, ~np.isnan(values) & ~np.isnan(crit)
+
+    def _part(metric: str, scores: Tuple[float, float, float], lower_is_better: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        values, warn, crit, available = _inputs(metric)
+        return np.where(available, _tier(values, warn, crit, scores, lower_is_better), 0.0), available
+
+    components = []
+
+    # Traffic Score (GSC 클릭 + GA4 세션)
+    weight = _column(weights, 'traffic')
+    traffic = _part('gsc_clicks', (50, 25, 0))[0] + _part('sessions', (50, 25, 0))[0]
+    components.append((traffic, weight, ~np.isnan(weight)))
+
+    # Engagement Score
+    weight = _column(weights, 'engagement')
+    engagement, available = _part('engagement_rate', (100, 50, 20))
+    components.append((engagement, weight, ~np.isnan(weight) & available))
+
+    # SEO Score (CTR + 평균 순위)
+    weight = _column(weights, 'seo')
+    seo = _part('ctr_percent', (50, 25, 0))[0] + _part('avg_position', (50, 25, 0), lower_is_better=True)[0]
+    components.append((seo, weight, ~np.isnan(weight)))
+
+    # Revenue Score
+    weight = _column(weights, 'revenue')
+    revenue, available = _part('adsense_rpm', (100, 50, 0))
+    components.append((revenue, weight, ~np.isnan(weight) & available))
+
+    score = np.zeros(len(metrics))
+    total_weight = np.zeros(len(metrics))
+    for component, weight, applied in components:
+        score = score + np.where(applied, (component / 100) * weight, 0.0)
+        total_weight = total_weight + np.where(applied, weight, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = np.where(total_weight > 0, (score / total_weight) * 100, 0.0)
+    return pd.Series(normalized, index=metrics.index, name='health_score')
+
+
+def format_goal_actual(value_format: str, value: float) -> str:
+    """달성률에 표시할 실제 지표 값 (개수 지표는 정수로 표시)"""
+    if value_format == '{:,}':
+        value = int(value)
+    return value_format.format(value)
+
+
+def format_threshold_value(metric: str, value: float) -> str:
+    """임계값 플래그에 표시할 지표 값"""
+    if metric in ['ctr_percent', 'engagement_rate']:
+        return f"{value:.2f}%"
+    if metric == 'adsense_rpm':
+        return f"${value:.2f}"
+    if metric == 'avg_position':
+        return f"{value:.1f}위"
+    return f"{int(value):,}"
@@ -0,0 +1,223 @@
+"""
+Page Join
+
+GSC page(절대 URL)와 GA4 page_path(경로, 쿼리 문자열/끝 슬래시가 제각각)를
+같은 정규화 페이지 키로 맞춰, 검색 지표와 행동 지표를 한 행에 나란히 놓은 페이지별 프레임을 만듭니다.
+
+- 정규화: 스킴/호스트, 쿼리 문자열, 프래그먼트, 끝 슬래시를 제거하고 소문자로 통일
+  (고유 URL마다 한 번만 계산하고 행에는 코드로 펼침)
+- 조인 키: 정규화 키를 해시 테이블(pd.factorize)로 매긴 정수 페이지 번호
+  (문자열 merge 대신 페이지 번호별 np.bincount 집계로 양쪽 지표를 같은 행에 채움)
+- 같은 키로 모인 여러 URL은 다시 집계
+  (GSC: 합계 + 노출 가중 순위, GA4: 합계 + 세션 가중 비율)
+
+양쪽 10만 페이지(고유 URL 20만 개) 기준 수백 밀리초 안에 끝나며, 대부분이 고유 URL 정규화 시간입니다. (`python -m core.analyzers.page_join`로 벤치마크 실행)
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..collectors.response_decoder import compact_frame
+
+
+# 조인에 필요한 최소 컬럼 (없으면 해당 소스는 없는 것으로 취급)
+GSC_PAGE_COLUMNS = frozenset({'page', 'clicks', 'impressions', 'position'})
+GA4_PAGE_COLUMNS = frozenset({'page_path', 'sessions'})
+
+# GA4 페이지 지표: 합산 지표 / 세션 가중 평균 지표
+GA4_SUM_COLUMNS = ['sessions', 'pageviews']
+GA4_RATE_COLUMNS = ['engagement_rate', 'bounce_rate', 'avg_session_duration']
+
+# 검색 노출 대비 참여율이 낮은 페이지를 고를 때의 최소 노출 수
+MIN_GAP_IMPRESSIONS = 100
+
+# 스킴 + 호스트, 쿼리 문자열 / 프래그먼트 (앞뒤 슬래시는 strip으로 제거)
+# 한 정규식에 게으른 수량자로 합치면 문자열 엔진에서 몇 배 느려지므로 고정된 두 패턴으로 나눔
+_ORIGIN_PATTERN = r'^[a-z][a-z0-9+.-]*://[^/?#]*'
+_QUERY_PATTERN = r'[?#].*'
+
+
+def canonical_page_keys(pages: pd.Series) -> pd.Series:
+    """
+    URL / 경로를 정규화 페이지 키로 변환
+
+    예: 'https://convertkits.org/Tools/?utm_source=x#top' → '/tools'
+
+    Args:
+        pages: GSC page 또는 GA4 page_path 컬럼 (문자열 또는 categorical)
+
+    Returns:
+        같은 인덱스의 정규화 키 Series (값이 없는 행은 NaN)
+    """
+    codes, uniques = _factorize(pages)
+    keys = np.append(_normalize(uniques), np.nan)
+    return pd.Series(keys[codes], index=pages.index, dtype=object)
+
+
+def _factorize(pages: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """행별 코드와 고유 값 (categorical이면 카테고리를 그대로 사용, 값이 없으면 코드 -1)"""
+    if isinstance(pages.dtype, pd.CategoricalDtype):
+        return pages.cat.codes.to_numpy(), pages.cat.categories.to_numpy(dtype=object)
+    codes, uniques = pd.factorize(pages)
+    return codes, np.asarray(uniques, dtype=object)
+
+
+def _normalize(urls: np.ndarray) -> np.ndarray:
+    """고유 URL 배열을 정규화 키 배열로 변환"""
+    keys = pd.Series(urls, dtype=object).astype(str).str.lower()
+    keys = keys.str.replace(_ORIGIN_PATTERN, '', regex=True)
+    keys = keys.str.replace(_QUERY_PATTERN, '', regex=True)
+    return ('/' + keys.str.strip('/')).to_numpy(dtype=object)
+
+
+def _page_codes(gsc_pages: pd.Series, ga4_pages: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    두 소스의 행을 공통 페이지 번호로 변환
+
+    고유 URL만 정규화한 뒤 정규화 키를 해시 테이블(pd.factorize)로 번호 매기므로
+    문자열 비교는 고유 URL 수만큼만 일어납니다.
+
+    Returns:
+        (GSC 행별 페이지 번호, GA4 행별 페이지 번호, 페이지 번호 → 정규화 키), 값이 없는 행은 -1
+    """
+    gsc_codes, gsc_uniques = _factorize(gsc_pages)
+    ga4_codes, ga4_uniques = _factorize(ga4_pages)
+
+    unique_codes, page_keys = pd.factorize(_normalize(np.concatenate([gsc_uniques, ga4_uniques])))
+    gsc_map = np.append(unique_codes[:len(gsc_uniques)], -1)
+    ga4_map = np.append(unique_codes[len(gsc_uniques):], -1)
+    return gsc_map[gsc_codes], ga4_map[ga4_codes], np.asarray(page_keys, dtype=object)
+
+
+def _sum_by_page(codes: np.ndarray, values, pages: int) -> np.ndarray:
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=np.asarray(values, dtype=np.float64)[valid], minlength=pages)
+
+
+def join_page_metrics(gsc_pages: Optional[pd.DataFrame], ga4_pages: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    GSC 페이지 성과와 GA4 페이지 성과를 정규화 페이지 키로 조인
+
+    Args:
+        gsc_pages: page, clicks, impressions, position 컬럼 DataFrame (page_performance 또는 큐브 롤업)
+        ga4_pages: page_path, sessions 등 컬럼 DataFrame
+
+    Returns:
+        page_key + 검색 지표(clicks, impressions, ctr, position) + 행동 지표(sessions, engagement_rate 등) DataFrame.
+        한쪽에만 있는 페이지는 다른 쪽 지표가 NaN. 노출, 세션 내림차순. 어느 쪽도 없으면 빈 DataFrame
+    """
+    has_gsc = gsc_pages is not None and not gsc_pages.empty and GSC_PAGE_COLUMNS.issubset(gsc_pages.columns)
+    has_ga4 = ga4_pages is not None and not ga4_pages.empty and GA4_PAGE_COLUMNS.issubset(ga4_pages.columns)
+    if not has_gsc and not has_ga4:
+        return pd.DataFrame()
+
+    empty = pd.Series([], dtype=object)
+    gsc_codes, ga4_codes, page_keys = _page_codes(
+        gsc_pages['page'] if has_gsc else empty,
+        ga4_pages['page_path'] if has_ga4 else empty
+    )
+    pages = len(page_keys)
+    joined = {'page_key': pd.Categorical.from_codes(np.arange(pages), categories=page_keys)}
+
+    if has_gsc:
+        # Search Console 기간 집계와 같은 방식: 합계, ctr 재계산, 노출 가중 순위
+        found = np.bincount(gsc_codes[gsc_codes >= 0], minlength=pages) > 0
+        clicks = _sum_by_page(gsc_codes, gsc_pages['clicks'], pages)
+        impressions = _sum_by_page(gsc_codes, gsc_pages['impressions'], pages)
+        weighted = _sum_by_page(gsc_codes, gsc_pages['position'].to_numpy(np.float64) * gsc_pages['impressions'], pages)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ctr = np.where(impressions > 0, clicks / impressions, 0.0)
+            position = np.where(impressions > 0, weighted / impressions, 0.0)
+        for column, values in (('clicks', clicks), ('impressions', impressions), ('ctr', ctr), ('position', position)):
+            joined[column] = np.where(found, values, np.nan)
+
+    if has_ga4:
+        # 합산 지표는 합계, 비율 지표는 세션 가중 평균
+        found = np.bincount(ga4_codes[ga4_codes >= 0], minlength=pages) > 0
+        sessions = ga4_pages['sessions'].to_numpy(np.float64)
+        session_sum = _sum_by_page(ga4_codes, sessions, pages)
+        for column in GA4_SUM_COLUMNS:
+            if column in ga4_pages.columns:
+                joined[column] = np.where(found, _sum_by_page(ga4_codes, ga4_pages[column], pages), np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for column in GA4_RATE_COLUMNS:
+                if column in ga4_pages.columns:
+                    weighted = _sum_by_page(ga4_codes, ga4_pages[column].to_numpy(np.float64) * sessions, pages)
+                    joined[column] = np.where(found & (session_sum > 0), weighted / session_sum, np.nan)
+
+    df = pd.DataFrame(joined)
+    order = [column for column in ('impressions', 'sessions') if column in df.columns]
+    df = df.sort_values(order, ascending=False, kind='stable', na_position='last').reset_index(drop=True)
+    return compact_frame(df)
+
+
+def engagement_gaps(
+    joined: pd.DataFrame,
+    limit: int = 5,
+    min_impressions: int = MIN_GAP_IMPRESSIONS
+) -> pd.DataFrame:
+    """
+    검색 노출은 많지만 참여율이 평균(세션 가중)보다 낮은 페이지
+
+    Args:
+        joined: join_page_metrics() 결과
+        limit: 반환할 페이지 수
+        min_impressions: 최소 노출 수
+
+    Returns:
+        노출 내림차순 DataFrame (양쪽 지표가 모두 없으면 빈 DataFrame)
+    """
+    required = {'impressions', 'sessions', 'engagement_rate'}
+    if joined.empty or not required.issubset(joined.columns):
+        return pd.DataFrame()
+
+    matched = joined[joined['sessions'] > 0]
+    if matched.empty:
+        return pd.DataFrame()
+    average = np.average(matched['engagement_rate'], weights=matched['sessions'])
+
+    gaps = matched[(matched['impressions'] >= min_impressions) & (matched['engagement_rate'] < average)]
+    gaps = gaps.nlargest(limit, 'impressions').reset_index(drop=True)
+    gaps['page_key'] = gaps['page_key'].cat.remove_unused_categories()
+    return gaps
+
+
+def product_page_gaps(data: Dict, limit: int = 5) -> pd.DataFrame:
+    """
+    한 프로덕트의 수집 데이터에서 참여율이 낮은 검색 유입 페이지 추출
+
+    summarize_product()가 미리 계산해 둔 'page_gaps'가 있으면 그대로 사용합니다.
+    """
+    if 'page_gaps' in data:
+        return data['page_gaps']
+    gsc_pages = (data.get('gsc') or {}).get('page_performance')
+    ga4_pages = (data.get('ga4') or {}).get('pages')
+    return engagement_gaps(join_page_metrics(gsc_pages, ga4_pages), limit=limit)
+
+
+if __name__ == '__main__':
+    """벤치마크: 10만 페이지 조인"""
+    import time
+
+    n_pages = 100_000
+    rng = np.random.default_rng(0)
+    gsc = pd.DataFrame({
+        'page': pd.Categorical([f'https://example.com/tools/page-{i}/' for i in range(n_pages)]),
+        'clicks': rng.integers(0, 100, n_pages).astype('int32'),
+        'impressions': rng.integers(100, 5000, n_pages).astype('int32'),
+        'position': rng.uniform(1, 50, n_pages).astype('float32')
+    })
+    ga4 = pd.DataFrame({
+        'page_path': pd.Categorical([f'/Tools/page-{i}?ref={i % 3}' for i in range(n_pages)]),
+        'sessions': rng.integers(1, 500, n_pages).astype('int32'),
+        'engagement_rate': rng.uniform(0, 1, n_pages).astype('float32')
+    })
+
+    start = time.perf_counter()
+    joined = join_page_metrics(gsc, ga4)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(gsc):,} GSC 페이지 x {len(ga4):,} GA4 행 → {len(joined):,}개 페이지 ({elapsed * 1000:.1f} ms)")
+    print(engagement_gaps(joined))
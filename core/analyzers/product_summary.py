@@ -0,0 +1,87 @@
+"""
+Product Summary
+
+수집된 프로덕트 데이터를 비교 분석에 필요한 만큼만 남긴 작은 요약으로 줄입니다.
+프로세스 풀 워커가 전체 DataFrame 대신 이 요약만 돌려주므로 직렬화/전송 비용이 프로덕트 수에 비례해 작게 유지됩니다.
+
+- 지표 합계/평균(metrics)은 줄이기 전의 전체 데이터로 미리 계산
+- GSC x GA4 페이지 조인으로 찾은 참여율이 낮은 검색 유입 페이지(page_gaps)도 전체 데이터 기준
+- 소스별 내용 해시(content_hashes)도 전체 데이터 기준
+- 리포트 요약에 표시되는 상위 행만 남기고, 쓰지 않는 리포트(page_performance, cube, traffic, events)는 제외
+- 남긴 categorical 컬럼은 쓰지 않는 카테고리를 제거 (head()만으로는 전체 카테고리 목록이 그대로 남음)
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+
+from ..collectors.response_decoder import drop_unused_categories
+from ..storage.metrics_store import SOURCES, content_hash
+from .metrics_frame import product_metrics
+from .page_join import product_page_gaps
+
+
+# ComparativeAnalyzer._build_summary()가 표시하는 행 수
+SUMMARY_ROWS = {
+    ('gsc', 'top_queries'): 5,
+    ('gsc', 'opportunities'): 3,
+    ('gsc', 'position_opportunities'): 3,
+    ('gsc', 'country_performance'): 5,
+    ('ga4', 'pages'): 5,
+}
+
+# 요약에 그대로 남기는 작은 프레임 (행 수가 적음)
+KEPT_FRAMES = {('gsc', 'device_performance'), ('ga4', 'devices')}
+
+# 요약에 그대로 복사하는 메타 정보 (trends_keywords: 샤딩 실행에서 부모 프로세스가 Trends를 수집할 검색어)
+META_KEYS = ('id', 'name', 'config', 'snapshot_date', 'timings', 'timed_out', 'trends_keywords')
+
+
+def _head(df: Optional[pd.DataFrame], rows: Optional[int] = None) -> Optional[pd.DataFrame]:
+    if df is None:
+        return None
+    trimmed = df.head(rows).copy() if rows is not None else df.copy()
+    return drop_unused_categories(trimmed)
+
+
+def summarize_product(data: Dict) -> Dict:
+    """
+    프로덕트 데이터를 비교 분석용 요약으로 축소
+
+    Args:
+        data: collect_product_data() 또는 MetricsStore.load_product_snapshot() 결과
+
+    Returns:
+        같은 키 구조의 딕셔너리 (ComparativeAnalyzer에 그대로 전달 가능).
+        추가로 'metrics'(전체 데이터 기준 지표), 'page_gaps'(참여율이 낮은 검색 유입 페이지),
+        'row_counts'(원래 행 수)를 담음
+    """
+    summary = {key: data[key] for key in META_KEYS if key in data}
+    summary['metrics'] = data['metrics'] if 'metrics' in data else product_metrics(data)
+    summary['page_gaps'] = product_page_gaps(data)
+    summary['content_hashes'] = data.get('content_hashes') or {
+        source: content_hash(data.get(source)) for source in SOURCES
+    }
+
+    row_counts = {}
+    for source in ('gsc', 'ga4'):
+        frames = data.get(source)
+        if not frames:
+            summary[source] = frames
+            continue
+        compact = {}
+        for name, df in frames.items():
+            if df is not None:
+                row_counts[f"{source}_{name}"] = len(df)
+            if (source, name) in SUMMARY_ROWS:
+                compact[name] = _head(df, SUMMARY_ROWS[(source, name)])
+            elif (source, name) in KEPT_FRAMES:
+                compact[name] = _head(df)
+        summary[source] = compact
+    # 이미 요약된 데이터를 다시 요약해도 원래 행 수를 유지
+    summary['row_counts'] = {**row_counts, **data.get('row_counts', {})}
+
+    # Trends는 키워드 수만큼의 작은 표, AdSense는 스칼라 딕셔너리
+    summary['trends'] = data.get('trends')
+    summary['adsense'] = data.get('adsense')
+    return summary
@@ -0,0 +1,157 @@
+"""
+Prompt Budget
+
+비교 분석 프롬프트의 섹션별 토큰 수를 추정하고, 설정한 토큰 예산을 넘으면
+요약 섹션의 목록(상위 검색어, 기회 키워드, 디바이스 행 등)을 정보 가치가 낮은 것부터 줄입니다.
+프로덕트가 늘어도 프롬프트 크기(지연 시간, 비용)가 예산 안에 머물고 컨텍스트 한도에 닿지 않습니다.
+
+- 토큰 추정: 네트워크 호출 없이 문자 종류로 근사 (영문/숫자 약 4자당 1토큰, 한글 등은 약 1.5자당 1토큰)
+- 목록 안의 행은 이미 가치 순(클릭, 노출 등 내림차순)이므로 뒤에서부터 잘라냄
+- 줄이는 순서: 보조 정보(디바이스, 국가, 트렌드) → 상세 목록(페이지, 순위 구간) → 핵심 목록(상위 검색어, 기회 키워드)
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# 요약 섹션의 목록별 기본 행 수 (None = 전체)
+SUMMARY_ROW_LIMITS: Dict[str, Optional[int]] = {
+    'top_queries': 5,
+    'opportunities': 3,
+    'position_opportunities': 3,
+    'countries': 5,
+    'devices': None,
+    'page_gaps': 5,
+    'ga4_pages': 5,
+    'ga4_devices': None,
+    'trends': 3,
+}
+
+# 예산을 넘을 때 적용하는 축소 단계 (목록, 줄인 뒤 행 수), 정보 가치가 낮은 것부터
+COMPACTION_STEPS: List[Tuple[str, int]] = [
+    ('ga4_devices', 2),
+    ('devices', 2),
+    ('countries', 3),
+    ('trends', 2),
+    ('position_opportunities', 2),
+    ('page_gaps', 3),
+    ('ga4_pages', 3),
+    ('top_queries', 3),
+    ('opportunities', 2),
+    ('ga4_devices', 0),
+    ('devices', 0),
+    ('countries', 0),
+    ('trends', 0),
+    ('position_opportunities', 0),
+    ('page_gaps', 1),
+    ('ga4_pages', 1),
+    ('top_queries', 2),
+    ('opportunities', 1),
+]
+
+# 영문/숫자/기호 몇 글자당 1토큰, 그 외(한글 등) 몇 글자당 1토큰
+ASCII_CHARS_PER_TOKEN = 4.0
+OTHER_CHARS_PER_TOKEN = 1.5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 추정
+
+    Args:
+        text: 프롬프트 또는 섹션 문자열
+
+    Returns:
+        추정 토큰 수 (빈 문자열이면 0)
+    """
+    if not text:
+        return 0
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    other_chars = len(text) - ascii_chars
+    return int(round(ascii_chars / ASCII_CHARS_PER_TOKEN + other_chars / OTHER_CHARS_PER_TOKEN))
+
+
+def fit_summary(
+    build_summary: Callable[[Dict[str, Optional[int]]], str],
+    budget: Optional[int],
+    row_limits: Optional[Dict[str, Optional[int]]] = None
+) -> Tuple[str, Dict[str, Optional[int]], int]:
+    """
+    요약 섹션을 토큰 예산 안으로 축소
+
+    Args:
+        build_summary: 목록별 행 수를 받아 요약 문자열을 만드는 함수
+        budget: 요약 섹션에 쓸 수 있는 토큰 수 (None이면 축소하지 않음)
+        row_limits: 시작 행 수 (기본: SUMMARY_ROW_LIMITS)
+
+    Returns:
+        (요약 문자열, 적용된 목록별 행 수, 추정 토큰 수).
+        모든 단계를 적용해도 넘으면 가장 많이 줄인 요약을 반환
+    """
+    limits = dict(SUMMARY_ROW_LIMITS if row_limits is None else row_limits)
+    summary = build_summary(limits)
+    tokens = estimate_tokens(summary)
+
+    for name, rows in COMPACTION_STEPS:
+        if budget is None or tokens <= budget:
+            break
+        current = limits.get(name)
+        if current is not None and current <= rows:
+            continue
+        limits[name] = rows
+        summary = build_summary(limits)
+        tokens = estimate_tokens(summary)
+
+    return summary, limits, tokens
+
+
+def fit_sections(
+    sections: List[str],
+    budget: Optional[int],
+    separator: str = "\n\n",
+    min_lines: int = 2
+) -> Tuple[List[str], int]:
+    """
+    여러 섹션(프로덕트별 개별 분석 등)을 합친 문자열이 토큰 예산 안에 들도록 줄 단위로 축소
+
+    가장 긴 섹션의 마지막 줄부터 잘라내므로, 섹션 안의 줄은 중요한 것부터 적혀 있어야 합니다.
+    각 섹션은 최소 min_lines줄(제목 + 첫 줄)을 남깁니다.
+
+    Args:
+        sections: 섹션 문자열 리스트
+        budget: 합친 문자열에 쓸 수 있는 토큰 수 (None이면 축소하지 않음)
+        separator: 섹션을 합칠 때 쓰는 구분자
+        min_lines: 섹션마다 남길 최소 줄 수
+
+    Returns:
+        (축소한 섹션 리스트, 잘라낸 줄 수). 최소 줄만 남겨도 넘으면 그 상태로 반환
+    """
+    if budget is None:
+        return list(sections), 0
+
+    lines = [section.split('\n') for section in sections]
+    tokens = [estimate_tokens(section) for section in sections]
+    separator_tokens = estimate_tokens(separator * max(len(sections) - 1, 0))
+    removed = 0
+
+    while sum(tokens) + separator_tokens > budget:
+        candidates = [i for i in range(len(lines)) if len(lines[i]) > min_lines]
+        if not candidates:
+            break
+        longest = max(candidates, key=lambda i: tokens[i])
+        lines[longest].pop()
+        tokens[longest] = estimate_tokens('\n'.join(lines[longest]))
+        removed += 1
+
+    return ['\n'.join(section_lines) for section_lines in lines], removed
+
+
+def budget_report(tokens: Dict[str, int], budget: Optional[int]) -> str:
+    """
+    섹션별 추정 토큰 수 요약 문자열
+
+    예: "summary 1,200 + metrics 300 + instructions 1,500 = 3,000 토큰 (예산 8,000)"
+    """
+    parts = " + ".join(f"{name} {count:,}" for name, count in tokens.items() if count)
+    total = sum(tokens.values())
+    limit = f" (예산 {budget:,})" if budget is not None else ""
+    return f"{parts} = {total:,} 토큰{limit}"
@@ -0,0 +1,138 @@
+"""
+Structured Output
+
+비교 분석을 Gemini의 JSON 모드(response_schema)로 요청할 때 쓰는 응답 스키마와 파서입니다.
+응답은 리포트 본문(마크다운)과 models.Action 형태의 액션 목록을 함께 담으므로,
+ActionExtractor가 리포트를 정규식이나 두 번째 Gemini 호출로 다시 파싱할 필요가 없습니다.
+
+응답 형식:
+    {
+        "report_markdown": "# Multi-Product Analysis Report ...",
+        "actions": [{"priority": "high", "product_id": "qr-generator", "action_type": "update_meta_title", ...}]
+    }
+"""
+
+import json
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
+
+from ..executors.models import VALID_ACTION_TYPES, VALID_PRIORITIES, Action
+
+
+# Action.parameters에서 실행기가 읽는 키
+ACTION_PARAMETER_KEYS = (
+    'new_value', 'new_title', 'new_description', 'link_url', 'link_text', 'canonical_url', 'og_image'
+)
+
+ACTION_SCHEMA: Dict[str, Any] = {
+    'type': 'OBJECT',
+    'properties': {
+        'priority': {'type': 'STRING', 'enum': VALID_PRIORITIES},
+        'product_id': {'type': 'STRING'},
+        'action_type': {'type': 'STRING', 'enum': VALID_ACTION_TYPES},
+        'target_file': {'type': 'STRING'},
+        'description': {'type': 'STRING'},
+        'parameters': {
+            'type': 'OBJECT',
+            'properties': {key: {'type': 'STRING', 'nullable': True} for key in ACTION_PARAMETER_KEYS},
+            'required': ['new_value'],
+        },
+        'expected_impact': {'type': 'STRING', 'nullable': True},
+    },
+    'required': ['priority', 'product_id', 'action_type', 'target_file', 'description', 'parameters'],
+}
+
+REPORT_SCHEMA: Dict[str, Any] = {
+    'type': 'OBJECT',
+    'properties': {
+        'report_markdown': {'type': 'STRING'},
+        'actions': {'type': 'ARRAY', 'items': ACTION_SCHEMA},
+    },
+    'required': ['report_markdown', 'actions'],
+    'property_ordering': ['report_markdown', 'actions'],
+}
+
+# 분석 프롬프트 끝에 붙이는 JSON 모드 안내 (리포트 안 액션 JSON 블록 안내를 대신함)
+STRUCTURED_OUTPUT_INSTRUCTIONS = """
+# 응답 형식 (JSON)
+응답은 반드시 JSON 객체 하나로 작성하세요.
+- report_markdown: 위 형식의 리포트 전체 (마크다운)
+- actions: 자동화 가능한 🔴 High Priority 액션 목록 (product_id, action_type, target_file, description, parameters)
+  - parameters.new_value: 전 세계 사용자를 고려한 범용적인 **영문(English)** SEO 문구, 15자 이상
+    (예: "Image Converter | Convert JPG to PNG Online for Free"). "white", "btn", "click" 같은 짧거나 의미 없는 단어 금지
+  - target_file: 프로덕트 Framework에 맞는 실제 파일 경로
+"""
+
+
+def response_config() -> Dict[str, Any]:
+    """JSON 모드 생성 설정 (generate_content의 config로 전달)"""
+    return {'response_mime_type': 'application/json', 'response_schema': REPORT_SCHEMA}
+
+
+def action_records(raw_actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    응답의 액션 목록을 models.Action 필드 그대로의 딕셔너리로 변환
+
+    Action 검증(우선순위, 액션 타입)을 통과하지 못하거나 target_file / new_value가 없는 항목은 건너뜁니다.
+
+    Args:
+        raw_actions: 응답의 actions 배열
+
+    Returns:
+        Action(**record)로 바로 만들 수 있는 딕셔너리 리스트 (id: action-structured-N)
+    """
+    records = []
+    for idx, data in enumerate(raw_actions, start=1):
+        params = {key: value for key, value in (data.get('parameters') or {}).items() if value is not None}
+        new_value = params.get('new_value')
+        if not data.get('target_file') or not new_value or len(str(new_value)) <= 2:
+            print(f"   ⚠️  Action {idx} 스킵: 필수 데이터 누락 또는 너무 짧은 값 ({new_value})")
+            continue
+
+        # 실행기가 읽는 타입별 키를 new_value로 채움
+        if data.get('action_type') == 'update_meta_title':
+            params.setdefault('new_title', new_value)
+        elif data.get('action_type') == 'update_meta_description':
+            params.setdefault('new_description', new_value)
+
+        try:
+            action = Action(
+                id=f"action-structured-{idx}",
+                priority=str(data.get('priority') or 'high').lower(),
+                description=data.get('description') or 'SEO Update',
+                product_id=data.get('product_id') or 'unknown',
+                action_type=data.get('action_type') or '',
+                target_file=data['target_file'],
+                parameters=params,
+                expected_impact=data.get('expected_impact'),
+                is_automatable=True
+            )
+        except ValueError as e:
+            print(f"   ⚠️  Action {idx} 스킵: {e}")
+            continue
+        records.append(asdict(action))
+    return records
+
+
+def parse_structured_report(text: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    JSON 모드 응답을 (리포트 마크다운, 액션 딕셔너리 리스트)로 변환
+
+    Args:
+        text: Gemini 응답 텍스트 (REPORT_SCHEMA 형식 JSON)
+
+    Returns:
+        (report_markdown, action_records(actions))
+
+    Raises:
+        ValueError: JSON이 아니거나 report_markdown이 없는 경우
+    """
+    data = json.loads(text)
+    if not isinstance(data, dict) or not isinstance(data.get('report_markdown'), str):
+        raise ValueError("응답에 report_markdown이 없습니다")
+    return data['report_markdown'], action_records(data.get('actions') or [])
+
+
+def dump_structured_report(markdown: str, actions: List[Dict[str, Any]]) -> str:
+    """parse_structured_report()로 다시 읽을 수 있는 JSON 문자열 (분석 결과 저장용)"""
+    return json.dumps({'report_markdown': markdown, 'actions': actions}, ensure_ascii=False)
@@ -0,0 +1,67 @@
+"""
+DeltaEngine 테스트
+
+저장된 이전 기간 스냅샷으로 지표 변화량을 계산하는지 테스트합니다. (API 호출 없음)
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.delta_engine import DeltaEngine, format_delta_table
+from core.storage.metrics_store import MetricsStore
+
+
+def _save_snapshot(store: MetricsStore, day: str, clicks: int, sessions: int) -> None:
+    store.save_product_data({
+        'id': 'qr-generator',
+        'gsc': {'top_queries': pd.DataFrame({
+            'query': ['qr code'],
+            'clicks': [clicks],
+            'impressions': [1000],
+            'ctr': [clicks / 1000],
+            'position': [4.0]
+        })},
+        'ga4': {'pages': pd.DataFrame({
+            'page_path': ['/'],
+            'sessions': [sessions],
+            'engagement_rate': [50.0]
+        })}
+    }, snapshot_date=day)
+
+
+def test_deltas_against_previous_windows(tmp_path):
+    """기간마다 가장 가까운 이전 스냅샷과 비교해 절대/퍼센트 변화량을 계산한다"""
+    store = MetricsStore(str(tmp_path))
+    _save_snapshot(store, '2026-01-01', clicks=40, sessions=200)
+    _save_snapshot(store, '2026-01-07', clicks=50, sessions=400)   # 2주 전 기준일(01-08) 하루 전
+    _save_snapshot(store, '2026-01-15', clicks=80, sessions=500)   # 1주 전
+
+    current = {'gsc_clicks': 100, 'ctr_percent': 10.0, 'sessions': 400, 'revenue': 3.0}
+    deltas = DeltaEngine(store, windows=3).compute('qr-generator', current, window_days=7, as_of='2026-01-22')
+
+    assert list(deltas.index) == ['gsc_clicks', 'ctr_percent', 'sessions', 'revenue']
+    assert deltas.loc['gsc_clicks', ['prev_1', 'prev_2', 'prev_3']].tolist() == [80, 50, 40]
+    assert deltas.loc['gsc_clicks', 'delta_1'] == 20
+    assert deltas.loc['gsc_clicks', 'pct_1'] == pytest.approx(25.0)
+    assert deltas.loc['sessions', 'pct_1'] == pytest.approx(-20.0)
+    assert deltas.loc['ctr_percent', 'delta_1'] == pytest.approx(2.0)
+    assert deltas.loc['gsc_clicks', 'baseline'] == pytest.approx(170 / 3)
+    assert pd.isna(deltas.loc['revenue', 'prev_1'])
+
+    table = format_delta_table(deltas)
+    assert table[2] == '| GSC 클릭 | 100 | 80 | +20 | +25.0% | 57 | +76.5% |'
+
+
+def test_no_history_yields_empty_table(tmp_path):
+    """이전 스냅샷이 없으면 변화량 표를 만들지 않는다"""
+    deltas = DeltaEngine(MetricsStore(str(tmp_path))).compute('qr-generator', {'gsc_clicks': 10})
+
+    assert deltas.empty
+    assert format_delta_table(deltas) == []
@@ -0,0 +1,100 @@
+"""
+Map-Reduce 분석 테스트
+
+프로덕트별 개별 분석이 동시에 실행되고, 한 프로덕트가 실패해도 나머지 결과로 비교 분석을 요청하는지 테스트합니다.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.prompt_budget import estimate_tokens
+
+
+REDUCE_MARKER = "# 프로덕트별 개별 분석 결과"
+
+
+def _map_responder(parallel: int, failing: str = None, extra_lines: int = 0):
+    """개별 분석 요청은 모두 동시에 도착해야 통과하고, 지정한 프로덕트는 실패하는 응답 함수"""
+    barrier = threading.Barrier(parallel, timeout=5)
+
+    def _respond(contents):
+        if REDUCE_MARKER in contents:
+            return "# Multi-Product Analysis Report"
+        barrier.wait()
+        if failing and failing in contents:
+            raise RuntimeError("quota exceeded")
+        name = contents.split('**')[1]
+        extra = "".join(f"\n- 추세 {i}: {name} 검색 노출 변화 상세 설명" for i in range(extra_lines))
+        return f"- 현재 상태: {name} 정상{extra}"
+
+    return _respond
+
+
+def _product(index: int) -> dict:
+    return {
+        'id': f'product-{index}',
+        'name': f'Product {index}',
+        'config': {'priority': 'high', 'framework': 'nextjs'},
+        'gsc': {
+            'top_queries': pd.DataFrame({
+                'query': [f'product {index} keyword'], 'clicks': [10],
+                'impressions': [100], 'position': [3.0]
+            })
+        },
+        'ga4': None,
+        'trends': None,
+        'adsense': None
+    }
+
+
+def _analyzer(make_analyzer, client, workers: int, budget: int = None):
+    return make_analyzer(
+        client, prompt_token_budget=budget, analysis_mode='map_reduce', analysis_workers=workers
+    )
+
+
+def test_products_run_concurrently_and_failure_falls_back_to_summary(fake_genai, make_analyzer):
+    """개별 분석은 동시에 실행되고, 실패한 프로덕트는 수집 데이터 요약으로 대체되어 비교 단계에 들어간다"""
+    client = fake_genai(respond=_map_responder(parallel=3, failing='Product 1'))
+    products = [_product(i) for i in range(3)]
+
+    report = _analyzer(make_analyzer, client, workers=3).analyze_products(products)
+
+    assert report == "# Multi-Product Analysis Report"
+    assert len(client.prompts) == 4
+    reduce_prompt = client.prompts[-1]
+    assert REDUCE_MARKER in reduce_prompt
+    assert "- 현재 상태: Product 0 정상" in reduce_prompt
+    assert "- 현재 상태: Product 2 정상" in reduce_prompt
+    assert "개별 분석 실패: quota exceeded" in reduce_prompt
+    assert "product 1 keyword" in reduce_prompt
+    # 프로덕트 순서 유지
+    assert reduce_prompt.index("## Product 0") < reduce_prompt.index("## Product 1") < reduce_prompt.index("## Product 2")
+
+
+def test_reduce_prompt_is_trimmed_to_token_budget(fake_genai, make_analyzer):
+    """개별 분석이 길면 비교 프롬프트가 예산 안에 들도록 뒤쪽 줄부터 잘라내고, 첫 줄은 남긴다"""
+    products = [_product(i) for i in range(2)]
+    unlimited = fake_genai(respond=_map_responder(parallel=2, extra_lines=200))
+    _analyzer(make_analyzer, unlimited, workers=2).analyze_products(products)
+    full_prompt = unlimited.prompts[-1]
+
+    budget = estimate_tokens(full_prompt) // 4
+    client = fake_genai(respond=_map_responder(parallel=2, extra_lines=200))
+    _analyzer(make_analyzer, client, workers=2, budget=budget).analyze_products(products)
+    reduce_prompt = client.prompts[-1]
+
+    assert estimate_tokens(full_prompt) > budget
+    assert estimate_tokens(reduce_prompt) <= budget
+    assert "- 현재 상태: Product 0 정상" in reduce_prompt
+    assert "- 현재 상태: Product 1 정상" in reduce_prompt
+    assert "추세 199" not in reduce_prompt
+    # 지표 분석/변화량 섹션 없이 개별 분석만 비교
+    assert "# 지표 기반 자동 분석" not in reduce_prompt
@@ -0,0 +1,184 @@
+"""
+Metrics Frame 테스트
+
+프로덕트 x 지표 DataFrame으로 계산한 목표 달성률/임계값 플래그/Health Score가
+기존 프로덕트별 계산 결과(골든 값)와 같은지 테스트합니다. (API 호출 없음)
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.metrics_frame import build_metrics_frame, health_scores, metric_config_frames
+
+
+def _queries(clicks, impressions, positions):
+    return pd.DataFrame({
+        'query': [f'keyword {i}' for i in range(len(clicks))],
+        'clicks': clicks,
+        'impressions': impressions,
+        'position': positions
+    })
+
+
+def _products():
+    """여러 분기(소스 누락, 0 목표, 경계값, 설정 없음)를 포함한 프로덕트 목록"""
+    return [
+        {
+            'id': 'qr-generator',
+            'name': 'QR Studio',
+            'config': {
+                'goals': {
+                    'weekly_sessions': 250, 'weekly_gsc_clicks': 20, 'target_ctr_percent': 1.5,
+                    'target_engagement_rate': 2.0, 'weekly_revenue_usd': 2.0, 'target_rpm_usd': 1.0
+                },
+                'thresholds': {
+                    'gsc_clicks': {'critical': 10, 'warning': 50},
+                    'ctr_percent': {'critical': 0.5, 'warning': 1.0},
+                    'engagement_rate': {'critical': 1.0, 'warning': 3.0},
+                    'adsense_rpm': {'critical': 0.5, 'warning': 1.0},
+                    'avg_position': {'critical': 50, 'warning': 30},
+                    'sessions': {'critical': 50, 'warning': 200}
+                },
+                'health_score_weights': {'traffic': 30, 'engagement': 25, 'seo': 25, 'revenue': 20}
+            },
+            'gsc': {'top_queries': _queries([12, 3, 0], [900, 400, 250], [8.5, 22.25, 41.0])},
+            'ga4': {'pages': pd.DataFrame({
+                'page_path': ['/', '/scan'], 'sessions': [150, 41], 'engagement_rate': [0.5, 0.7]
+            })},
+            'adsense': {'revenue': 0.42, 'rpm': 0.75}
+        },
+        {
+            'id': 'convert-image',
+            'name': 'ConvertKits',
+            'config': {
+                'goals': {
+                    'weekly_sessions': 120, 'weekly_gsc_clicks': 15,
+                    'target_ctr_percent': 2.0, 'target_engagement_rate': 3.0
+                },
+                'thresholds': {
+                    'sessions': {'critical': 30, 'warning': 100},
+                    'gsc_clicks': {'critical': 10, 'warning': 40},
+                    'engagement_rate': {'critical': 2.0, 'warning': 5.0}
+                },
+                'health_score_weights': {'traffic': 35, 'engagement': 35, 'seo': 30}
+            },
+            'gsc': {'top_queries': pd.DataFrame()},
+            'ga4': {'pages': pd.DataFrame({'page_path': ['/'], 'sessions': [79]})},
+            'adsense': None
+        },
+        {
+            'id': 'edge',
+            'name': 'Edge Cases',
+            'config': {
+                'goals': {'weekly_sessions': 0, 'weekly_gsc_clicks': 100.0, 'target_ctr_percent': 0},
+                'thresholds': {
+                    'avg_position': {'warning': 30},
+                    'gsc_clicks': {'critical': 5, 'warning': 50},
+                    'gsc_impressions': {'critical': 100, 'warning': 1000},
+                    'revenue': {'critical': 1.0, 'warning': 5.0},
+                    'ctr_percent': {'critical': 1.0}
+                },
+                'health_score_weights': {'traffic': 40, 'seo': 40, 'revenue': 20, 'other': 10}
+            },
+            'gsc': {'top_queries': _queries([50, 0], [0, 0], [30.0, 30.0])},
+            'ga4': None,
+            'adsense': {'revenue': 7.891, 'rpm': 1.0}
+        },
+        {
+            'id': 'goals-only',
+            'name': 'Goals Only',
+            'config': {'goals': {'weekly_sessions': 10}},
+            'gsc': None,
+            'ga4': {'pages': pd.DataFrame()}
+        },
+        {'id': 'bare', 'name': 'Bare'}
+    ]
+
+
+GOLDEN_METRICS_ANALYSIS = """
+============================================================
+📊 지표 기반 자동 분석 (Metrics Analysis)
+============================================================
+
+## QR Studio
+
+### 🎯 목표 대비 달성률
+  🟡 주간 세션: 191 / 250 (76.4%)
+  🟡 주간 GSC 클릭: 15 / 20 (75.0%)
+  🟡 CTR: 0.97% / 1.50% (64.5%)
+  🔴 참여율: 0.6% / 2.0% (30.0%)
+  🔴 주간 수익: $0.42 / $2.00 (21.0%)
+
+### 🚦 지표 상태 플래그
+  🟡 GSC 클릭: 15 - 주의
+  🟡 CTR: 0.97% - 주의
+  🔴 참여율: 0.60% - 위험
+  🟡 AdSense RPM: $0.75 - 주의
+  🟢 평균 순위: 23.9위 - 양호
+  🟡 GA4 세션: 191 - 주의
+
+### 💯 Health Score: 48.8/100
+  ⚠️ 상태: 주의 필요 (Needs Attention)
+
+## ConvertKits
+
+### 🎯 목표 대비 달성률
+  🟡 주간 세션: 79 / 120 (65.8%)
+  🔴 참여율: 0.0% / 3.0% (0.0%)
+
+### 🚦 지표 상태 플래그
+  🟡 GA4 세션: 79 - 주의
+  🔴 참여율: 0.00% - 위험
+
+### 💯 Health Score: 15.8/100
+  🚨 상태: 위험 (Critical)
+
+## Edge Cases
+
+### 🎯 목표 대비 달성률
+  🟡 주간 GSC 클릭: 50 / 100.0 (50.0%)
+  🔴 CTR: 0.00% / 0.00% (0.0%)
+
+### 🚦 지표 상태 플래그
+  🔴 평균 순위: 30.0위 - 위험
+  🟢 GSC 클릭: 50 - 양호
+  🔴 gsc_impressions: 0 - 위험
+  🟢 revenue: 7 - 양호
+  🔴 CTR: 0.00% - 위험
+
+### 💯 Health Score: 75.0/100
+  ✅ 상태: 양호 (Healthy)
+
+## Goals Only
+
+### 🎯 목표 대비 달성률
+
+## Bare"""
+
+
+def test_metrics_analysis_matches_golden_output(make_analyzer):
+    """벡터화한 지표 분석 텍스트가 기존 프로덕트별 계산 결과와 한 글자도 다르지 않다"""
+    analyzer = make_analyzer()
+
+    assert analyzer._analyze_metrics(_products()) == GOLDEN_METRICS_ANALYSIS
+
+
+def test_health_scores_for_all_products_at_once():
+    """지표/임계값/가중치 프레임에서 모든 프로덕트의 Health Score를 한 번에 계산한다"""
+    products = _products()
+    metrics = build_metrics_frame(products)
+    frames = metric_config_frames(products)
+
+    scores = health_scores(metrics, frames['critical'], frames['warning'], frames['weights'])
+
+    assert list(metrics.index) == ['qr-generator', 'convert-image', 'edge', 'goals-only', 'bare']
+    assert metrics.loc['qr-generator', 'gsc_clicks'] == 15
+    assert pd.isna(metrics.loc['convert-image', 'gsc_clicks'])
+    assert metrics.loc['convert-image', 'engagement_rate'] == 0
+    assert scores.round(6).tolist() == [48.75, 15.75, 75.0, 0.0, 0.0]
@@ -0,0 +1,74 @@
+"""
+Page Join 테스트
+
+GSC 절대 URL과 GA4 page_path가 정규화 키로 같은 페이지에 모이고, 지표가 올바르게 재집계되는지 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.page_join import canonical_page_keys, engagement_gaps, join_page_metrics
+
+
+def _gsc_pages() -> pd.DataFrame:
+    return pd.DataFrame({
+        'page': pd.Categorical([
+            'https://convertkits.org/',
+            'https://convertkits.org/tools/qr/',
+            'https://convertkits.org/Tools/QR?utm_source=news',
+            'https://convertkits.org/blog#top',
+        ]),
+        'clicks': np.array([50, 10, 2, 1], dtype='int32'),
+        'impressions': np.array([1000, 400, 100, 300], dtype='int32'),
+        'position': np.array([2.0, 8.0, 13.0, 30.0], dtype='float32')
+    })
+
+
+def _ga4_pages() -> pd.DataFrame:
+    return pd.DataFrame({
+        'page_path': pd.Categorical(['/', '/tools/qr', '/tools/qr/?ref=home', '/about']),
+        'sessions': np.array([300, 90, 10, 20], dtype='int32'),
+        'engagement_rate': np.array([0.8, 0.2, 0.6, 0.5], dtype='float32')
+    })
+
+
+def test_canonical_keys_drop_origin_query_and_slashes():
+    """스킴/호스트, 쿼리 문자열, 프래그먼트, 끝 슬래시를 지우고 소문자로 맞춘다"""
+    keys = canonical_page_keys(pd.Series([
+        'https://convertkits.org/Tools/?utm_source=x#top', '/tools', 'https://convertkits.org', '/', None
+    ]))
+
+    assert keys.tolist()[:4] == ['/tools', '/tools', '/', '/']
+    assert pd.isna(keys.iloc[4])
+
+
+def test_join_reaggregates_both_sources_per_page():
+    """같은 페이지로 모인 URL은 다시 집계되고, 한쪽에만 있는 페이지는 다른 쪽 지표가 NaN이다"""
+    joined = join_page_metrics(_gsc_pages(), _ga4_pages()).set_index('page_key')
+
+    qr = joined.loc['/tools/qr']
+    assert qr['clicks'] == 12 and qr['impressions'] == 500
+    assert abs(qr['position'] - (8 * 400 + 13 * 100) / 500) < 1e-4
+    assert abs(qr['ctr'] - 12 / 500) < 1e-6
+    assert qr['sessions'] == 100
+    assert abs(qr['engagement_rate'] - (0.2 * 90 + 0.6 * 10) / 100) < 1e-6
+    assert np.isnan(joined.loc['/blog', 'sessions'])
+    assert np.isnan(joined.loc['/about', 'impressions'])
+    assert joined.index.tolist() == ['/', '/tools/qr', '/blog', '/about']
+
+
+def test_engagement_gaps_and_single_source():
+    """참여율이 평균보다 낮은 검색 유입 페이지를 고르고, 한 소스만 있어도 조인이 동작한다"""
+    gaps = engagement_gaps(join_page_metrics(_gsc_pages(), _ga4_pages()))
+
+    assert gaps['page_key'].astype(str).tolist() == ['/tools/qr']
+    assert join_page_metrics(None, _ga4_pages())['page_key'].astype(str).tolist() == ['/', '/tools/qr', '/about']
+    assert engagement_gaps(join_page_metrics(_gsc_pages(), None)).empty
+    assert join_page_metrics(None, pd.DataFrame()).empty
@@ -0,0 +1,83 @@
+"""
+Product Summary 테스트
+
+프로세스 워커가 돌려주는 요약으로도 비교 분석 입력(요약, 지표 분석)이 전체 데이터와 같은지 테스트합니다.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.product_summary import summarize_product
+
+
+def _product(product_id: str, rows: int) -> dict:
+    rng = np.random.default_rng(len(product_id))
+    queries = pd.DataFrame({
+        'query': pd.Categorical([f'{product_id} keyword {i}' for i in range(rows)]),
+        'clicks': rng.integers(0, 100, rows).astype('int32'),
+        'impressions': rng.integers(100, 5000, rows).astype('int32'),
+        'position': rng.uniform(1, 60, rows).astype('float32')
+    })
+    pages = pd.DataFrame({
+        'page_path': pd.Categorical([f'/page-{i}' for i in range(rows)]),
+        'sessions': rng.integers(1, 500, rows).astype('int32'),
+        'engagement_rate': rng.uniform(0, 5, rows).astype('float32')
+    })
+    return {
+        'id': product_id,
+        'name': product_id.upper(),
+        'config': {
+            'priority': 'high',
+            'thresholds': {'sessions': {'critical': 50, 'warning': 20000}, 'avg_position': {'critical': 50, 'warning': 30}},
+            'health_score_weights': {'traffic': 50, 'seo': 50}
+        },
+        'gsc': {
+            'top_queries': queries,
+            'opportunities': queries.nlargest(10, 'impressions'),
+            'page_performance': pd.DataFrame({'page': [f'/page-{i}' for i in range(rows)]})
+        },
+        'ga4': {
+            'pages': pages,
+            'devices': pd.DataFrame({'device': ['mobile', 'desktop'], 'sessions': [70, 30]}),
+            'events': pd.DataFrame({'event_name': ['page_view'] * rows, 'event_count': np.arange(rows)})
+        },
+        'trends': None,
+        'adsense': {'revenue': 3.5, 'rpm': 1.2}
+    }
+
+
+def test_summary_keeps_analysis_identical(make_analyzer):
+    """상위 행만 남긴 요약으로 만든 요약 텍스트와 지표 분석이 전체 데이터와 같다"""
+    analyzer = make_analyzer()
+    full = [_product('qr-generator', 2000), _product('convert-image', 300)]
+
+    summaries = [summarize_product(data) for data in full]
+
+    assert analyzer._build_summary(summaries) == analyzer._build_summary(full)
+    assert analyzer._analyze_metrics(summaries) == analyzer._analyze_metrics(full)
+
+
+def test_summary_is_compact_and_idempotent():
+    """요약은 전체 데이터보다 훨씬 작게 직렬화되고, 다시 요약해도 원래 행 수와 해시가 유지된다"""
+    data = _product('qr-generator', 2000)
+
+    summary = summarize_product(data)
+    again = summarize_product(summary)
+
+    assert len(pickle.dumps(summary)) * 10 < len(pickle.dumps(data))
+    assert len(summary['gsc']['top_queries']['query'].cat.categories) == 5
+    assert 'events' not in summary['ga4'] and 'page_performance' not in summary['gsc']
+    assert again['row_counts'] == summary['row_counts'] == {
+        'gsc_top_queries': 2000, 'gsc_opportunities': 10, 'gsc_page_performance': 2000,
+        'ga4_pages': 2000, 'ga4_devices': 2, 'ga4_events': 2000
+    }
+    assert again['content_hashes'] == summary['content_hashes']
+    assert again['metrics'] == summary['metrics']
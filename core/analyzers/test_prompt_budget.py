@@ -0,0 +1,80 @@
+"""
+Prompt Budget 테스트
+
+토큰 예산을 넘으면 요약 목록을 정보 가치가 낮은 것부터 줄이고, 예산 안이면 요약을 그대로 두는지 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.prompt_budget import SUMMARY_ROW_LIMITS, estimate_tokens, fit_summary
+
+
+def _product(index: int) -> dict:
+    queries = pd.DataFrame({
+        'query': [f'product {index} keyword {i}' for i in range(20)],
+        'clicks': np.arange(200, 0, -10, dtype='int32'),
+        'impressions': np.arange(4000, 0, -200, dtype='int32'),
+        'position': np.linspace(2, 30, 20).astype('float32')
+    })
+    return {
+        'id': f'product-{index}',
+        'name': f'Product {index}',
+        'config': {'priority': 'high', 'framework': 'nextjs'},
+        'gsc': {
+            'top_queries': queries,
+            'opportunities': queries.tail(5),
+            'device_performance': pd.DataFrame({
+                'device': ['MOBILE', 'DESKTOP', 'TABLET'], 'clicks': [10, 5, 1],
+                'impressions': [100, 80, 20], 'ctr': [0.1, 0.0625, 0.05]
+            })
+        },
+        'ga4': None,
+        'trends': None,
+        'adsense': None
+    }
+
+
+def test_estimate_tokens_weights_korean_more_than_ascii():
+    """영문은 약 4자당 1토큰, 한글은 약 1.5자당 1토큰으로 추정한다"""
+    assert estimate_tokens('') == 0
+    assert estimate_tokens('a' * 400) == 100
+    assert estimate_tokens('가' * 150) == 100
+
+
+def test_summary_is_unchanged_within_budget_and_trimmed_over_it(make_analyzer):
+    """예산 안이면 기본 요약 그대로, 넘으면 보조 목록부터 줄여 예산 안으로 맞춘다"""
+    analyzer = make_analyzer()
+    products = [_product(i) for i in range(12)]
+    build = lambda limits: analyzer._build_summary(products, row_limits=limits)
+    full_tokens = estimate_tokens(build(SUMMARY_ROW_LIMITS))
+
+    unchanged, limits, _ = fit_summary(build, budget=None)
+    trimmed, trimmed_limits, tokens = fit_summary(build, budget=int(full_tokens * 0.8))
+
+    assert unchanged == analyzer._build_summary(products) and limits == SUMMARY_ROW_LIMITS
+    assert tokens <= full_tokens * 0.8
+    assert trimmed_limits['devices'] < 3
+    assert trimmed.count("keyword 0'") == 12  # 가장 가치가 높은 행은 남김
+
+
+def test_analyzer_budget_report_covers_all_sections(make_analyzer):
+    """분석기는 지시문/지표/요약 섹션 토큰을 합쳐 예산과 비교한다"""
+    products = [_product(i) for i in range(12)]
+    unlimited = make_analyzer()
+    summary, tokens = unlimited._fit_prompt_budget(products, None, '지표 분석', '')
+    budget = sum(tokens.values()) - tokens['summary'] // 5
+
+    small_summary, small_tokens = make_analyzer(prompt_token_budget=budget)._fit_prompt_budget(products, None, '지표 분석', '')
+
+    assert set(tokens) == {'instructions', 'metrics', 'deltas', 'summary'}
+    assert tokens['instructions'] > 0
+    assert sum(small_tokens.values()) <= budget
+    assert len(small_summary) < len(summary)
@@ -0,0 +1,115 @@
+"""
+Structured Output 테스트
+
+JSON 모드 응답에서 리포트와 액션 목록을 함께 받고, 사이드카로 저장한 액션을
+ActionExtractor가 리포트 파싱 없이 불러오는지 테스트합니다.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzers.prompt_budget import estimate_tokens
+from core.analyzers.structured_output import (
+    REPORT_SCHEMA, STRUCTURED_OUTPUT_INSTRUCTIONS, dump_structured_report, parse_structured_report
+)
+from core.executors.action_extractor import ActionExtractor
+from core.executors.action_sidecar import sidecar_path, write_action_sidecar
+
+
+RESPONSE = {
+    'report_markdown': "# Multi-Product Analysis Report\n\n## 📊 Executive Summary\n요약",
+    'actions': [
+        {
+            'priority': 'high',
+            'product_id': 'qr-generator',
+            'action_type': 'update_meta_title',
+            'target_file': 'src/app/layout.tsx',
+            'description': '메인 페이지 메타 타이틀 최적화',
+            'parameters': {'new_value': 'Free Online QR Code Generator | Fast & Easy', 'link_url': None},
+            'expected_impact': 'CTR 개선'
+        },
+        {
+            'priority': 'high',
+            'product_id': 'convert-image',
+            'action_type': 'rewrite_everything',
+            'target_file': 'pages/Home.tsx',
+            'description': '허용되지 않는 액션 타입',
+            'parameters': {'new_value': 'Image Converter | Convert JPG to PNG'}
+        }
+    ]
+}
+
+
+def _analyzer(make_analyzer, fake_genai):
+    client = fake_genai(text=json.dumps(RESPONSE, ensure_ascii=False))
+    return make_analyzer(client, analysis_output='json'), client
+
+
+def _product() -> dict:
+    return {
+        'id': 'qr-generator',
+        'name': 'QR Studio',
+        'config': {'framework': 'nextjs'},
+        'gsc': {'top_queries': pd.DataFrame({'query': ['qr code'], 'clicks': [10], 'impressions': [100], 'position': [3.0]})},
+        'ga4': None,
+        'trends': None,
+        'adsense': None
+    }
+
+
+def test_structured_analysis_returns_report_and_typed_actions(make_analyzer, fake_genai):
+    """응답 스키마로 요청하고, 검증을 통과한 액션만 Action 필드 그대로 돌려준다"""
+    analyzer, client = _analyzer(make_analyzer, fake_genai)
+
+    report, actions = analyzer.analyze_products_structured([_product()])
+
+    assert client.configs == [{'response_mime_type': 'application/json', 'response_schema': REPORT_SCHEMA}]
+    assert report == RESPONSE['report_markdown']
+    assert [action['id'] for action in actions] == ['action-structured-1']
+    assert actions[0]['parameters'] == {
+        'new_value': 'Free Online QR Code Generator | Fast & Easy',
+        'new_title': 'Free Online QR Code Generator | Fast & Easy'
+    }
+    assert parse_structured_report(dump_structured_report(report, actions)) == (report, actions)
+
+
+def test_structured_prompt_replaces_json_block_and_is_budgeted(make_analyzer, fake_genai):
+    """JSON 모드 프롬프트는 액션 JSON 블록 안내 대신 응답 형식 안내를 담고, 그 안내까지 예산에 포함한다"""
+    analyzer, client = _analyzer(make_analyzer, fake_genai)
+    products = [_product()]
+
+    analyzer.analyze_products_structured(products)
+    prompt = client.prompts[0]
+    _, tokens = analyzer._fit_prompt_budget(products, None, '', '', structured=True)
+
+    assert prompt.endswith(STRUCTURED_OUTPUT_INSTRUCTIONS)
+    assert 'Machine-Readable Actions' not in prompt and '```json' not in prompt
+    assert 'Machine-Readable Actions' in analyzer._build_analysis_prompt('', products, '')
+    assert tokens['instructions'] == estimate_tokens(analyzer._build_analysis_prompt('', products, '', structured=True))
+    assert tokens['instructions'] >= estimate_tokens(STRUCTURED_OUTPUT_INSTRUCTIONS)
+
+
+def test_extractor_loads_sidecar_without_parsing_report(tmp_path):
+    """사이드카가 있으면 리포트 본문에 액션이 없어도 사이드카의 액션을 그대로 불러온다"""
+    report_path = tmp_path / '2024-01-01_multi_product_analysis.md'
+    report_path.write_text(RESPONSE['report_markdown'], encoding='utf-8')
+    extractor = ActionExtractor(api_key=None)
+
+    assert extractor.extract_from_report(str(report_path)) == []
+
+    _, actions = parse_structured_report(json.dumps(RESPONSE))
+    write_action_sidecar(str(report_path), actions)
+    loaded = extractor.extract_from_report(str(report_path))
+
+    assert sidecar_path(str(report_path)).name == '2024-01-01_multi_product_analysis.actions.json'
+    assert len(loaded) == 1
+    assert (loaded[0].product_id, loaded[0].action_type, loaded[0].target_file) == (
+        'qr-generator', 'update_meta_title', 'src/app/layout.tsx'
+    )
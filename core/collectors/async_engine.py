@@ -0,0 +1,301 @@
+"""
+Async Collection Engine
+
+수집 작업을 asyncio로 실행하면서 작업별 제한 시간과 전체 마감 시각을 적용합니다.
+제한 시간을 넘긴 작업은 취소하고, 나머지 작업의 결과만으로 계속 진행합니다.
+
+- 네이티브 async 클라이언트가 있는 소스(GA4)는 코루틴 함수로 등록합니다
+  (인자는 functools.partial로 묶음, lambda로 감싸면 동기 함수로 취급).
+  제한 시간이 지나면 요청 자체가 취소됩니다.
+- 동기 클라이언트(GSC, Trends, AdSense)는 데몬 스레드로 넘겨 실행합니다.
+  제한 시간이 지나면 결과를 기다리지 않고 버리며, 데몬 스레드이므로
+  응답 없는 호출이 남아 있어도 프로세스 종료를 막지 않습니다.
+
+사용 예시:
+    engine = CollectionEngine(call_timeout=120, deadline=time.monotonic() + 600)
+    engine.add('gsc', fetch_gsc)                                  # 동기 함수
+    engine.add('ga4', partial(fetch_ga4_async, property_id))      # 코루틴 함수
+    engine.add('trends', fetch_trends, depends_on=['gsc'])       # fetch_trends(gsc_result)
+    result = engine.run()
+    result.timed_out  # ['ga4'] 등
+"""
+
+import asyncio
+import functools
+import inspect
+import io
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from ..utils.log_capture import capture_output, capture_task_output, current_buffer
+
+
+# 이벤트 루프 타이머가 제한 시간보다 조금 일찍 깨어나는 경우를 감안한 여유 (초)
+_TIMER_SLACK = 0.01
+
+# 스레드별로 재사용하는 이벤트 루프 (루프에 묶인 async 클라이언트를 프로덕트 간에 공유하기 위함)
+_thread_state = threading.local()
+
+
+def _thread_runner() -> asyncio.Runner:
+    """현재 스레드의 asyncio.Runner (처음 호출할 때 생성, close_thread_runner() 전까지 같은 이벤트 루프 재사용)"""
+    runner = getattr(_thread_state, 'runner', None)
+    if runner is None:
+        runner = _thread_state.runner = asyncio.Runner()
+    return runner
+
+
+def close_thread_runner(*cleanups: Callable[[], Awaitable[Any]]) -> None:
+    """
+    현재 스레드의 이벤트 루프 종료 (수집 스레드가 일을 마칠 때 호출)
+
+    루프를 닫기 전에 cleanups를 그 루프에서 차례로 실행합니다
+    (루프에 묶인 async 클라이언트 닫기 등). 루프가 없으면 아무것도 하지 않습니다.
+
+    Args:
+        *cleanups: 인자 없는 코루틴 함수 (예: client_pool.close_ga4_async_clients)
+    """
+    runner = getattr(_thread_state, 'runner', None)
+    if runner is None:
+        return
+    _thread_state.runner = None
+    try:
+        for cleanup in cleanups:
+            runner.run(cleanup())
+    finally:
+        runner.close()
+
+
+@dataclass
+class TaskTiming:
+    """
+    작업별 실행 시간 정보
+
+    Attributes:
+        started_at: 실행 시작 기준 작업 시작 시점 (초)
+        finished_at: 실행 시작 기준 작업 종료 시점 (초)
+    """
+
+    started_at: float
+    finished_at: float
+
+    @property
+    def duration(self) -> float:
+        """작업 자체의 소요 시간 (초)"""
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class CollectionResult:
+    """
+    CollectionEngine 실행 결과
+
+    Attributes:
+        results: 성공한 작업의 반환값
+        errors: 실패한 작업의 예외
+        skipped: 선행 작업 실패로 실행하지 않은 작업
+        timed_out: 제한 시간을 넘겨 취소한 작업
+        timings: 작업별 실행 시간
+    """
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    timings: Dict[str, TaskTiming] = field(default_factory=dict)
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        """가장 늦게 끝난 작업 (전체 소요 시간을 결정한 작업)"""
+        if not self.timings:
+            return None
+        return max(self.timings, key=lambda name: self.timings[name].finished_at)
+
+
+async def offload(fn: Callable[..., Any], *args: Any, buffer: Optional[io.StringIO] = None) -> Any:
+    """
+    동기 함수를 데몬 스레드에서 실행하고 결과를 기다립니다.
+
+    기본 executor와 달리 종료 시 스레드를 join하지 않으므로,
+    취소된 호출이 응답 없이 멈춰 있어도 인터프리터 종료가 지연되지 않습니다.
+
+    Args:
+        fn: 실행할 동기 함수
+        *args: fn에 전달할 인자
+        buffer: 스레드 출력을 모을 버퍼 (기본: 호출한 작업의 버퍼)
+
+    Returns:
+        fn의 반환값
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    if buffer is None:
+        buffer = current_buffer()
+
+    def _resolve(setter: Callable[[Any], None], value: Any) -> None:
+        if not future.done():
+            setter(value)
+
+    def _target() -> None:
+        with capture_output(buffer) if buffer is not None else nullcontext():
+            try:
+                outcome = (future.set_result, fn(*args))
+            except BaseException as e:
+                outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(_resolve, *outcome)
+        except RuntimeError:
+            # 이미 제한 시간으로 포기하고 이벤트 루프가 닫힌 경우
+            pass
+
+    threading.Thread(target=_target, name=f'offload-{getattr(fn, "__name__", "call")}', daemon=True).start()
+    return await future
+
+
+def _is_coroutine_function(fn: Callable[..., Any]) -> bool:
+    """코루틴 함수인지 확인 (functools.partial로 인자를 묶은 경우 원래 함수 기준)"""
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    return inspect.iscoroutinefunction(fn)
+
+
+@dataclass
+class _Job:
+    name: str
+    fn: Callable[..., Any]
+    depends_on: List[str]
+    timeout: Optional[float]
+
+
+class CollectionEngine:
+    """제한 시간과 의존성을 고려하여 수집 작업을 asyncio로 실행하는 실행기"""
+
+    def __init__(self, call_timeout: Optional[float] = None, deadline: Optional[float] = None):
+        """
+        Args:
+            call_timeout: 작업별 기본 제한 시간 (초, None이면 제한 없음)
+            deadline: 전체 마감 시각 (time.monotonic() 기준, None이면 제한 없음).
+                마감 시각이 지나면 아직 끝나지 않은 작업은 모두 취소됩니다.
+        """
+        self.call_timeout = call_timeout
+        self.deadline = deadline
+        self._jobs: Dict[str, _Job] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+        timeout: Optional[float] = None
+    ) -> None:
+        """
+        작업 등록
+
+        Args:
+            name: 작업 이름 (결과 딕셔너리의 키)
+            fn: 코루틴 함수(functools.partial 포함) 또는 동기 함수.
+                선행 작업의 결과를 depends_on 순서대로 인자로 받습니다.
+            depends_on: 선행 작업 이름 목록 (먼저 등록되어 있어야 함)
+            timeout: 이 작업의 제한 시간 (초, 기본: call_timeout)
+        """
+        if name in self._jobs:
+            raise ValueError(f"Duplicate task: {name}")
+        missing = [dep for dep in depends_on if dep not in self._jobs]
+        if missing:
+            raise ValueError(f"Unknown dependencies for '{name}': {missing}")
+        self._jobs[name] = _Job(
+            name=name,
+            fn=fn,
+            depends_on=list(depends_on),
+            timeout=timeout if timeout is not None else self.call_timeout
+        )
+
+    def _time_limit(self, job: _Job) -> Optional[float]:
+        """작업 제한 시간과 남은 전체 시간 중 작은 값 (초)"""
+        limits = [job.timeout] if job.timeout is not None else []
+        if self.deadline is not None:
+            limits.append(self.deadline - time.monotonic())
+        return max(0.0, min(limits)) if limits else None
+
+    def run(self) -> CollectionResult:
+        """
+        현재 스레드의 이벤트 루프에서 모든 작업을 실행합니다.
+
+        같은 스레드에서 다시 실행하면 close_thread_runner()를 호출할 때까지 같은 이벤트 루프를 쓰므로,
+        루프별로 캐시한 async 클라이언트(client_pool.get_ga4_async_client)를 실행마다 다시 만들지 않습니다.
+
+        Returns:
+            CollectionResult (제한 시간을 넘긴 작업은 timed_out에 기록)
+        """
+        return _thread_runner().run(self.run_async())
+
+    async def run_async(self) -> CollectionResult:
+        """
+        모든 작업을 실행하고 결과를 반환합니다.
+
+        각 작업의 출력은 작업별 버퍼에 모았다가 등록 순서대로 현재 stdout에 씁니다.
+        선행 작업이 실패하거나 시간 초과된 작업은 실행하지 않고 skipped에 기록합니다.
+
+        Returns:
+            CollectionResult
+        """
+        result = CollectionResult()
+        if not self._jobs:
+            return result
+
+        logs = {name: io.StringIO() for name in self._jobs}
+        graph_start = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def _execute(job: _Job) -> None:
+            if job.depends_on:
+                await asyncio.wait([tasks[dep] for dep in job.depends_on])
+            if any(dep not in result.results for dep in job.depends_on):
+                result.skipped.append(job.name)
+                return
+            args = [result.results[dep] for dep in job.depends_on]
+            limit = self._time_limit(job)
+
+            with capture_task_output(logs[job.name]):
+                started = time.perf_counter() - graph_start
+                try:
+                    if _is_coroutine_function(job.fn):
+                        call = job.fn(*args)
+                    else:
+                        call = offload(job.fn, *args, buffer=logs[job.name])
+                    result.results[job.name] = await asyncio.wait_for(call, timeout=limit)
+                except asyncio.TimeoutError as e:
+                    # 작업 자체의 TimeoutError(소켓 읽기 시간 초과 등)는 엔진 제한 시간 초과가 아니라 오류
+                    elapsed = time.perf_counter() - graph_start - started
+                    if limit is not None and elapsed >= limit - _TIMER_SLACK:
+                        result.timed_out.append(job.name)
+                        print(f"     ⏱️  {job.name}: 제한 시간 {limit:.0f}초 초과 - 취소하고 부분 데이터로 진행")
+                    else:
+                        result.errors[job.name] = e
+                except Exception as e:
+                    result.errors[job.name] = e
+                finished = time.perf_counter() - graph_start
+            result.timings[job.name] = TaskTiming(started, finished)
+
+        for name, job in self._jobs.items():
+            tasks[name] = asyncio.create_task(_execute(job), name=name)
+        await asyncio.gather(*tasks.values())
+
+        # 결과와 출력은 완료 순서와 무관하게 등록 순서로 정렬
+        result.timings = {name: result.timings[name] for name in self._jobs if name in result.timings}
+        result.skipped = [name for name in self._jobs if name in result.skipped]
+        for name in self._jobs:
+            if logs[name].getvalue():
+                sys.stdout.write(logs[name].getvalue())
+
+        return result
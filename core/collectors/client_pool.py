@@ -0,0 +1,183 @@
+"""
+Shared Google API Client Pool
+
+프로세스 전체에서 서비스 계정 인증 정보와 API 클라이언트를 공유합니다.
+
+- 서비스 계정 JSON은 파일당 한 번만 읽습니다.
+- Search Console 서비스는 번들된 정적 discovery 문서로 한 번만 생성합니다.
+  (네트워크로 discovery 문서를 받지 않음)
+- httplib2.Http는 스레드 안전하지 않으므로 요청마다 유휴 AuthorizedHttp를 빌려 쓰는
+  풀을 사용합니다. 풀의 연결은 keep-alive로 재사용됩니다.
+- GA4 gRPC 클라이언트는 스레드 안전하므로 그대로 공유합니다.
+  async 클라이언트는 이벤트 루프에 묶이므로 (이벤트 루프, 키 파일)마다 하나를 공유하고,
+  루프를 닫기 전에 close_ga4_async_clients()로 닫습니다 (async_engine.close_thread_runner() 참고).
+
+따라서 프로덕트 수가 늘어도 인증/클라이언트 초기화 비용은 일정합니다.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import weakref
+from typing import Dict, Sequence, Tuple
+
+import google_auth_httplib2
+import httplib2
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient, BetaAnalyticsDataClient
+from google.oauth2 import service_account
+from googleapiclient.discovery import build
+
+
+GSC_SCOPES = ('https://www.googleapis.com/auth/webmasters.readonly',)
+GA4_SCOPES = ('https://www.googleapis.com/auth/analytics.readonly',)
+
+# 풀에서 만드는 HTTP 연결의 요청 타임아웃 (초)
+HTTP_TIMEOUT_SECONDS = 60
+
+_lock = threading.Lock()
+_account_info: Dict[str, dict] = {}
+_credentials: Dict[Tuple[str, Tuple[str, ...]], service_account.Credentials] = {}
+_searchconsole_services: Dict[str, object] = {}
+_ga4_clients: Dict[str, BetaAnalyticsDataClient] = {}
+# 이벤트 루프 → {키 파일: async 클라이언트} (루프가 사라지면 항목도 사라짐)
+_ga4_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, BetaAnalyticsDataAsyncClient]]' = \
+    weakref.WeakKeyDictionary()
+
+
+class _AuthorizedHttpPool:
+    """
+    AuthorizedHttp 객체 풀
+
+    googleapiclient가 기대하는 request() 인터페이스를 제공하고,
+    호출마다 다른 스레드가 쓰지 않는 연결을 빌려 요청한 뒤 돌려놓습니다.
+    """
+
+    def __init__(self, credentials, timeout: int = HTTP_TIMEOUT_SECONDS):
+        self._credentials = credentials
+        self._timeout = timeout
+        self._idle = queue.LifoQueue()
+
+    def _acquire(self) -> google_auth_httplib2.AuthorizedHttp:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return google_auth_httplib2.AuthorizedHttp(
+                self._credentials,
+                http=httplib2.Http(timeout=self._timeout)
+            )
+
+    def request(self, *args, **kwargs):
+        http = self._acquire()
+        try:
+            return http.request(*args, **kwargs)
+        finally:
+            self._idle.put(http)
+
+
+def _resolve(credentials_path: str) -> str:
+    return os.path.abspath(credentials_path)
+
+
+def get_credentials(credentials_path: str, scopes: Sequence[str]) -> service_account.Credentials:
+    """
+    서비스 계정 인증 정보 (파일과 scope 조합당 한 번만 생성)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+        scopes: OAuth scope 목록
+
+    Returns:
+        공유되는 Credentials 객체
+    """
+    path = _resolve(credentials_path)
+    key = (path, tuple(sorted(scopes)))
+
+    with _lock:
+        if key not in _credentials:
+            if path not in _account_info:
+                with open(path, 'r', encoding='utf-8') as f:
+                    _account_info[path] = json.load(f)
+            _credentials[key] = service_account.Credentials.from_service_account_info(
+                _account_info[path],
+                scopes=list(scopes)
+            )
+        return _credentials[key]
+
+
+def get_searchconsole_service(credentials_path: str):
+    """
+    Search Console API 서비스 (스레드 간 공유 가능)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+
+    Returns:
+        googleapiclient Resource
+    """
+    path = _resolve(credentials_path)
+    credentials = get_credentials(path, GSC_SCOPES)
+
+    with _lock:
+        if path not in _searchconsole_services:
+            _searchconsole_services[path] = build(
+                'searchconsole',
+                'v1',
+                http=_AuthorizedHttpPool(credentials),
+                static_discovery=True,
+                cache_discovery=False
+            )
+        return _searchconsole_services[path]
+
+
+def get_ga4_client(credentials_path: str) -> BetaAnalyticsDataClient:
+    """
+    GA4 Data API 클라이언트 (gRPC, 스레드 간 공유 가능)
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+
+    Returns:
+        BetaAnalyticsDataClient
+    """
+    path = _resolve(credentials_path)
+    credentials = get_credentials(path, GA4_SCOPES)
+
+    with _lock:
+        if path not in _ga4_clients:
+            _ga4_clients[path] = BetaAnalyticsDataClient(credentials=credentials)
+        return _ga4_clients[path]
+
+
+def get_ga4_async_client(credentials_path: str) -> BetaAnalyticsDataAsyncClient:
+    """
+    GA4 Data API async 클라이언트 (실행 중인 이벤트 루프와 키 파일당 하나를 공유)
+
+    gRPC aio 채널은 생성한 이벤트 루프에서만 쓸 수 있으므로 루프별로 캐시합니다.
+    실행 중인 이벤트 루프 안에서 호출해야 하며, 공유 클라이언트이므로 호출한 쪽에서 닫지 않습니다.
+
+    Args:
+        credentials_path: 서비스 계정 JSON 키 파일 경로
+
+    Returns:
+        BetaAnalyticsDataAsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    path = _resolve(credentials_path)
+    credentials = get_credentials(path, GA4_SCOPES)
+
+    with _lock:
+        clients = _ga4_async_clients.setdefault(loop, {})
+        if path not in clients:
+            clients[path] = BetaAnalyticsDataAsyncClient(credentials=credentials)
+        return clients[path]
+
+
+async def close_ga4_async_clients() -> None:
+    """실행 중인 이벤트 루프에 묶인 GA4 async 클라이언트를 닫고 캐시에서 제거 (루프를 닫기 전에 호출)"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _ga4_async_clients.pop(loop, {})
+    for client in clients.values():
+        await client.transport.close()
@@ -4,20 +4,27 @@ Google Analytics 4 Data Collector
 GA4 API를 사용하여 사용자 행동 데이터를 수집합니다.
 """
 
+import asyncio
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Metric,
     RunReportRequest,
 )
-from google.oauth2 import service_account
 import pandas as pd
 
+from .client_pool import get_ga4_async_client, get_ga4_client
+from .response_decoder import decode_ga4_response, memory_report
+
+
+# batchRunReports 한 번에 담을 수 있는 최대 리포트 수
+GA4_MAX_BATCH_REPORTS = 5
+
 
 class GA4Collector:
     """Google Analytics 4 데이터 수집기"""
@@ -28,32 +35,35 @@ class GA4Collector:
             credentials_path: 서비스 계정 JSON 키 파일 경로
             property_id: GA4 속성 ID (예: 123456789)
         """
+        self.credentials_path = credentials_path
         self.property_id = property_id
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=['https://www.googleapis.com/auth/analytics.readonly']
-        )
-        self.client = BetaAnalyticsDataClient(credentials=credentials)
-
-    def fetch_page_performance(self, days: int = 7) -> pd.DataFrame:
-        """
-        페이지별 성과 데이터 가져오기
-
-        Args:
-            days: 가져올 일수
-
-        Returns:
-            페이지별 성과 DataFrame
-        """
+        # 동기 gRPC 클라이언트는 처음 쓸 때 가져옴 (fetch_all_async만 쓰면 동기 채널을 만들지 않음)
+        self._client = None
+
+    @property
+    def client(self):
+        """동기 GA4 클라이언트 (스레드 안전하므로 프로세스 전체에서 공유, 처음 접근할 때 생성)"""
+        if self._client is None:
+            self._client = get_ga4_client(self.credentials_path)
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
+
+    def _date_ranges(self, days: int) -> List[DateRange]:
+        """조회 기간 (오늘 기준 days일 전 ~ 오늘)"""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
+        return [DateRange(
+            start_date=start_date.strftime('%Y-%m-%d'),
+            end_date=end_date.strftime('%Y-%m-%d')
+        )]
 
-        request = RunReportRequest(
+    def _page_performance_request(self, days: int) -> RunReportRequest:
+        return RunReportRequest(
             property=f"properties/{self.property_id}",
-            date_ranges=[DateRange(
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d')
-            )],
+            date_ranges=self._date_ranges(days),
             dimensions=[
                 Dimension(name="pagePath"),
                 Dimension(name="pageTitle")
@@ -72,49 +82,23 @@ class GA4Collector:
             }]
         )
 
-        try:
-            response = self.client.run_report(request)
-
-            rows = []
-            for row in response.rows:
-                data = {
-                    'page_path': row.dimension_values[0].value,
-                    'page_title': row.dimension_values[1].value,
-                    'pageviews': int(row.metric_values[0].value),
-                    'sessions': int(row.metric_values[1].value),
-                    'avg_session_duration': float(row.metric_values[2].value),
-                    'bounce_rate': float(row.metric_values[3].value),
-                    'engagement_rate': float(row.metric_values[4].value)
-                }
-                rows.append(data)
-
-            df = pd.DataFrame(rows)
-            print(f"✅ GA4: {len(df)}개 페이지 성과 데이터 수집")
-            return df
-
-        except Exception as e:
-            print(f"❌ GA4 데이터 수집 실패: {str(e)}")
-            return pd.DataFrame()
-
-    def fetch_traffic_sources(self, days: int = 7) -> pd.DataFrame:
-        """
-        트래픽 소스별 데이터 가져오기
-
-        Args:
-            days: 가져올 일수
-
-        Returns:
-            트래픽 소스 DataFrame
-        """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+    def _parse_page_performance(self, response) -> pd.DataFrame:
+        return decode_ga4_response(
+            response,
+            dimensions=['page_path', 'page_title'],
+            metrics=[
+                ('pageviews', 'int32'),
+                ('sessions', 'int32'),
+                ('avg_session_duration', 'float32'),
+                ('bounce_rate', 'float32'),
+                ('engagement_rate', 'float32')
+            ]
+        )
 
-        request = RunReportRequest(
+    def _traffic_sources_request(self, days: int) -> RunReportRequest:
+        return RunReportRequest(
             property=f"properties/{self.property_id}",
-            date_ranges=[DateRange(
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d')
-            )],
+            date_ranges=self._date_ranges(days),
             dimensions=[
                 Dimension(name="sessionSource"),
                 Dimension(name="sessionMedium")
@@ -131,21 +115,103 @@ class GA4Collector:
             }]
         )
 
+    def _parse_traffic_sources(self, response) -> pd.DataFrame:
+        return decode_ga4_response(
+            response,
+            dimensions=['source', 'medium'],
+            metrics=[
+                ('sessions', 'int32'),
+                ('engagement_rate', 'float32'),
+                ('avg_session_duration', 'float32')
+            ]
+        )
+
+    def _device_breakdown_request(self, days: int) -> RunReportRequest:
+        return RunReportRequest(
+            property=f"properties/{self.property_id}",
+            date_ranges=self._date_ranges(days),
+            dimensions=[
+                Dimension(name="deviceCategory")
+            ],
+            metrics=[
+                Metric(name="sessions"),
+                Metric(name="engagementRate"),
+                Metric(name="bounceRate")
+            ]
+        )
+
+    def _parse_device_breakdown(self, response) -> pd.DataFrame:
+        return decode_ga4_response(
+            response,
+            dimensions=['device'],
+            metrics=[
+                ('sessions', 'int32'),
+                ('engagement_rate', 'float32'),
+                ('bounce_rate', 'float32')
+            ]
+        )
+
+    def _conversion_events_request(self, days: int) -> RunReportRequest:
+        return RunReportRequest(
+            property=f"properties/{self.property_id}",
+            date_ranges=self._date_ranges(days),
+            dimensions=[
+                Dimension(name="eventName")
+            ],
+            metrics=[
+                Metric(name="eventCount"),
+                Metric(name="eventCountPerUser")
+            ],
+            limit=20,
+            order_bys=[{
+                'metric': {'metric_name': 'eventCount'},
+                'desc': True
+            }]
+        )
+
+    def _parse_conversion_events(self, response) -> pd.DataFrame:
+        return decode_ga4_response(
+            response,
+            dimensions=['event_name'],
+            metrics=[
+                ('event_count', 'int32'),
+                ('events_per_user', 'float32')
+            ]
+        )
+
+    def fetch_page_performance(self, days: int = 7) -> pd.DataFrame:
+        """
+        페이지별 성과 데이터 가져오기
+
+        Args:
+            days: 가져올 일수
+
+        Returns:
+            페이지별 성과 DataFrame
+        """
         try:
-            response = self.client.run_report(request)
-
-            rows = []
-            for row in response.rows:
-                data = {
-                    'source': row.dimension_values[0].value,
-                    'medium': row.dimension_values[1].value,
-                    'sessions': int(row.metric_values[0].value),
-                    'engagement_rate': float(row.metric_values[1].value),
-                    'avg_session_duration': float(row.metric_values[2].value)
-                }
-                rows.append(data)
-
-            df = pd.DataFrame(rows)
+            response = self.client.run_report(self._page_performance_request(days))
+            df = self._parse_page_performance(response)
+            print(f"✅ GA4: {len(df)}개 페이지 성과 데이터 수집")
+            return df
+
+        except Exception as e:
+            print(f"❌ GA4 데이터 수집 실패: {str(e)}")
+            return pd.DataFrame()
+
+    def fetch_traffic_sources(self, days: int = 7) -> pd.DataFrame:
+        """
+        트래픽 소스별 데이터 가져오기
+
+        Args:
+            days: 가져올 일수
+
+        Returns:
+            트래픽 소스 DataFrame
+        """
+        try:
+            response = self.client.run_report(self._traffic_sources_request(days))
+            df = self._parse_traffic_sources(response)
             print(f"✅ GA4: {len(df)}개 트래픽 소스 수집")
             return df
 
@@ -163,39 +229,9 @@ class GA4Collector:
         Returns:
             디바이스별 DataFrame
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        request = RunReportRequest(
-            property=f"properties/{self.property_id}",
-            date_ranges=[DateRange(
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d')
-            )],
-            dimensions=[
-                Dimension(name="deviceCategory")
-            ],
-            metrics=[
-                Metric(name="sessions"),
-                Metric(name="engagementRate"),
-                Metric(name="bounceRate")
-            ]
-        )
-
         try:
-            response = self.client.run_report(request)
-
-            rows = []
-            for row in response.rows:
-                data = {
-                    'device': row.dimension_values[0].value,
-                    'sessions': int(row.metric_values[0].value),
-                    'engagement_rate': float(row.metric_values[1].value),
-                    'bounce_rate': float(row.metric_values[2].value)
-                }
-                rows.append(data)
-
-            df = pd.DataFrame(rows)
+            response = self.client.run_report(self._device_breakdown_request(days))
+            df = self._parse_device_breakdown(response)
             print(f"✅ GA4: 디바이스 데이터 수집 ({len(df)}개 카테고리)")
             return df
 
@@ -213,42 +249,9 @@ class GA4Collector:
         Returns:
             이벤트 DataFrame
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        request = RunReportRequest(
-            property=f"properties/{self.property_id}",
-            date_ranges=[DateRange(
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d')
-            )],
-            dimensions=[
-                Dimension(name="eventName")
-            ],
-            metrics=[
-                Metric(name="eventCount"),
-                Metric(name="eventCountPerUser")
-            ],
-            limit=20,
-            order_bys=[{
-                'metric': {'metric_name': 'eventCount'},
-                'desc': True
-            }]
-        )
-
         try:
-            response = self.client.run_report(request)
-
-            rows = []
-            for row in response.rows:
-                data = {
-                    'event_name': row.dimension_values[0].value,
-                    'event_count': int(row.metric_values[0].value),
-                    'events_per_user': float(row.metric_values[1].value)
-                }
-                rows.append(data)
-
-            df = pd.DataFrame(rows)
+            response = self.client.run_report(self._conversion_events_request(days))
+            df = self._parse_conversion_events(response)
             print(f"✅ GA4: {len(df)}개 이벤트 데이터 수집")
             return df
 
@@ -256,6 +259,103 @@ class GA4Collector:
             print(f"❌ GA4 이벤트 데이터 수집 실패: {str(e)}")
             return pd.DataFrame()
 
+    def _reports(self) -> list:
+        """(키, 요청 생성, 응답 파싱, 개별 수집 메서드) 목록"""
+        return [
+            ('pages', self._page_performance_request, self._parse_page_performance, self.fetch_page_performance),
+            ('traffic', self._traffic_sources_request, self._parse_traffic_sources, self.fetch_traffic_sources),
+            ('devices', self._device_breakdown_request, self._parse_device_breakdown, self.fetch_device_breakdown),
+            ('events', self._conversion_events_request, self._parse_conversion_events, self.get_conversion_events)
+        ]
+
+    def _batch_requests(self, reports: list, days: int) -> List[BatchRunReportsRequest]:
+        """리포트 목록을 최대 GA4_MAX_BATCH_REPORTS개씩 묶은 배치 요청"""
+        return [
+            BatchRunReportsRequest(
+                property=f"properties/{self.property_id}",
+                requests=[build_request(days) for _, build_request, _, _ in reports[i:i + GA4_MAX_BATCH_REPORTS]]
+            )
+            for i in range(0, len(reports), GA4_MAX_BATCH_REPORTS)
+        ]
+
+    def _split_reports(self, reports: list, responses: list) -> Dict[str, pd.DataFrame]:
+        """배치 응답을 리포트별 DataFrame으로 나누기"""
+        results = {
+            key: parse(response)
+            for (key, _, parse, _), response in zip(reports, responses)
+        }
+        print(
+            f"✅ GA4: 배치 요청으로 {len(results)}개 리포트 수집 "
+            f"(페이지 {len(results['pages'])}개, 소스 {len(results['traffic'])}개, "
+            f"디바이스 {len(results['devices'])}개, 이벤트 {len(results['events'])}개)"
+        )
+        print(f"   🧠 메모리: {memory_report(results)}")
+        return results
+
+    def fetch_all(self, days: int = 7) -> Dict[str, pd.DataFrame]:
+        """
+        네 가지 GA4 리포트를 batchRunReports 요청으로 한 번에 가져오기
+
+        한 요청에 최대 5개 리포트를 담아 보내고, 응답을 리포트별 DataFrame으로 나눕니다.
+        배치 요청이 실패하면 리포트별 개별 요청으로 대체합니다.
+
+        Args:
+            days: 가져올 일수
+
+        Returns:
+            {'pages': DataFrame, 'traffic': DataFrame, 'devices': DataFrame, 'events': DataFrame}
+        """
+        reports = self._reports()
+
+        try:
+            responses = []
+            for request in self._batch_requests(reports, days):
+                responses.extend(self.client.batch_run_reports(request).reports)
+            return self._split_reports(reports, responses)
+
+        except Exception as e:
+            print(f"⚠️  GA4 배치 요청 실패, 리포트별 요청으로 대체: {str(e)}")
+            return {key: fetch(days=days) for key, _, _, fetch in reports}
+
+    async def fetch_all_async(self, days: int = 7, client=None) -> Dict[str, pd.DataFrame]:
+        """
+        fetch_all의 async 버전 (네이티브 gRPC aio 클라이언트 사용)
+
+        asyncio 제한 시간으로 취소하면 진행 중인 요청도 함께 취소됩니다.
+        배치 요청이 실패하면 리포트별 요청을 동시에 보냅니다.
+
+        Args:
+            days: 가져올 일수
+            client: async 클라이언트 (기본: 현재 이벤트 루프의 공유 클라이언트)
+
+        Returns:
+            {'pages': DataFrame, 'traffic': DataFrame, 'devices': DataFrame, 'events': DataFrame}
+        """
+        if client is None:
+            client = get_ga4_async_client(self.credentials_path)
+
+        reports = self._reports()
+
+        try:
+            responses = []
+            for request in self._batch_requests(reports, days):
+                responses.extend((await client.batch_run_reports(request)).reports)
+            return self._split_reports(reports, responses)
+
+        except Exception as e:
+            print(f"⚠️  GA4 배치 요청 실패, 리포트별 요청으로 대체: {str(e)}")
+
+        async def _single(key, build_request, parse):
+            try:
+                return parse(await client.run_report(build_request(days)))
+            except Exception as e:
+                print(f"❌ GA4 {key} 리포트 수집 실패: {str(e)}")
+                return pd.DataFrame()
+
+        frames = await asyncio.gather(*(
+            _single(key, build_request, parse) for key, build_request, parse, _ in reports
+        ))
+        return dict(zip([key for key, _, _, _ in reports], frames))
 
 if __name__ == '__main__':
     """테스트용 실행 코드"""
@@ -0,0 +1,160 @@
+"""
+Search Console Day-Partitioned Cache
+
+GSC 데이터를 속성 / 차원 조합 / 날짜 단위의 Parquet 파일로 보관합니다.
+확정된(더 이상 변하지 않는) 날짜는 한 번만 받아오고, 이후 실행에서는
+누락되었거나 아직 변동 가능한 날짜만 API로 요청합니다.
+
+디렉토리 구조:
+    <cache_dir>/<property>/<dimensions>/<YYYY-MM-DD>.parquet
+"""
+
+import hashlib
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import pandas as pd
+
+from .response_decoder import compact_frame, concat_frames, drop_unused_categories
+
+
+# 이 일수보다 오래된 날짜의 GSC 데이터는 더 이상 바뀌지 않는 것으로 간주
+GSC_STABLE_AFTER_DAYS = 3
+
+GSC_METRIC_COLUMNS = ['clicks', 'impressions', 'ctr', 'position']
+
+
+class GSCDayCache:
+    """속성·차원 조합별 일 단위 GSC 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        property_url: str,
+        dimensions: List[str],
+        stable_after_days: int = GSC_STABLE_AFTER_DAYS
+    ):
+        """
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            property_url: GSC 속성 URL (예: sc-domain:example.com)
+            dimensions: 날짜를 제외한 차원 목록 (예: ['query', 'page'])
+            stable_after_days: 확정 데이터로 간주할 경과 일수
+        """
+        self.dimensions = list(dimensions)
+        self.stable_after_days = stable_after_days
+        self.partition_dir = Path(cache_dir) / _property_key(property_url) / '+'.join(self.dimensions)
+
+    def path_for(self, day: date) -> Path:
+        """날짜별 파티션 파일 경로"""
+        return self.partition_dir / f"{day.strftime('%Y-%m-%d')}.parquet"
+
+    def is_final(self, day: date) -> bool:
+        """
+        확정된 파티션이 있는지 확인
+
+        파티션이 있더라도 저장 당시 아직 변동 가능한 날짜였다면 다시 받아와야 합니다.
+        """
+        path = self.path_for(day)
+        if not path.exists():
+            return False
+        fetched_on = datetime.fromtimestamp(path.stat().st_mtime).date()
+        return (fetched_on - day).days > self.stable_after_days
+
+    def missing_days(self, days: List[date]) -> List[date]:
+        """API로 받아와야 하는 날짜 (누락 또는 변동 가능)"""
+        return [day for day in days if not self.is_final(day)]
+
+    def cached_days(self, days: List[date]) -> List[date]:
+        """파티션이 존재하는 날짜 (확정 여부 무관)"""
+        return [day for day in days if self.path_for(day).exists()]
+
+    def save(self, day: date, df: pd.DataFrame) -> None:
+        """
+        하루치 데이터 저장 (데이터가 없는 날도 빈 파티션으로 기록)
+
+        다른 프로세스가 읽는 중에도 깨진 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        """
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        columns = self.dimensions + GSC_METRIC_COLUMNS
+        if df.empty:
+            df = pd.DataFrame(columns=columns)
+        else:
+            df = drop_unused_categories(df[columns].copy())
+
+        path = self.path_for(day)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        df[columns].reset_index(drop=True).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def load(self, days: List[date]) -> pd.DataFrame:
+        """여러 날짜의 파티션을 읽어 'date' 컬럼과 함께 합침"""
+        frames = []
+        for day in days:
+            path = self.path_for(day)
+            if not path.exists():
+                continue
+            df = pd.read_parquet(path)
+            if df.empty:
+                continue
+            df['date'] = day.strftime('%Y-%m-%d')
+            frames.append(df)
+
+        return concat_frames(frames, ignore_index=True)
+
+
+def window_days(start_date: Union[date, datetime], end_date: Union[date, datetime]) -> List[date]:
+    """start_date ~ end_date (양 끝 포함) 날짜 목록"""
+    first, last = _as_date(start_date), _as_date(end_date)
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def contiguous_ranges(days: List[date]) -> List[Tuple[date, date]]:
+    """정렬된 날짜 목록을 연속 구간 (시작, 끝) 목록으로 묶음"""
+    ranges = []
+    for day in sorted(days):
+        if ranges and (day - ranges[-1][1]).days == 1:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+def aggregate_days(df: pd.DataFrame, dimensions: List[str]) -> pd.DataFrame:
+    """
+    일별 데이터를 기간 전체 값으로 합산
+
+    clicks / impressions는 합계, position은 노출 가중 평균, ctr은 합계로 다시 계산합니다.
+    (Search Console이 기간 집계 시 사용하는 방식과 같습니다.)
+    """
+    if df.empty:
+        return pd.DataFrame()
+
+    weighted = df.assign(_weighted_position=df['position'] * df['impressions'])
+    grouped = weighted.groupby(dimensions, sort=False, observed=True).agg(
+        clicks=('clicks', 'sum'),
+        impressions=('impressions', 'sum'),
+        _weighted_position=('_weighted_position', 'sum')
+    ).reset_index()
+
+    impressions = grouped['impressions'].where(grouped['impressions'] > 0)
+    grouped['ctr'] = (grouped['clicks'] / impressions).fillna(0.0)
+    grouped['position'] = (grouped['_weighted_position'] / impressions).fillna(0.0)
+    grouped = grouped.drop(columns=['_weighted_position'])
+
+    grouped = grouped.sort_values('clicks', ascending=False, kind='stable').reset_index(drop=True)
+    return compact_frame(grouped)
+
+
+def _as_date(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _property_key(property_url: str) -> str:
+    """속성 URL을 파일 시스템에 안전한 디렉토리 이름으로 변환"""
+    slug = re.sub(r'[^A-Za-z0-9.-]+', '_', property_url).strip('_')
+    digest = hashlib.sha1(property_url.encode('utf-8')).hexdigest()[:8]
+    return f"{slug}-{digest}"
@@ -5,123 +5,302 @@ Google Search Console Data Collector
 """
 
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 import pandas as pd
 
+from .client_pool import GSC_SCOPES, get_credentials, get_searchconsole_service
+from .gsc_cache import GSCDayCache, aggregate_days, contiguous_ranges, window_days
+from .gsc_cube import CUBE_DIMENSIONS, GSCCube
+from .opportunity_index import OpportunityIndex
+from .response_decoder import compact_frame, concat_frames, decode_gsc_rows, memory_report
+
+
+# Search Analytics API가 한 번의 요청으로 반환하는 최대 행 수
+GSC_MAX_ROWS_PER_PAGE = 25000
+
+# 전체 DataFrame 또는 iter_search_analytics()의 청크 스트림
+SearchData = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
 
 class GSCCollector:
     """Google Search Console 데이터 수집기"""
 
-    def __init__(self, credentials_path: str, property_url: str):
+    def __init__(self, credentials_path: str, property_url: str, cache_dir: Optional[str] = None):
         """
         Args:
             credentials_path: 서비스 계정 JSON 키 파일 경로
             property_url: GSC 속성 URL (예: https://convertkits.org)
+            cache_dir: 일별 파티션 캐시 디렉토리 (없으면 캐시 미사용)
         """
         self.property_url = property_url
-        self.credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=['https://www.googleapis.com/auth/webmasters.readonly']
-        )
-        self.service = build('searchconsole', 'v1', credentials=self.credentials)
+        self.cache_dir = cache_dir
+        # 인증 정보와 서비스 객체는 프로세스 전체에서 공유
+        self.credentials = get_credentials(credentials_path, GSC_SCOPES)
+        self.service = get_searchconsole_service(credentials_path)
+
+    def _date_range(self, days: int) -> Tuple[datetime, datetime]:
+        """수집 기간 계산 (GSC는 3일 전 데이터까지만 안정적)"""
+        end_date = datetime.now() - timedelta(days=3)
+        start_date = end_date - timedelta(days=days)
+        return start_date, end_date
+
+    def iter_search_analytics(
+        self,
+        days: int = 7,
+        dimensions: Optional[List[str]] = None,
+        page_size: int = GSC_MAX_ROWS_PER_PAGE,
+        max_rows: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        검색 분석 데이터를 페이지 단위로 가져오기 (제너레이터)
+
+        startRow를 page_size씩 증가시키며 더 이상 행이 없을 때까지 요청하고,
+        각 페이지를 DataFrame 청크로 반환합니다. 청크의 인덱스는 전체 결과 기준
+        행 번호이므로 여러 청크를 이어 붙여도 인덱스가 겹치지 않습니다.
+
+        Args:
+            days: 가져올 일수 (기본: 7일)
+            dimensions: 차원 목록 (기본: ['query', 'page'])
+            page_size: 요청당 행 수 (최대 25,000)
+            max_rows: 가져올 최대 행 수 (기본: 제한 없음)
+
+        Yields:
+            페이지별 검색 분석 DataFrame
+        """
+        if dimensions is None:
+            dimensions = ['query', 'page']
+
+        start_date, end_date = self._date_range(days)
+        return self._query_pages(start_date, end_date, dimensions, page_size, max_rows)
+
+    def _query_pages(
+        self,
+        start_date: Union[date, datetime],
+        end_date: Union[date, datetime],
+        dimensions: List[str],
+        page_size: int = GSC_MAX_ROWS_PER_PAGE,
+        max_rows: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """지정한 기간을 startRow 단위로 순회하며 페이지별 DataFrame 반환"""
+        page_size = min(page_size, GSC_MAX_ROWS_PER_PAGE)
+        start_row = 0
+
+        while max_rows is None or start_row < max_rows:
+            row_limit = page_size if max_rows is None else min(page_size, max_rows - start_row)
+            request_body = {
+                'startDate': start_date.strftime('%Y-%m-%d'),
+                'endDate': end_date.strftime('%Y-%m-%d'),
+                'dimensions': dimensions,
+                'rowLimit': row_limit,
+                'startRow': start_row
+            }
+
+            try:
+                response = self.service.searchanalytics().query(
+                    siteUrl=self.property_url,
+                    body=request_body
+                ).execute()
+            except Exception as e:
+                print(f"❌ GSC 데이터 수집 실패: {str(e)}")
+                raise
+
+            rows = response.get('rows', [])
+            if not rows:
+                return
+
+            yield decode_gsc_rows(rows, dimensions, start_row)
+
+            if len(rows) < row_limit:
+                return
+            start_row += len(rows)
 
     def fetch_search_analytics(
         self,
         days: int = 7,
-        dimensions: Optional[List[str]] = None
+        dimensions: Optional[List[str]] = None,
+        max_rows: Optional[int] = None
     ) -> pd.DataFrame:
         """
         검색 분석 데이터 가져오기
 
+        iter_search_analytics()의 모든 페이지를 하나의 DataFrame으로 합칩니다.
+
         Args:
             days: 가져올 일수 (기본: 7일)
             dimensions: 차원 목록 (기본: ['query', 'page'])
+            max_rows: 가져올 최대 행 수 (기본: 제한 없음)
 
         Returns:
             pandas DataFrame with search analytics data
         """
-        if dimensions is None:
-            dimensions = ['query', 'page']
+        if self.cache_dir:
+            return self._fetch_with_cache(days, dimensions or ['query', 'page'], max_rows)
 
-        # 날짜 범위 계산 (GSC는 3일 전 데이터까지만 안정적)
-        end_date = datetime.now() - timedelta(days=3)
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = self._date_range(days)
+        chunks = list(self.iter_search_analytics(days=days, dimensions=dimensions, max_rows=max_rows))
 
-        request_body = {
-            'startDate': start_date.strftime('%Y-%m-%d'),
-            'endDate': end_date.strftime('%Y-%m-%d'),
-            'dimensions': dimensions,
-            'rowLimit': 1000,  # 최대 1000개 행
-            'startRow': 0
-        }
+        if not chunks:
+            print(f"⚠️  데이터가 없습니다 ({start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')})")
+            return pd.DataFrame()
 
-        try:
-            response = self.service.searchanalytics().query(
-                siteUrl=self.property_url,
-                body=request_body
-            ).execute()
+        page_count = len(chunks)
+        df = concat_frames(chunks)
+        del chunks  # 합친 뒤에는 페이지별 청크를 바로 해제해 최대 메모리를 줄임
 
-            if 'rows' not in response:
-                print(f"⚠️  데이터가 없습니다 ({start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')})")
-                return pd.DataFrame()
+        print(f"✅ {len(df)}개의 검색 데이터를 수집했습니다. ({page_count}페이지)")
+        print(f"   기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        print(f"   🧠 메모리: {memory_report({'search_analytics': df})}")
 
-            # 데이터를 DataFrame으로 변환
-            rows = []
-            for row in response['rows']:
-                data = {
-                    'query': row['keys'][0] if len(dimensions) > 0 else None,
-                    'page': row['keys'][1] if len(dimensions) > 1 else None,
-                    'clicks': row['clicks'],
-                    'impressions': row['impressions'],
-                    'ctr': row['ctr'],
-                    'position': row['position']
-                }
-                rows.append(data)
+        return df
 
-            df = pd.DataFrame(rows)
+    def _fetch_daily(self, start_date: datetime, end_date: datetime, dimensions: List[str]) -> Tuple[pd.DataFrame, int]:
+        """
+        일별 파티션 캐시를 이용해 기간의 일별 데이터 조회 ('date' 컬럼 포함)
+
+        누락되었거나 아직 변동 가능한 날짜만 'date' 차원을 추가해 API로 받아오고,
+        나머지는 로컬 파티션에서 읽습니다.
+        API 호출이 실패하면 캐시된 날짜만으로 결과를 만듭니다 (오프라인 동작).
+
+        Returns:
+            (일별 데이터, 사용한 날짜 수)
+        """
+        cache = GSCDayCache(self.cache_dir, self.property_url, dimensions)
+        days_in_window = window_days(start_date, end_date)
+        missing = cache.missing_days(days_in_window)
 
-            print(f"✅ {len(df)}개의 검색 데이터를 수집했습니다.")
-            print(f"   기간: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
+        print(f"💾 GSC 캐시: {len(days_in_window) - len(missing)}/{len(days_in_window)}일 사용, {len(missing)}일 요청")
 
-            return df
+        for range_start, range_end in contiguous_ranges(missing):
+            try:
+                chunks = list(self._query_pages(range_start, range_end, dimensions + ['date']))
+            except Exception as e:
+                print(f"⚠️  GSC API 요청 실패, 캐시된 날짜만 사용합니다: {str(e)}")
+                break
 
-        except Exception as e:
-            print(f"❌ GSC 데이터 수집 실패: {str(e)}")
-            raise
+            fetched = concat_frames(chunks, ignore_index=True)
+            by_day = dict(tuple(fetched.groupby('date'))) if not fetched.empty else {}
+            for day in window_days(range_start, range_end):
+                day_df = by_day.get(day.strftime('%Y-%m-%d'))
+                cache.save(day, day_df.drop(columns=['date']) if day_df is not None else pd.DataFrame())
 
-    def get_top_queries(self, df: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
-        """클릭수 상위 검색어 추출"""
-        return df.nlargest(limit, 'clicks')
+        cached = cache.cached_days(days_in_window)
+        return cache.load(cached), len(cached)
 
-    def get_opportunity_keywords(self, df: pd.DataFrame, limit: int = 10) -> pd.DataFrame:
+    def _fetch_with_cache(self, days: int, dimensions: List[str], max_rows: Optional[int]) -> pd.DataFrame:
         """
-        기회 키워드 찾기 (노출은 많지만 클릭률이 낮은 키워드)
+        일별 파티션 캐시를 이용한 검색 분석 데이터 조회
+
+        캐시된/새로 받은 일별 데이터를 기간 전체 값으로 합산합니다.
+        """
+        start_date, end_date = self._date_range(days)
+        period = f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
+
+        daily, cached_days = self._fetch_daily(start_date, end_date, dimensions)
+        df = aggregate_days(daily, dimensions)
+
+        if df.empty:
+            print(f"⚠️  데이터가 없습니다 ({period})")
+            return pd.DataFrame()
+
+        if max_rows is not None:
+            df = df.head(max_rows)
+
+        print(f"✅ {len(df)}개의 검색 데이터를 수집했습니다. ({cached_days}/{len(window_days(start_date, end_date))}일)")
+        print(f"   기간: {period}")
+        print(f"   🧠 메모리: {memory_report({'search_analytics': df})}")
+
+        return df
+
+    def fetch_cube(self, days: int = 7) -> GSCCube:
+        """
+        query x page x country x device x date 최소 단위 데이터를 한 번에 가져와 큐브 생성
+
+        캐시 디렉토리가 있으면 일별 파티션 캐시를 재사용하므로 확정된 날짜는 다시 요청하지 않습니다.
+        이후 국가/디바이스/페이지별 조합은 GSCCube.rollup()으로 API 호출 없이 만듭니다.
 
         Args:
-            df: 검색 데이터 DataFrame
-            limit: 반환할 키워드 수
+            days: 가져올 일수 (기본: 7일)
 
         Returns:
-            기회 키워드 DataFrame
+            GSCCube (데이터가 없으면 빈 큐브)
+        """
+        start_date, end_date = self._date_range(days)
+        period = f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
+
+        if self.cache_dir:
+            daily, _ = self._fetch_daily(start_date, end_date, CUBE_DIMENSIONS)
+        else:
+            daily = concat_frames(list(self._query_pages(start_date, end_date, CUBE_DIMENSIONS + ['date'])))
+
+        cube = GSCCube.from_daily(daily)
+        del daily
+
+        if cube.empty:
+            print(f"⚠️  데이터가 없습니다 ({period})")
+            return cube
+
+        print(f"✅ GSC 큐브: {len(cube)}행 (query x page x country x device x date)")
+        print(f"   기간: {period}")
+        print(f"   🧠 메모리: {cube.memory_report()}")
+        return cube
+
+    def build_opportunity_index(
+        self,
+        data: SearchData,
+        top_limit: int = 20,
+        opportunity_limit: int = 10,
+        band_limit: int = 10
+    ) -> OpportunityIndex:
+        """
+        한 번의 스캔으로 상위 검색어 / 기회 키워드 / 순위 구간 기회를 함께 계산
+
+        Args:
+            data: 검색 데이터 DataFrame 또는 iter_search_analytics()의 청크 스트림
+            top_limit: 클릭수 상위 검색어 수
+            opportunity_limit: 낮은 CTR 기회 키워드 수
+            band_limit: 순위 구간 기회 키워드 수
+
+        Returns:
+            OpportunityIndex (순위마다 limit개 행만 보관)
+        """
+        return OpportunityIndex.from_data(
+            data, top_limit=top_limit, opportunity_limit=opportunity_limit, band_limit=band_limit
+        )
+
+    def get_top_queries(self, data: SearchData, limit: int = 20) -> pd.DataFrame:
         """
-        # 최소 노출 수 조건 (노출 100 이상)
-        df_filtered = df[df['impressions'] >= 100].copy()
+        클릭수 상위 검색어 추출
 
-        # CTR이 낮은 순서로 정렬
-        opportunities = df_filtered.nsmallest(limit, 'ctr')
+        Args:
+            data: 검색 데이터 DataFrame 또는 iter_search_analytics()의 청크 스트림
+            limit: 반환할 검색어 수
 
-        return opportunities
+        Returns:
+            상위 검색어 DataFrame
+        """
+        return OpportunityIndex.from_data(data, top_limit=limit, opportunity_limit=0, band_limit=0).top_queries()
+
+    def get_opportunity_keywords(self, data: SearchData, limit: int = 10) -> pd.DataFrame:
+        """
+        기회 키워드 찾기 (노출은 많지만 클릭률이 낮은 키워드, 노출 100 이상)
+
+        Args:
+            data: 검색 데이터 DataFrame 또는 iter_search_analytics()의 청크 스트림
+            limit: 반환할 키워드 수
+
+        Returns:
+            기회 키워드 DataFrame
+        """
+        return OpportunityIndex.from_data(data, top_limit=0, opportunity_limit=limit, band_limit=0).opportunities()
 
     def get_page_performance(self, df: pd.DataFrame) -> pd.DataFrame:
         """페이지별 성과 집계"""
         if df.empty:
             return pd.DataFrame()
 
-        page_stats = df.groupby('page').agg({
+        page_stats = df.groupby('page', observed=True).agg({
             'clicks': 'sum',
             'impressions': 'sum',
             'position': 'mean'
@@ -130,7 +309,8 @@ class GSCCollector:
         page_stats['ctr'] = page_stats['clicks'] / page_stats['impressions']
         page_stats = page_stats.sort_values('clicks', ascending=False)
 
-        return page_stats
+        # groupby 합계로 넓어진 int64/float64를 다시 줄임
+        return compact_frame(page_stats)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,153 @@
+"""
+Search Console Cube
+
+query x page x country x device x date 최소 단위 GSC 데이터를 한 번만 받아 압축된 형태로 보관하고,
+필요한 조합(국가별 상위 검색어, 디바이스별 CTR, 페이지별 일별 추이 등)을 groupby 롤업으로 만듭니다.
+어떤 조합을 잘라 보더라도 추가 API 호출이 필요 없습니다.
+
+집계 방식은 aggregate_days()와 같습니다.
+(clicks / impressions 합계, ctr은 합계로 다시 계산, position은 노출 가중 평균)
+
+참고: Search Console은 차원이 많을수록 개인정보 보호를 위해 드문 검색어를 더 많이 생략하므로,
+큐브에서 롤업한 query x page 합계는 query x page만 요청한 값보다 약간 작을 수 있습니다.
+그래서 헤드라인 지표(클릭, 노출, CTR)와 검색어/페이지 순위는 fetch_search_analytics()를 그대로 쓰고,
+큐브는 국가/디바이스/페이지 일별처럼 추가 차원이 필요한 조합에만 씁니다.
+
+사용 예시:
+    cube = collector.fetch_cube(days=7)
+    cube.rollup(['query', 'page'])                 # fetch_search_analytics()와 같은 구조 (합계는 더 작을 수 있음)
+    cube.top_queries_by_country(limit=5)
+    cube.slice(device='MOBILE').rollup(['country'])
+"""
+
+from typing import Iterable, List, Optional, Union
+
+import pandas as pd
+
+from .gsc_cache import GSC_METRIC_COLUMNS, aggregate_days
+from .response_decoder import compact_frame, drop_unused_categories, memory_report
+
+
+# 큐브의 차원 (요청 순서 = 저장 컬럼 순서), 날짜는 별도 'date' 컬럼
+CUBE_DIMENSIONS = ['query', 'page', 'country', 'device']
+
+FilterValue = Union[str, Iterable[str]]
+
+
+class GSCCube:
+    """최소 단위 GSC 데이터와 롤업"""
+
+    def __init__(self, facts: pd.DataFrame):
+        """
+        Args:
+            facts: CUBE_DIMENSIONS + 'date' + 지표 컬럼을 가진 일별 최소 단위 데이터
+                (collector.fetch_cube() 또는 저장소의 gsc_cube 데이터셋)
+        """
+        if facts is None or facts.empty:
+            facts = pd.DataFrame(columns=CUBE_DIMENSIONS + ['date'] + GSC_METRIC_COLUMNS)
+        self.facts = facts
+
+    @classmethod
+    def from_daily(cls, df: pd.DataFrame) -> 'GSCCube':
+        """API/캐시에서 읽은 일별 데이터를 categorical 차원과 int32/float32 지표로 압축해 큐브 생성"""
+        if df is None or df.empty:
+            return cls(None)
+        columns = CUBE_DIMENSIONS + ['date'] + GSC_METRIC_COLUMNS
+        facts = df[columns].reset_index(drop=True)
+        facts['date'] = facts['date'].astype(str)
+        return cls(compact_frame(facts, categorical=CUBE_DIMENSIONS + ['date']))
+
+    def __len__(self) -> int:
+        return len(self.facts)
+
+    @property
+    def empty(self) -> bool:
+        return self.facts.empty
+
+    def memory_report(self) -> str:
+        """큐브 행 수와 메모리 사용량"""
+        return memory_report({'gsc_cube': self.facts})
+
+    def slice(self, **filters: FilterValue) -> 'GSCCube':
+        """
+        차원 값으로 잘라낸 하위 큐브
+
+        Args:
+            **filters: 차원 이름 → 값 또는 값 목록 (예: country='kor', device=['MOBILE', 'TABLET'])
+
+        Returns:
+            조건에 맞는 행만 가진 GSCCube
+        """
+        if not filters or self.empty:
+            return self
+        mask = pd.Series(True, index=self.facts.index)
+        for dimension, values in filters.items():
+            if dimension not in self.facts.columns:
+                raise ValueError(f"Unknown cube dimension: {dimension}")
+            if isinstance(values, str):
+                values = [values]
+            mask &= self.facts[dimension].isin(list(values))
+        return GSCCube(drop_unused_categories(self.facts[mask].reset_index(drop=True)))
+
+    def rollup(self, dimensions: List[str], **filters: FilterValue) -> pd.DataFrame:
+        """
+        차원 조합별 집계
+
+        Args:
+            dimensions: 남길 차원 (예: ['country', 'query'], ['page', 'date'])
+            **filters: slice()와 같은 조건
+
+        Returns:
+            clicks, impressions, ctr, position 컬럼을 가진 DataFrame (클릭 내림차순, 데이터가 없으면 빈 DataFrame)
+        """
+        cube = self.slice(**filters)
+        if cube.empty:
+            return pd.DataFrame()
+        return aggregate_days(cube.facts, list(dimensions))
+
+    def top_queries_by_country(self, limit: int = 10, countries: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        국가별 클릭 상위 검색어
+
+        Args:
+            limit: 국가마다 남길 검색어 수
+            countries: 대상 국가 코드 목록 (기본: 전체)
+
+        Returns:
+            country, query, 지표 컬럼 DataFrame (국가는 총 클릭 순, 국가 안에서는 클릭 순)
+        """
+        filters = {'country': countries} if countries else {}
+        by_query = self.rollup(['country', 'query'], **filters)
+        if by_query.empty:
+            return by_query
+        country_order = self.rollup(['country'], **filters)['country'].astype(str).tolist()
+        top = by_query.groupby('country', observed=True, sort=False).head(limit)
+        top = top.assign(_order=top['country'].astype(str).map({c: i for i, c in enumerate(country_order)}))
+        top = top.sort_values(['_order', 'clicks'], ascending=[True, False], kind='stable')
+        return drop_unused_categories(top.drop(columns=['_order']).reset_index(drop=True))
+
+    def country_performance(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """국가별 성과 (클릭 순, limit개)"""
+        df = self.rollup(['country'])
+        return df.head(limit).reset_index(drop=True) if limit is not None and not df.empty else df
+
+    def device_ctr(self) -> pd.DataFrame:
+        """디바이스별 성과 (CTR 포함, 클릭 순)"""
+        return self.rollup(['device'])
+
+    def page_daily_series(self, pages: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        페이지별 일별 추이
+
+        Args:
+            pages: 대상 페이지 URL 목록 (기본: 전체)
+
+        Returns:
+            page, date, 지표 컬럼 DataFrame (페이지, 날짜 순)
+        """
+        filters = {'page': pages} if pages else {}
+        df = self.rollup(['page', 'date'], **filters)
+        if df.empty:
+            return df
+        # categorical 순서가 아닌 값 순서로 정렬
+        return df.sort_values(['page', 'date'], key=lambda column: column.astype(str), kind='stable').reset_index(drop=True)
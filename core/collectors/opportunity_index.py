@@ -0,0 +1,182 @@
+"""
+Opportunity Index
+
+GSC 검색 데이터를 한 번 훑으면서 여러 순위를 동시에 유지하는 스트리밍 top-k 인덱스입니다.
+순위마다 크기가 limit인 힙만 두므로 메모리는 전체 행 수와 무관하고,
+청크 스트림(iter_search_analytics())이든 전체 DataFrame이든 한 번의 스캔으로 모든 순위가 채워집니다.
+
+- top_clicks: 클릭수 상위 검색어
+- low_ctr: 최소 노출 수 이상 중 CTR이 가장 낮은 검색어 (기회 키워드)
+- position_band: 순위 구간(기본 4~20위, 조금만 올리면 클릭이 크게 늘어나는 구간) 안에서 노출 상위 검색어
+
+동점은 DataFrame.nlargest / nsmallest(keep='first')와 같이 먼저 들어온 행을 남기므로
+전체 DataFrame에 nlargest / nsmallest를 적용한 결과와 같습니다.
+
+사용 예시:
+    index = OpportunityIndex()
+    for chunk in collector.iter_search_analytics(days=7):
+        index.add(chunk)
+    index.top_queries(), index.opportunities(), index.position_band_opportunities()
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 기회 키워드의 최소 노출 수
+MIN_OPPORTUNITY_IMPRESSIONS = 100
+
+# 순위 구간 기회의 기본 범위 (2페이지 상단 ~ 1페이지 하단)
+POSITION_BAND = (4.0, 20.0)
+
+
+class _BoundedRanking:
+    """column 기준 상위(또는 하위) limit개 행만 유지하는 힙"""
+
+    def __init__(self, column: str, limit: int, largest: bool):
+        self.column = column
+        self.limit = limit
+        self.largest = largest
+        # (정렬 키, -입력 순서, 인덱스 라벨, 행 값) - 힙의 맨 앞이 가장 먼저 밀려날 행
+        self._heap: List[Tuple[float, int, object, tuple]] = []
+
+    def offer(self, chunk: pd.DataFrame, mask: np.ndarray, offset: int):
+        """
+        청크에서 mask를 통과한 행을 힙에 반영
+
+        청크 안에서 먼저 limit개 후보만 고른 뒤(O(n)) 힙과 합치므로
+        Python 수준 반복은 청크마다 최대 limit번입니다.
+        """
+        if self.limit <= 0:
+            return
+        keys = chunk[self.column].to_numpy(dtype=np.float64)
+        keys = keys if self.largest else -keys
+        mask = mask & ~np.isnan(keys)
+
+        # 힙이 가득 찼으면 현재 최하위보다 좋은 행만 후보 (동점은 먼저 들어온 행이 이김)
+        if len(self._heap) >= self.limit:
+            mask &= keys > self._heap[0][0]
+
+        positions = np.flatnonzero(mask)
+        if len(positions) > self.limit:
+            positions = self._first_top(positions, keys[positions])
+        if len(positions) == 0:
+            return
+
+        rows = chunk.iloc[positions]
+        for position, label, values in zip(positions, rows.index, rows.itertuples(index=False, name=None)):
+            item = (keys[position], -(offset + int(position)), label, values)
+            if len(self._heap) < self.limit:
+                heapq.heappush(self._heap, item)
+            elif item[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, item)
+
+    def _first_top(self, positions: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """키 상위 limit개의 위치 (경계 동점은 앞선 행 우선, 입력 순서 유지)"""
+        threshold = np.partition(keys, len(keys) - self.limit)[len(keys) - self.limit]
+        above = keys > threshold
+        ties = np.flatnonzero(keys == threshold)[:self.limit - int(above.sum())]
+        above[ties] = True
+        return positions[above]
+
+    def frame(self, columns: List[str], dtypes: Dict[str, object]) -> pd.DataFrame:
+        """순위대로 정렬한 DataFrame (원래 인덱스 라벨과 dtype 유지)"""
+        if not self._heap:
+            return pd.DataFrame()
+        ordered = sorted(self._heap, key=lambda item: (-item[0], -item[1]))
+        df = pd.DataFrame.from_records(
+            [values for _, _, _, values in ordered],
+            columns=columns,
+            index=[label for _, _, label, _ in ordered]
+        )
+        for column, dtype in dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                # 청크마다 카테고리 목록이 다르므로 남은 값만으로 다시 만듦 (drop_unused_categories()와 같은 결과)
+                df[column] = pd.Categorical(df[column])
+            else:
+                df[column] = df[column].astype(dtype)
+        return df
+
+
+class OpportunityIndex:
+    """한 번의 스캔으로 채워지는 GSC 순위 인덱스"""
+
+    def __init__(
+        self,
+        top_limit: int = 20,
+        opportunity_limit: int = 10,
+        band_limit: int = 10,
+        min_impressions: int = MIN_OPPORTUNITY_IMPRESSIONS,
+        position_band: Tuple[float, float] = POSITION_BAND
+    ):
+        """
+        Args:
+            top_limit: 클릭수 상위 검색어 수
+            opportunity_limit: 낮은 CTR 기회 키워드 수
+            band_limit: 순위 구간 기회 키워드 수
+            min_impressions: 기회 키워드의 최소 노출 수
+            position_band: 순위 구간 기회의 (최소, 최대) 순위
+        """
+        self.min_impressions = min_impressions
+        self.position_band = position_band
+        self._top_clicks = _BoundedRanking('clicks', top_limit, largest=True)
+        self._low_ctr = _BoundedRanking('ctr', opportunity_limit, largest=False)
+        self._band = _BoundedRanking('impressions', band_limit, largest=True)
+        self._columns: Optional[List[str]] = None
+        self._dtypes: Dict[str, object] = {}
+        self.rows_seen = 0
+
+    @classmethod
+    def from_data(cls, data, **kwargs) -> 'OpportunityIndex':
+        """
+        DataFrame 또는 청크 스트림으로 인덱스 생성
+
+        Args:
+            data: 검색 데이터 DataFrame 또는 iter_search_analytics()의 청크 스트림
+            **kwargs: OpportunityIndex 생성 인자
+        """
+        index = cls(**kwargs)
+        chunks: Iterable[pd.DataFrame] = [data] if isinstance(data, pd.DataFrame) else data
+        for chunk in chunks:
+            index.add(chunk)
+        return index
+
+    def add(self, chunk: pd.DataFrame):
+        """청크 하나를 모든 순위에 반영 (청크는 보관하지 않음)"""
+        if chunk is None or chunk.empty:
+            return
+        if self._columns is None:
+            self._columns = list(chunk.columns)
+            self._dtypes = dict(chunk.dtypes)
+
+        everything = np.ones(len(chunk), dtype=bool)
+        self._top_clicks.offer(chunk, everything, self.rows_seen)
+
+        impressions = chunk['impressions'].to_numpy()
+        self._low_ctr.offer(chunk, impressions >= self.min_impressions, self.rows_seen)
+
+        low, high = self.position_band
+        position = chunk['position'].to_numpy()
+        self._band.offer(chunk, (position >= low) & (position <= high), self.rows_seen)
+
+        self.rows_seen += len(chunk)
+
+    def _frame(self, ranking: _BoundedRanking) -> pd.DataFrame:
+        if self._columns is None:
+            return pd.DataFrame()
+        return ranking.frame(self._columns, self._dtypes)
+
+    def top_queries(self) -> pd.DataFrame:
+        """클릭수 상위 검색어 (클릭 내림차순)"""
+        return self._frame(self._top_clicks)
+
+    def opportunities(self) -> pd.DataFrame:
+        """노출은 많지만 CTR이 낮은 기회 키워드 (CTR 오름차순)"""
+        return self._frame(self._low_ctr)
+
+    def position_band_opportunities(self) -> pd.DataFrame:
+        """순위 구간 안에서 노출이 많은 검색어 (노출 내림차순)"""
+        return self._frame(self._band)
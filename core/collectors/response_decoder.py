@@ -0,0 +1,280 @@
+"""
+Columnar Response Decoder
+
+GA4 / GSC API 응답을 행마다 딕셔너리를 만들지 않고 컬럼 배열에 바로 채운 뒤
+DataFrame을 한 번에 생성합니다.
+
+- 지표: int32 / float32 NumPy 배열 (행 단위 값은 범위와 정밀도가 충분함)
+- 반복이 많은 문자열 차원(page_path, query, source, device 등): categorical
+
+행 수가 수만 개 이상일 때 dict-per-row 방식(object 문자열 + int64/float64)보다
+CPU 사용이 크게 줄고 메모리는 3배 이상 줄어듭니다.
+집계(groupby sum 등) 결과는 pandas가 int64/float64로 넓히므로 compact_frame()으로 다시 줄입니다.
+(`python -m core.collectors.response_decoder`로 마이크로 벤치마크 실행)
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 값이 반복되는 경향이 있어 categorical로 저장할 차원 컬럼
+CATEGORICAL_COLUMNS = frozenset({
+    'page_path', 'page', 'query', 'source', 'medium', 'device', 'country', 'event_name'
+})
+
+# GSC 응답의 지표 컬럼과 dtype
+GSC_METRICS: List[Tuple[str, str]] = [
+    ('clicks', 'int32'),
+    ('impressions', 'int32'),
+    ('ctr', 'float32'),
+    ('position', 'float32'),
+]
+
+_INT32_MIN, _INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+
+def _dimension_array(name: str, values: List[str], categorical: Iterable[str]):
+    if name in categorical:
+        return pd.Categorical(values)
+    return np.array(values, dtype=object)
+
+
+def decode_ga4_response(
+    response: Any,
+    dimensions: Sequence[str],
+    metrics: Sequence[Tuple[str, str]],
+    categorical: Iterable[str] = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """
+    GA4 RunReportResponse를 DataFrame으로 변환
+
+    proto-plus 래퍼 대신 내부 protobuf 메시지를 직접 읽어 필드 접근 비용을 줄입니다.
+
+    Args:
+        response: RunReportResponse (proto-plus 또는 protobuf 메시지)
+        dimensions: 차원 값 순서대로의 컬럼 이름
+        metrics: 지표 값 순서대로의 (컬럼 이름, dtype) 목록 (예: 'int32', 'float32')
+        categorical: categorical dtype으로 만들 차원 컬럼
+
+    Returns:
+        타입이 지정된 DataFrame (행이 없으면 빈 DataFrame)
+    """
+    pb = type(response).pb(response) if hasattr(type(response), 'pb') else response
+    rows = pb.rows
+    if not rows:
+        return pd.DataFrame()
+
+    dimension_values: List[List[str]] = [[] for _ in dimensions]
+    metric_values: List[List[str]] = [[] for _ in metrics]
+
+    for row in rows:
+        for column, value in zip(dimension_values, row.dimension_values):
+            column.append(value.value)
+        for column, value in zip(metric_values, row.metric_values):
+            column.append(value.value)
+
+    columns: Dict[str, Any] = {}
+    for name, values in zip(dimensions, dimension_values):
+        columns[name] = _dimension_array(name, values, categorical)
+    for (name, dtype), values in zip(metrics, metric_values):
+        # GA4는 지표 값을 문자열로 반환하므로 배열 단위로 한 번에 변환
+        columns[name] = np.array(values, dtype=str).astype(dtype)
+
+    return pd.DataFrame(columns)
+
+
+def decode_gsc_rows(
+    rows: Sequence[Dict[str, Any]],
+    dimensions: Sequence[str],
+    start_row: int = 0,
+    categorical: Iterable[str] = CATEGORICAL_COLUMNS
+) -> pd.DataFrame:
+    """
+    Search Console searchanalytics.query 응답 행을 DataFrame으로 변환
+
+    Args:
+        rows: 응답의 'rows' 목록 ({'keys': [...], 'clicks': ..., ...})
+        dimensions: keys 순서대로의 차원 이름
+        start_row: 첫 행의 전체 결과 기준 행 번호 (인덱스 시작값)
+        categorical: categorical dtype으로 만들 차원 컬럼
+
+    Returns:
+        타입이 지정된 DataFrame (행이 없으면 빈 DataFrame)
+    """
+    count = len(rows)
+    if count == 0:
+        return pd.DataFrame()
+
+    columns: Dict[str, Any] = {}
+    if dimensions:
+        keys_by_dimension = zip(*(row['keys'] for row in rows))
+        for name, values in zip(dimensions, keys_by_dimension):
+            columns[name] = _dimension_array(name, list(values), categorical)
+
+    for name, dtype in GSC_METRICS:
+        columns[name] = np.fromiter((row[name] for row in rows), dtype=dtype, count=count)
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(start_row, start_row + count))
+
+
+def concat_frames(frames: Sequence[pd.DataFrame], ignore_index: bool = False) -> pd.DataFrame:
+    """
+    categorical 컬럼을 유지하며 DataFrame 청크를 합침
+
+    pd.concat은 카테고리 목록이 다른 categorical 컬럼을 object로 바꾸므로,
+    먼저 카테고리를 합집합으로 맞춘 뒤 이어 붙입니다.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True) if ignore_index else frames[0]
+
+    first = frames[0]
+    for column in first.columns:
+        if isinstance(first[column].dtype, pd.CategoricalDtype):
+            categories = pd.api.types.union_categoricals(
+                [frame[column] for frame in frames if column in frame.columns],
+                sort_categories=True
+            ).categories
+            frames = [
+                frame.assign(**{column: frame[column].cat.set_categories(categories)})
+                if column in frame.columns else frame
+                for frame in frames
+            ]
+
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+def compact_frame(df: pd.DataFrame, categorical: Iterable[str] = CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    """
+    집계 등으로 넓어진 dtype을 다시 줄임 (제자리 변경 후 반환)
+
+    - categorical 대상 문자열 컬럼 → category
+    - int64 → int32 (값이 int32 범위 안일 때만)
+    - float64 → float32
+    """
+    categorical = set(categorical)
+    for column in df.columns:
+        series = df[column]
+        dtype = series.dtype
+        if column in categorical and (dtype == object or pd.api.types.is_string_dtype(dtype)) \
+                and not isinstance(dtype, pd.CategoricalDtype):
+            df[column] = series.astype('category')
+        elif dtype == np.int64 and (series.empty or (series.min() >= _INT32_MIN and series.max() <= _INT32_MAX)):
+            df[column] = series.astype(np.int32)
+        elif dtype == np.float64:
+            df[column] = series.astype(np.float32)
+    return df
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """DataFrame 실제 메모리 사용량 (MB, 문자열/카테고리 포함)"""
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def memory_report(frames: Dict[str, pd.DataFrame]) -> str:
+    """
+    프레임별 행 수와 메모리 사용량 요약 문자열
+
+    Args:
+        frames: {이름: DataFrame}
+
+    Returns:
+        예: "pages 50행 0.01 MB, traffic 20행 0.00 MB (합계 0.01 MB)"
+    """
+    parts = []
+    total = 0.0
+    for name, df in frames.items():
+        if df is None:
+            continue
+        size = frame_memory_mb(df)
+        total += size
+        parts.append(f"{name} {len(df):,}행 {size:.2f} MB")
+    if len(parts) > 1:
+        return f"{', '.join(parts)} (합계 {total:.2f} MB)"
+    return ', '.join(parts)
+
+
+def drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """상위 N개 추출 등으로 작아진 DataFrame에서 쓰이지 않는 카테고리 제거"""
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.remove_unused_categories()
+    return df
+
+
+if __name__ == '__main__':
+    """마이크로 벤치마크: dict-per-row 루프 vs 컬럼 디코더"""
+    import timeit
+
+    from google.analytics.data_v1beta.types import DimensionValue, MetricValue, Row, RunReportResponse
+
+    n_rows = 50_000
+    gsc_rows = [
+        {
+            'keys': [f'query {i % 5000}', f'https://example.com/page-{i % 300}'],
+            'clicks': i % 50,
+            'impressions': 100 + i % 900,
+            'ctr': (i % 50) / (100 + i % 900),
+            'position': 1 + (i % 60) / 3
+        }
+        for i in range(n_rows)
+    ]
+
+    def legacy_gsc():
+        records = []
+        for row in gsc_rows:
+            records.append({
+                'query': row['keys'][0],
+                'page': row['keys'][1],
+                'clicks': row['clicks'],
+                'impressions': row['impressions'],
+                'ctr': row['ctr'],
+                'position': row['position']
+            })
+        return pd.DataFrame(records)
+
+    ga4_response = RunReportResponse(rows=[
+        Row(
+            dimension_values=[DimensionValue(value=f'/page-{i % 300}'), DimensionValue(value=f'Title {i % 300}')],
+            metric_values=[MetricValue(value=str(i % 97)), MetricValue(value=str(i % 31)), MetricValue(value='12.5'),
+                           MetricValue(value='0.41'), MetricValue(value='0.59')]
+        )
+        for i in range(n_rows // 5)
+    ])
+    ga4_metrics = [('pageviews', 'int32'), ('sessions', 'int32'), ('avg_session_duration', 'float32'),
+                   ('bounce_rate', 'float32'), ('engagement_rate', 'float32')]
+
+    def legacy_ga4():
+        records = []
+        for row in ga4_response.rows:
+            records.append({
+                'page_path': row.dimension_values[0].value,
+                'page_title': row.dimension_values[1].value,
+                'pageviews': int(row.metric_values[0].value),
+                'sessions': int(row.metric_values[1].value),
+                'avg_session_duration': float(row.metric_values[2].value),
+                'bounce_rate': float(row.metric_values[3].value),
+                'engagement_rate': float(row.metric_values[4].value)
+            })
+        return pd.DataFrame(records)
+
+    benchmarks = [
+        (f'GSC ({n_rows:,} rows)', legacy_gsc, lambda: decode_gsc_rows(gsc_rows, ['query', 'page'])),
+        (f'GA4 ({len(ga4_response.rows):,} rows)', legacy_ga4,
+         lambda: decode_ga4_response(ga4_response, ['page_path', 'page_title'], ga4_metrics)),
+    ]
+
+    print("📊 Response decoder micro-benchmark (best of 5)")
+    for label, legacy, columnar in benchmarks:
+        legacy_time = min(timeit.repeat(legacy, number=1, repeat=5))
+        columnar_time = min(timeit.repeat(columnar, number=1, repeat=5))
+        legacy_mem = legacy().memory_usage(deep=True).sum() / 1024 ** 2
+        columnar_mem = columnar().memory_usage(deep=True).sum() / 1024 ** 2
+        print(f"  {label}")
+        print(f"    dict-per-row: {legacy_time * 1000:8.1f} ms, {legacy_mem:6.1f} MB")
+        print(f"    columnar:     {columnar_time * 1000:8.1f} ms, {columnar_mem:6.1f} MB "
+              f"({legacy_time / columnar_time:.1f}x faster, {legacy_mem / columnar_mem:.1f}x smaller)")
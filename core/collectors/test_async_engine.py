@@ -0,0 +1,163 @@
+"""
+CollectionEngine 테스트
+
+작업별 제한 시간, 전체 마감 시각, 동기/async 작업 혼합 실행을 테스트합니다.
+"""
+
+import asyncio
+import functools
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors.async_engine import CollectionEngine, close_thread_runner
+
+
+def test_hung_call_times_out_and_dependents_are_skipped():
+    """응답 없는 동기 호출은 제한 시간 후 포기하고, 나머지 결과로 계속 진행한다"""
+    release = threading.Event()
+
+    async def _ga4(name):
+        await asyncio.sleep(0.01)
+        return name
+
+    engine = CollectionEngine(call_timeout=0.2)
+    engine.add('gsc', lambda: release.wait(10) and 'gsc')
+    engine.add('ga4', functools.partial(_ga4, 'ga4'))
+    engine.add('trends', lambda gsc: gsc + '-trends', depends_on=['gsc'])
+
+    start = time.perf_counter()
+    result = engine.run()
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert elapsed < 1
+    assert result.results == {'ga4': 'ga4'}
+    assert result.timed_out == ['gsc']
+    assert result.skipped == ['trends']
+
+
+def test_run_deadline_cancels_stragglers():
+    """전체 마감 시각이 지나면 작업별 제한 시간과 무관하게 취소된다"""
+    cancelled = []
+
+    async def _slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append('slow')
+            raise
+
+    engine = CollectionEngine(call_timeout=60, deadline=time.monotonic() + 0.2)
+    engine.add('fast', lambda: 'done')
+    engine.add('slow', _slow)
+
+    result = engine.run()
+
+    assert result.results == {'fast': 'done'}
+    assert result.timed_out == ['slow']
+    assert cancelled == ['slow']
+
+
+def test_task_output_is_grouped_in_registration_order(capsys):
+    """동기/async 작업의 출력은 작업별로 모여 등록 순서대로 출력된다"""
+    async def _async_task():
+        print('async start')
+        await asyncio.sleep(0.05)
+        print('async end')
+
+    def _sync_task():
+        print('sync start')
+        time.sleep(0.02)
+        print('sync end')
+
+    engine = CollectionEngine()
+    engine.add('a', _async_task)
+    engine.add('b', _sync_task)
+    engine.run()
+
+    assert capsys.readouterr().out == 'async start\nasync end\nsync start\nsync end\n'
+
+
+def test_task_timeout_error_without_limit_is_recorded_as_error():
+    """제한 시간이 없을 때 작업이 던진 TimeoutError(소켓 읽기 등)는 오류로 기록하고 나머지 결과는 유지한다"""
+    def _flaky_read():
+        raise socket.timeout('read timed out')
+
+    engine = CollectionEngine()
+    engine.add('gsc', _flaky_read)
+    engine.add('ga4', lambda: 1)
+
+    result = engine.run()
+
+    assert result.results == {'ga4': 1}
+    assert isinstance(result.errors['gsc'], TimeoutError)
+    assert result.timed_out == []
+
+
+def test_task_timeout_error_within_limit_is_not_reported_as_timed_out():
+    """제한 시간 안에 작업이 스스로 던진 TimeoutError는 시간 초과가 아니라 오류다"""
+    async def _read():
+        raise TimeoutError('upstream timeout')
+
+    engine = CollectionEngine(call_timeout=30, deadline=time.monotonic() + 60)
+    engine.add('ga4', _read)
+    engine.add('gsc', lambda: 'gsc')
+
+    result = engine.run()
+
+    assert result.results == {'gsc': 'gsc'}
+    assert isinstance(result.errors['ga4'], TimeoutError)
+    assert result.timed_out == []
+
+
+def test_independent_sync_tasks_overlap_and_dependents_wait():
+    """독립된 동기 작업은 동시에 실행되고, 의존 작업은 선행 작업이 끝난 뒤 결과를 받는다"""
+    # 두 작업이 동시에 실행 중이어야만 barrier를 통과함 (순차 실행이면 BrokenBarrierError)
+    barrier = threading.Barrier(2, timeout=5)
+    engine = CollectionEngine()
+    engine.add('a', lambda: barrier.wait() is not None and 'A')
+    engine.add('b', lambda: barrier.wait() is not None and 'B')
+    engine.add('c', lambda a: a + 'C', depends_on=['a'])
+
+    result = engine.run()
+
+    assert result.errors == {}
+    assert result.results == {'a': 'A', 'b': 'B', 'c': 'AC'}
+    assert list(result.timings) == ['a', 'b', 'c']
+    a, b, c = (result.timings[name] for name in 'abc')
+    assert a.started_at < b.finished_at and b.started_at < a.finished_at
+    assert c.started_at >= a.finished_at
+    assert result.bottleneck == 'c'
+
+
+def test_runs_in_one_thread_reuse_the_event_loop_until_closed():
+    """같은 스레드에서는 close_thread_runner() 전까지 같은 이벤트 루프를 쓰고, 닫을 때 정리 작업을 그 루프에서 실행한다"""
+    async def _loop():
+        return asyncio.get_running_loop()
+
+    cleaned = []
+
+    async def _cleanup():
+        cleaned.append(asyncio.get_running_loop())
+
+    def _run():
+        engine = CollectionEngine()
+        engine.add('loop', _loop)
+        return engine.run().results['loop']
+
+    first, second = _run(), _run()
+    close_thread_runner(_cleanup)
+    third = _run()
+    close_thread_runner()
+
+    assert first is second
+    assert cleaned == [first]
+    assert first.is_closed() and third.is_closed()
+    assert third is not first
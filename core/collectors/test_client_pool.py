@@ -0,0 +1,118 @@
+"""
+Client Pool 테스트
+
+임시 서비스 계정 키로 인증 정보/클라이언트 공유와 HTTP 연결 재사용을 테스트합니다.
+(네트워크 호출 없음)
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors import client_pool
+
+
+def _write_service_account(tmp_path: Path) -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+    path = tmp_path / 'gsc_credentials.json'
+    path.write_text(json.dumps({
+        'type': 'service_account',
+        'client_email': 'agent@example.iam.gserviceaccount.com',
+        'private_key': pem,
+        'private_key_id': 'test',
+        'token_uri': 'https://oauth2.googleapis.com/token'
+    }))
+    return str(path)
+
+
+def test_credentials_and_services_are_shared(tmp_path):
+    """같은 키 파일이면 인증 정보와 서비스 객체를 다시 만들지 않는다"""
+    path = _write_service_account(tmp_path)
+
+    assert client_pool.get_credentials(path, client_pool.GSC_SCOPES) is \
+        client_pool.get_credentials(path, client_pool.GSC_SCOPES)
+
+    service = client_pool.get_searchconsole_service(path)
+    assert client_pool.get_searchconsole_service(path) is service
+
+    request = service.searchanalytics().query(siteUrl='sc-domain:example.com', body={})
+    assert isinstance(request.http, client_pool._AuthorizedHttpPool)
+
+
+def test_http_pool_reuses_idle_connections(monkeypatch):
+    """동시 요청 수만큼만 연결을 만들고 이후에는 재사용한다"""
+    created = []
+    barrier = threading.Barrier(3)
+
+    class _FakeAuthorizedHttp:
+        def __init__(self, credentials, http):
+            created.append(self)
+
+        def request(self, uri, method='GET', **kwargs):
+            if uri == 'concurrent':
+                barrier.wait(timeout=5)
+            return ({'status': '200'}, b'{}')
+
+    monkeypatch.setattr(client_pool.google_auth_httplib2, 'AuthorizedHttp', _FakeAuthorizedHttp)
+    pool = client_pool._AuthorizedHttpPool(credentials=None)
+
+    threads = [threading.Thread(target=pool.request, args=('concurrent',)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for _ in range(10):
+        pool.request('sequential')
+
+    assert len(created) == 3
+
+
+def test_ga4_async_client_is_shared_per_event_loop(tmp_path):
+    """같은 이벤트 루프에서는 async 클라이언트를 다시 만들지 않고, 다른 루프에는 따로 만든다"""
+    path = _write_service_account(tmp_path)
+
+    async def _pair():
+        return client_pool.get_ga4_async_client(path), client_pool.get_ga4_async_client(path)
+
+    runner = asyncio.Runner()
+    first, second = runner.run(_pair())
+    again, _ = runner.run(_pair())
+    other, _ = asyncio.run(_pair())
+    runner.close()
+
+    assert first is second is again
+    assert other is not first
+
+
+def test_closing_ga4_async_clients_releases_the_loop_entry(tmp_path):
+    """루프를 닫기 전에 그 루프의 async 클라이언트를 닫고 캐시에서 뺀다"""
+    path = _write_service_account(tmp_path)
+
+    async def _client():
+        return client_pool.get_ga4_async_client(path)
+
+    runner = asyncio.Runner()
+    first = runner.run(_client())
+    loop = runner.get_loop()
+    runner.run(client_pool.close_ga4_async_clients())
+    second = runner.run(_client())
+    runner.run(client_pool.close_ga4_async_clients())
+    runner.close()
+
+    assert second is not first
+    assert loop not in client_pool._ga4_async_clients
@@ -0,0 +1,131 @@
+"""
+GA4Collector 테스트
+
+실제 GA4 API 호출 없이 batchRunReports 요청 구성과 응답 분리를 테스트합니다.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from google.analytics.data_v1beta.types import (
+    BatchRunReportsResponse,
+    DimensionValue,
+    MetricValue,
+    Row,
+    RunReportResponse,
+)
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors import ga4_collector
+from core.collectors.ga4_collector import GA4Collector
+
+
+class _FakeDataClient:
+    """요청한 차원/지표 수에 맞춰 한 행짜리 리포트를 돌려주는 가짜 클라이언트"""
+
+    def __init__(self, fail_batch: bool = False):
+        self.fail_batch = fail_batch
+        self.batch_calls = []
+        self.single_calls = []
+
+    def _report(self, request):
+        return RunReportResponse(rows=[Row(
+            dimension_values=[DimensionValue(value=f'{d.name}-value') for d in request.dimensions],
+            metric_values=[MetricValue(value=str(i + 1)) for i in range(len(request.metrics))]
+        )])
+
+    def batch_run_reports(self, request):
+        self.batch_calls.append(request)
+        if self.fail_batch:
+            raise RuntimeError('batch rejected')
+        return BatchRunReportsResponse(reports=[self._report(r) for r in request.requests])
+
+    def run_report(self, request):
+        self.single_calls.append(request)
+        return self._report(request)
+
+
+class _FakeAsyncDataClient(_FakeDataClient):
+    """BetaAnalyticsDataAsyncClient처럼 코루틴을 돌려주는 가짜 클라이언트"""
+
+    async def batch_run_reports(self, request):
+        return _FakeDataClient.batch_run_reports(self, request)
+
+    async def run_report(self, request):
+        return _FakeDataClient.run_report(self, request)
+
+
+def _make_collector(client):
+    collector = GA4Collector.__new__(GA4Collector)
+    collector.property_id = '123'
+    collector.client = client
+    return collector
+
+
+def test_fetch_all_uses_single_batch_request():
+    """네 리포트를 한 번의 batchRunReports로 요청하고 개별 메서드와 같은 결과로 나눈다"""
+    client = _FakeDataClient()
+    collector = _make_collector(client)
+
+    results = collector.fetch_all(days=7)
+
+    assert len(client.batch_calls) == 1
+    assert len(client.batch_calls[0].requests) == 4
+    assert client.single_calls == []
+    assert list(results) == ['pages', 'traffic', 'devices', 'events']
+
+    assert results['pages'].equals(collector.fetch_page_performance(days=7))
+    assert results['traffic'].equals(collector.fetch_traffic_sources(days=7))
+    assert results['devices'].equals(collector.fetch_device_breakdown(days=7))
+    assert results['events'].equals(collector.get_conversion_events(days=7))
+
+
+def test_fetch_all_falls_back_to_single_reports():
+    """배치 요청이 실패하면 리포트별 요청으로 대체한다"""
+    client = _FakeDataClient(fail_batch=True)
+
+    results = _make_collector(client).fetch_all(days=7)
+
+    assert len(client.single_calls) == 4
+    assert results['devices'].loc[0, 'device'] == 'deviceCategory-value'
+
+
+def test_fetch_all_async_matches_sync_results():
+    """async 버전도 배치 요청 한 번으로 같은 결과를 만들고, 실패 시 개별 요청으로 대체한다"""
+    collector = _make_collector(_FakeDataClient())
+    expected = collector.fetch_all(days=7)
+
+    client = _FakeAsyncDataClient()
+    results = asyncio.run(collector.fetch_all_async(days=7, client=client))
+    assert len(client.batch_calls) == 1
+    for key, frame in expected.items():
+        assert results[key].equals(frame)
+
+    failing = _FakeAsyncDataClient(fail_batch=True)
+    results = asyncio.run(collector.fetch_all_async(days=7, client=failing))
+    assert len(failing.single_calls) == 4
+    assert results['devices'].loc[0, 'device'] == 'deviceCategory-value'
+
+
+def test_sync_client_is_created_on_first_use(monkeypatch):
+    """동기 클라이언트는 생성자가 아니라 동기 요청을 처음 보낼 때 가져온다"""
+    created = []
+
+    def _get_client(path):
+        created.append(path)
+        return _FakeDataClient()
+
+    monkeypatch.setattr(ga4_collector, 'get_ga4_client', _get_client)
+    collector = GA4Collector('key.json', '123')
+    asyncio.run(collector.fetch_all_async(days=7, client=_FakeAsyncDataClient()))
+
+    assert created == []
+
+    collector.fetch_all(days=7)
+    collector.fetch_page_performance(days=7)
+
+    assert created == ['key.json']
@@ -0,0 +1,138 @@
+"""
+GSCCollector 테스트
+
+실제 Search Console API 호출 없이 페이지네이션과 스트리밍 집계를 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors.gsc_collector import GSCCollector
+
+
+def _make_rows(count: int):
+    return [
+        {
+            'keys': [f'query {i}', f'https://example.com/page-{i % 7}'],
+            'clicks': (i * 37) % 101,
+            'impressions': 50 + (i * 13) % 400,
+            'ctr': ((i * 17) % 89) / 1000,
+            'position': 1 + (i % 40)
+        }
+        for i in range(count)
+    ]
+
+
+class _FakeSearchConsole:
+    """startRow/rowLimit를 흉내 내는 가짜 Search Console 서비스"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.requests = []
+
+    def searchanalytics(self):
+        return self
+
+    def query(self, siteUrl, body):
+        self.requests.append(body)
+        self._body = body
+        return self
+
+    def execute(self):
+        start = self._body['startRow']
+        page = self.rows[start:start + self._body['rowLimit']]
+        return {'rows': page} if page else {}
+
+
+def _make_collector(rows):
+    collector = GSCCollector.__new__(GSCCollector)
+    collector.property_url = 'sc-domain:example.com'
+    collector.cache_dir = None
+    collector.service = _FakeSearchConsole(rows)
+    return collector
+
+
+def test_iter_search_analytics_walks_start_row():
+    """startRow를 페이지 크기만큼 증가시키며 모든 행을 가져온다"""
+    collector = _make_collector(_make_rows(25))
+
+    chunks = list(collector.iter_search_analytics(days=7, page_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [req['startRow'] for req in collector.service.requests] == [0, 10, 20]
+    assert list(pd.concat(chunks).index) == list(range(25))
+
+
+def test_fetch_search_analytics_respects_max_rows():
+    """max_rows를 넘는 행은 요청하지 않는다"""
+    collector = _make_collector(_make_rows(25))
+
+    df = collector.fetch_search_analytics(days=7, max_rows=12)
+
+    assert len(df) == 12
+    assert list(df.columns) == ['query', 'page', 'clicks', 'impressions', 'ctr', 'position']
+
+
+def test_streaming_rankings_match_full_frame():
+    """청크 스트림 기반 top-k 결과가 전체 DataFrame 결과와 같다"""
+    collector = _make_collector(_make_rows(200))
+    full = collector.fetch_search_analytics(days=7)
+
+    stream_top = collector.get_top_queries(collector.iter_search_analytics(page_size=30), limit=20)
+    stream_opp = collector.get_opportunity_keywords(collector.iter_search_analytics(page_size=30), limit=10)
+
+    pd.testing.assert_frame_equal(stream_top, collector.get_top_queries(full, limit=20))
+    pd.testing.assert_frame_equal(stream_opp, collector.get_opportunity_keywords(full, limit=10))
+
+
+class _FakeDailySearchConsole(_FakeSearchConsole):
+    """'date' 차원 요청에 날짜별 행을 돌려주는 가짜 서비스"""
+
+    def __init__(self):
+        super().__init__([])
+        self.available = True
+
+    def execute(self):
+        if not self.available:
+            raise ConnectionError('offline')
+
+        body = self._body
+        days = pd.date_range(body['startDate'], body['endDate']).strftime('%Y-%m-%d')
+        rows = [
+            {'keys': [query, '/home', day], 'clicks': 2, 'impressions': 10 * (i + 1), 'ctr': 0.2 / (i + 1), 'position': 3.0 + i}
+            for day in days
+            for i, query in enumerate(['qr code', 'qr maker'])
+        ]
+        page = rows[body['startRow']:body['startRow'] + body['rowLimit']]
+        return {'rows': page} if page else {}
+
+
+def test_day_cache_fetches_only_volatile_days(tmp_path):
+    """두 번째 실행에서는 아직 확정되지 않은 날짜만 요청하고, 오프라인에서도 캐시로 응답한다"""
+    collector = _make_collector([])
+    collector.service = _FakeDailySearchConsole()
+    collector.cache_dir = str(tmp_path)
+
+    first = collector.fetch_search_analytics(days=7)
+    first_requests = len(collector.service.requests)
+    second = collector.fetch_search_analytics(days=7)
+
+    assert first_requests == 1
+    assert len(collector.service.requests) == 2
+    assert collector.service.requests[-1]['startDate'] == collector.service.requests[-1]['endDate']
+    assert collector.service.requests[0]['dimensions'] == ['query', 'page', 'date']
+    pd.testing.assert_frame_equal(first, second)
+
+    row = first.set_index('query').loc['qr maker']
+    assert row['clicks'] == 16 and row['impressions'] == 160
+    assert row['position'] == 4.0
+
+    collector.service.available = False
+    offline = collector.fetch_search_analytics(days=7)
+    pd.testing.assert_frame_equal(first, offline)
@@ -0,0 +1,118 @@
+"""
+GSCCube 테스트
+
+최소 단위 데이터를 한 번만 받아 국가/디바이스/페이지 조합을 API 호출 없이 롤업하는지 테스트합니다.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors.gsc_collector import GSCCollector
+from core.collectors.gsc_cube import GSCCube
+
+
+def _daily_rows():
+    """(query, page, country, device, date) → clicks, impressions, position"""
+    return [
+        ('qr code', '/', 'kor', 'MOBILE', '2026-01-01', 10, 100, 2.0),
+        ('qr code', '/', 'kor', 'DESKTOP', '2026-01-01', 5, 100, 4.0),
+        ('qr code', '/', 'usa', 'MOBILE', '2026-01-02', 8, 200, 6.0),
+        ('qr maker', '/make', 'usa', 'MOBILE', '2026-01-01', 1, 50, 10.0),
+        ('qr maker', '/make', 'usa', 'DESKTOP', '2026-01-02', 2, 50, 20.0),
+        ('wifi qr', '/wifi', 'jpn', 'TABLET', '2026-01-02', 0, 30, 30.0),
+    ]
+
+
+def _cube() -> GSCCube:
+    rows = _daily_rows()
+    df = pd.DataFrame(rows, columns=['query', 'page', 'country', 'device', 'date', 'clicks', 'impressions', 'position'])
+    df['ctr'] = df['clicks'] / df['impressions']
+    return GSCCube.from_daily(df)
+
+
+def test_rollups_aggregate_like_search_console():
+    """롤업은 합계와 노출 가중 평균 순위로 집계한다"""
+    cube = _cube()
+
+    by_query = cube.rollup(['query', 'page']).set_index('query')
+    devices = cube.device_ctr().set_index('device')
+
+    assert isinstance(cube.facts['country'].dtype, pd.CategoricalDtype)
+    assert cube.facts['clicks'].dtype == 'int32'
+    assert by_query.loc['qr code', 'clicks'] == 23
+    assert by_query.loc['qr code', 'impressions'] == 400
+    assert abs(by_query.loc['qr code', 'position'] - (2 * 100 + 4 * 100 + 6 * 200) / 400) < 1e-5
+    assert abs(devices.loc['MOBILE', 'ctr'] - 19 / 350) < 1e-6
+    assert devices.index.tolist() == ['MOBILE', 'DESKTOP', 'TABLET']
+
+
+def test_country_top_queries_slices_and_daily_series():
+    """국가별 상위 검색어, 조건 슬라이스, 페이지별 일별 추이를 같은 큐브에서 만든다"""
+    cube = _cube()
+
+    top = cube.top_queries_by_country(limit=1)
+    mobile_usa = cube.rollup(['query'], country='usa', device='MOBILE')
+    daily = cube.page_daily_series(pages=['/'])
+
+    assert list(zip(top['country'].astype(str), top['query'].astype(str))) == [
+        ('kor', 'qr code'), ('usa', 'qr code'), ('jpn', 'wifi qr')
+    ]
+    assert dict(zip(mobile_usa['query'].astype(str), mobile_usa['clicks'])) == {'qr code': 8, 'qr maker': 1}
+    assert daily['date'].astype(str).tolist() == ['2026-01-01', '2026-01-02']
+    assert daily['clicks'].tolist() == [15, 8]
+    assert cube.slice(country='bra').rollup(['query']).empty
+
+
+class _FakeCubeSearchConsole:
+    """요청한 차원 순서대로 keys를 돌려주는 가짜 Search Console 서비스"""
+
+    def __init__(self):
+        self.requests = []
+
+    def searchanalytics(self):
+        return self
+
+    def query(self, siteUrl, body):
+        self.requests.append(body)
+        self._body = body
+        return self
+
+    def execute(self):
+        if self._body['startRow'] > 0:
+            return {}
+        start = datetime.strptime(self._body['startDate'], '%Y-%m-%d')
+        end = datetime.strptime(self._body['endDate'], '%Y-%m-%d')
+        rows = []
+        day = start
+        while day <= end:
+            for country, device in [('kor', 'MOBILE'), ('usa', 'DESKTOP')]:
+                values = {'query': 'qr code', 'page': '/', 'country': country, 'device': device,
+                          'date': day.strftime('%Y-%m-%d')}
+                rows.append({'keys': [values[d] for d in self._body['dimensions']],
+                             'clicks': 1, 'impressions': 10, 'ctr': 0.1, 'position': 3.0})
+            day += timedelta(days=1)
+        return {'rows': rows}
+
+
+def test_fetch_cube_reuses_day_cache(tmp_path):
+    """최소 단위 데이터는 한 번만 요청하고, 다음 실행은 확정된 날짜를 캐시에서 읽는다"""
+    collector = GSCCollector.__new__(GSCCollector)
+    collector.property_url = 'sc-domain:example.com'
+    collector.cache_dir = str(tmp_path)
+    collector.service = _FakeCubeSearchConsole()
+    collector._date_range = lambda days: (datetime(2026, 1, 1), datetime(2026, 1, 7))
+
+    cube = collector.fetch_cube(days=7)
+    again = collector.fetch_cube(days=7)
+
+    assert len(collector.service.requests) == 1
+    assert collector.service.requests[0]['dimensions'] == ['query', 'page', 'country', 'device', 'date']
+    assert len(cube) == len(again) == 14
+    assert cube.rollup(['country']).set_index('country')['clicks'].to_dict() == {'kor': 7, 'usa': 7}
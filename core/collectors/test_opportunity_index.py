@@ -0,0 +1,68 @@
+"""
+OpportunityIndex 테스트
+
+한 번의 스캔으로 만든 순위가 전체 DataFrame의 nlargest / nsmallest 결과와 같은지 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors.opportunity_index import OpportunityIndex
+
+
+def _search_data(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    # 값 범위를 좁게 잡아 동점이 많이 생기도록 함
+    clicks = rng.integers(0, 20, rows).astype('int32')
+    impressions = rng.integers(20, 400, rows).astype('int32')
+    return pd.DataFrame({
+        'query': pd.Categorical([f'query {i}' for i in range(rows)]),
+        'page': pd.Categorical([f'/page-{i % 13}' for i in range(rows)]),
+        'clicks': clicks,
+        'impressions': impressions,
+        'ctr': (clicks / impressions).astype('float32'),
+        'position': rng.integers(1, 40, rows).astype('float32')
+    })
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+def _as_plain(df: pd.DataFrame) -> pd.DataFrame:
+    return df.astype({'query': str, 'page': str})
+
+
+def test_single_pass_matches_full_frame_rankings():
+    """청크 스트림 한 번으로 세 가지 순위가 모두 전체 DataFrame 기준 결과와 같다 (동점은 먼저 나온 행)"""
+    df = _search_data(1000)
+
+    index = OpportunityIndex.from_data(_chunks(df, 64), top_limit=20, opportunity_limit=10, band_limit=10)
+
+    band = df[(df['position'] >= 4) & (df['position'] <= 20)]
+    pd.testing.assert_frame_equal(_as_plain(index.top_queries()), _as_plain(df.nlargest(20, 'clicks')))
+    pd.testing.assert_frame_equal(
+        _as_plain(index.opportunities()), _as_plain(df[df['impressions'] >= 100].nsmallest(10, 'ctr'))
+    )
+    pd.testing.assert_frame_equal(
+        _as_plain(index.position_band_opportunities()), _as_plain(band.nlargest(10, 'impressions'))
+    )
+    assert index.rows_seen == 1000
+    assert index.top_queries()['clicks'].dtype == 'int32'
+    assert len(index.top_queries()['query'].cat.categories) == 20
+
+
+def test_empty_and_short_input():
+    """데이터가 없으면 빈 DataFrame, limit보다 적으면 있는 행만 반환한다"""
+    df = _search_data(5)
+
+    assert OpportunityIndex.from_data(iter([])).top_queries().empty
+    assert len(OpportunityIndex.from_data(df, top_limit=20).top_queries()) == 5
@@ -0,0 +1,96 @@
+"""
+Response Decoder 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from google.analytics.data_v1beta.types import DimensionValue, MetricValue, Row, RunReportResponse
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors.response_decoder import (
+    compact_frame, concat_frames, decode_ga4_response, decode_gsc_rows, frame_memory_mb
+)
+
+
+def test_decode_ga4_response_builds_typed_columns():
+    """GA4 응답을 지표 dtype과 categorical 차원으로 변환한다"""
+    response = RunReportResponse(rows=[
+        Row(dimension_values=[DimensionValue(value='google'), DimensionValue(value='organic')],
+            metric_values=[MetricValue(value='12'), MetricValue(value='0.5')]),
+        Row(dimension_values=[DimensionValue(value='(direct)'), DimensionValue(value='(none)')],
+            metric_values=[MetricValue(value='7'), MetricValue(value='0.25')]),
+    ])
+
+    df = decode_ga4_response(response, ['source', 'medium'], [('sessions', 'int64'), ('engagement_rate', 'float64')])
+
+    assert df['source'].tolist() == ['google', '(direct)']
+    assert isinstance(df['source'].dtype, pd.CategoricalDtype)
+    assert df['sessions'].dtype == 'int64'
+    assert df['engagement_rate'].tolist() == [0.5, 0.25]
+
+
+def test_decode_gsc_rows_and_concat_keep_categories():
+    """GSC 청크를 합쳐도 categorical dtype과 행 번호 인덱스가 유지된다"""
+    rows = [
+        {'keys': ['qr code', '/'], 'clicks': 3, 'impressions': 40, 'ctr': 0.075, 'position': 2.5},
+        {'keys': ['qr maker', '/make'], 'clicks': 1, 'impressions': 90, 'ctr': 0.011, 'position': 8.0},
+    ]
+
+    first = decode_gsc_rows(rows[:1], ['query', 'page'], start_row=0)
+    second = decode_gsc_rows(rows[1:], ['query', 'page'], start_row=1)
+    df = concat_frames([first, second])
+
+    assert list(df.index) == [0, 1]
+    assert isinstance(df['query'].dtype, pd.CategoricalDtype)
+    assert df['query'].tolist() == ['qr code', 'qr maker']
+    assert df['clicks'].dtype == 'int32'
+    assert df['position'].dtype == 'float32'
+
+
+def test_compact_frames_use_a_third_of_the_memory():
+    """반복 문자열 차원과 지표를 압축하면 object/int64/float64 프레임보다 3배 이상 작다"""
+    rng = np.random.default_rng(0)
+    n = 20000
+    rows = [
+        {
+            'keys': [f'qr keyword {i % 500}', f'/tools/page-{i % 40}', ['MOBILE', 'DESKTOP', 'TABLET'][i % 3]],
+            'clicks': int(rng.integers(0, 50)),
+            'impressions': int(rng.integers(50, 5000)),
+            'ctr': float(rng.random()),
+            'position': float(rng.uniform(1, 50))
+        }
+        for i in range(n)
+    ]
+    legacy = pd.DataFrame([
+        {'query': r['keys'][0], 'page': r['keys'][1], 'device': r['keys'][2],
+         'clicks': r['clicks'], 'impressions': r['impressions'], 'ctr': r['ctr'], 'position': r['position']}
+        for r in rows
+    ])
+
+    compact = decode_gsc_rows(rows, ['query', 'page', 'device'])
+
+    assert isinstance(compact['device'].dtype, pd.CategoricalDtype)
+    assert frame_memory_mb(legacy) / frame_memory_mb(compact) >= 3
+
+
+def test_compact_frame_narrows_aggregates_within_range():
+    """집계로 넓어진 dtype은 줄이되, int32 범위를 넘는 값은 int64로 둔다"""
+    df = pd.DataFrame({
+        'source': ['google', 'naver'],
+        'sessions': np.array([10, 20], dtype='int64'),
+        'impressions': np.array([1, 2 ** 40], dtype='int64'),
+        'rate': [0.5, 0.25]
+    })
+
+    compact_frame(df)
+
+    assert isinstance(df['source'].dtype, pd.CategoricalDtype)
+    assert df['sessions'].dtype == 'int32'
+    assert df['impressions'].dtype == 'int64'
+    assert df['rate'].dtype == 'float32'
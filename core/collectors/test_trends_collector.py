@@ -0,0 +1,147 @@
+"""
+TrendsCollector 테스트
+
+실제 Google Trends 호출 없이 응답 캐시와 429 재시도를 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pytrends.exceptions import TooManyRequestsError
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.collectors import trends_collector
+from core.collectors.trends_collector import TrendsCollector
+from core.utils.rate_limiter import AdaptiveRateLimiter
+
+
+class _FakeResponse:
+    status_code = 429
+    headers = {'Retry-After': '0'}
+
+
+class _FakeTrendReq:
+    """interest_over_time 호출 수를 세고, 처음 throttle_count번은 429를 던지는 가짜 pytrends"""
+
+    def __init__(self, throttle_count: int = 0):
+        self.throttle_count = throttle_count
+        self.calls = 0
+
+    def build_payload(self, keywords, cat=0, timeframe='today 3-m', geo='', gprop=''):
+        self.keywords = keywords
+
+    def interest_over_time(self):
+        self.calls += 1
+        if self.throttle_count:
+            self.throttle_count -= 1
+            raise TooManyRequestsError('The request failed: Google returned a response with code 429', _FakeResponse())
+        index = pd.date_range('2026-01-04', periods=12, freq='W')
+        return pd.DataFrame({kw: range(i, i + 12) for i, kw in enumerate(self.keywords)}, index=index)
+
+
+def _make_collector(tmp_path, monkeypatch, throttle_count: int = 0):
+    # TrendReq 생성 시 쿠키를 받으러 네트워크에 접속하므로 가짜로 대체
+    monkeypatch.setattr(trends_collector, 'TrendReq', lambda **kwargs: _FakeTrendReq(throttle_count))
+    return TrendsCollector(
+        cache_dir=str(tmp_path),
+        rate_limiter=AdaptiveRateLimiter(rate=100, burst=10)
+    )
+
+
+def test_repeat_requests_are_served_from_cache(tmp_path, monkeypatch):
+    """같은 (키워드, 기간, 지역) 요청은 다시 보내지 않는다"""
+    collector = _make_collector(tmp_path, monkeypatch)
+
+    first = collector.get_interest_over_time(['qr code', 'qr maker'])
+    second = _make_collector(tmp_path, monkeypatch).get_interest_over_time(['qr code', 'qr maker'])
+    collector.get_interest_over_time(['qr code', 'qr maker'], geo='KR')
+
+    assert collector.pytrends.calls == 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_rate_limited_request_is_retried(tmp_path, monkeypatch):
+    """429 응답 후 속도를 낮추고 재시도한다"""
+    collector = _make_collector(tmp_path, monkeypatch, throttle_count=2)
+
+    df = collector.get_interest_over_time(['qr code'])
+
+    assert collector.pytrends.calls == 3
+    assert not df.empty
+    assert collector.rate_limiter.rate < 100
+
+
+def test_keyword_trends_share_one_anchor_scale(tmp_path, monkeypatch):
+    """모든 배치에 기준 키워드를 넣어 같은 척도로 맞추고, 이미 받은 키워드는 다시 요청하지 않는다"""
+    trends_collector.reset_anchor_scales()
+    collector = _make_collector(tmp_path, monkeypatch)
+    keywords = ['anchor', 'k1', 'k2', 'k3', 'k4', 'k5', 'k5']
+
+    result = collector.analyze_keyword_trends(keywords)
+
+    # 기준 1 + 새 키워드 4개씩 → 2회 요청, 중복 키워드는 한 번만 분석
+    assert collector.pytrends.calls == 2
+    assert collector.pytrends.keywords == ['anchor', 'k5']
+    assert sorted(result['keyword']) == ['anchor', 'k1', 'k2', 'k3', 'k4', 'k5']
+    # 기준 키워드 평균(fake: 0..11 → 5.5) = 100
+    anchor_row = result.set_index('keyword').loc['anchor']
+    assert anchor_row['recent_avg'] == pytest.approx(9.5 / 5.5 * 100)
+
+    # 다른 프로덕트가 같은 키워드를 요청하면 저장된 척도를 재사용
+    other = _make_collector(tmp_path / 'other', monkeypatch)
+    again = other.analyze_keyword_trends(['k1', 'k3'], anchor='anchor')
+    assert other.pytrends.calls == 0
+    assert set(again['keyword']) == {'k1', 'k3'}
+
+    trends_collector.reset_anchor_scales()
+
+
+def test_keyword_value_is_stable_across_calls(tmp_path, monkeypatch):
+    """같은 실행에서는 함께 요청한 키워드 구성과 무관하게 같은 키워드가 같은 값을 가진다"""
+    trends_collector.reset_anchor_scales()
+    collector = _make_collector(tmp_path, monkeypatch)
+
+    wide = collector.analyze_keyword_trends(['anchor', 'k1', 'k2']).set_index('keyword')
+    alone = collector.analyze_keyword_trends(['k2'], anchor='anchor').set_index('keyword')
+
+    for column in ('recent_avg', 'max_interest', 'current_interest'):
+        assert alone.loc['k2', column] == pytest.approx(wide.loc['k2', column])
+
+    trends_collector.reset_anchor_scales()
+
+
+def test_anchor_does_not_depend_on_call_order(tmp_path, monkeypatch):
+    """기준 키워드를 넘기면 어느 프로덕트가 먼저 요청하든 같은 척도를 쓰고, 결과에 기준 키워드를 기록한다"""
+    trends_collector.reset_anchor_scales()
+    first = _make_collector(tmp_path / 'a', monkeypatch).analyze_keyword_trends(['k1', 'k2'], anchor='anchor')
+    trends_collector.reset_anchor_scales()
+    _make_collector(tmp_path / 'b', monkeypatch).analyze_keyword_trends(['k3'], anchor='anchor')
+    second = _make_collector(tmp_path / 'c', monkeypatch).analyze_keyword_trends(['k1', 'k2'], anchor='anchor')
+
+    assert set(first['anchor']) == {'anchor'}
+    assert 'anchor' not in set(first['keyword'])
+    pd.testing.assert_frame_equal(first.reset_index(drop=True), second.reset_index(drop=True))
+
+    trends_collector.reset_anchor_scales()
+
+
+def test_cached_batches_are_not_counted_as_requests(tmp_path, monkeypatch, capsys):
+    """응답 캐시에서 읽은 배치는 요청 수에 세지 않는다"""
+    trends_collector.reset_anchor_scales()
+    _make_collector(tmp_path, monkeypatch).analyze_keyword_trends(['anchor', 'k1'])
+    trends_collector.reset_anchor_scales()
+    capsys.readouterr()
+
+    collector = _make_collector(tmp_path, monkeypatch)
+    collector.analyze_keyword_trends(['anchor', 'k1'])
+
+    assert collector.pytrends.calls == 0
+    assert collector.fetch_count == 0
+    assert "요청 0회" in capsys.readouterr().out
+
+    trends_collector.reset_anchor_scales()
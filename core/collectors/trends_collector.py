@@ -4,25 +4,144 @@ Google Trends Data Collector
 Google Trends를 사용하여 검색어 트렌드 데이터를 수집합니다.
 """
 
-import time
-from typing import List, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+from pytrends.exceptions import ResponseError, TooManyRequestsError
 from pytrends.request import TrendReq
 
+from ..utils.disk_cache import TTLDiskCache
+from ..utils.rate_limiter import AdaptiveRateLimiter
+
+
+# 429 응답 시 최대 시도 횟수
+MAX_ATTEMPTS = 4
+
+# 기준 키워드와 함께 요청할 키워드 수 (기준 1 + 4 = 요청당 최대 5개)
+ANCHOR_BATCH_SIZE = 4
+
+# 모든 TrendsCollector가 공유하는 속도 제한기 (Google Trends 제한은 프로세스 단위로 적용됨)
+_shared_rate_limiter = AdaptiveRateLimiter(rate=1.0, burst=3)
+
+
+@dataclass
+class _AnchorScale:
+    """
+    (timeframe, geo, 기준 키워드)별 공통 척도
+
+    Attributes:
+        series: 키워드별 관심도 시계열 (기준 키워드 평균 = 1.0 단위)
+    """
+
+    series: Dict[str, pd.Series] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# 실행(프로세스) 내 모든 프로덕트가 공유하는 척도 (중복 키워드는 한 번만 요청)
+_anchor_scales: Dict[Tuple[str, str, str], _AnchorScale] = {}
+_anchor_scales_lock = threading.Lock()
+
+
+def _anchor_scale(timeframe: str, geo: str, anchor: str) -> _AnchorScale:
+    with _anchor_scales_lock:
+        return _anchor_scales.setdefault((timeframe, geo, anchor), _AnchorScale())
+
+
+def reset_anchor_scales() -> None:
+    """공유 척도 초기화 (새 실행 시작 또는 테스트용)"""
+    with _anchor_scales_lock:
+        _anchor_scales.clear()
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """429 (Too Many Requests) 응답 여부"""
+    if isinstance(error, TooManyRequestsError):
+        return True
+    response = getattr(error, 'response', None)
+    return isinstance(error, ResponseError) and getattr(response, 'status_code', None) == 429
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, 'response', None)
+    value = getattr(response, 'headers', {}).get('Retry-After') if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
 
 class TrendsCollector:
     """Google Trends 데이터 수집기"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        cache_ttl_hours: float = 24,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None
+    ):
         """
         pytrends 클라이언트 초기화
+
+        Args:
+            cache_dir: 응답 캐시 디렉토리 (없으면 캐시 미사용)
+            cache_ttl_hours: 캐시 유효 시간 (시간)
+            rate_limiter: 요청 속도 제한기 (기본: 프로세스 공유 제한기)
         """
         self.pytrends = TrendReq(hl='en-US', tz=360)
+        self.cache = TTLDiskCache(cache_dir, cache_ttl_hours * 3600) if cache_dir else None
+        self.rate_limiter = rate_limiter or _shared_rate_limiter
+        # pytrends는 build_payload와 조회 사이에 상태를 가지므로 한 번에 하나씩 요청
+        self._request_lock = threading.Lock()
+        # 캐시가 아닌 Google Trends로 실제로 보낸 요청 수 (재시도 포함하지 않음)
+        self.fetch_count = 0
+
+    def _request(self, kind: str, keywords: List[str], timeframe: str, geo: str, fetch: Callable[[], Any]) -> Any:
+        """
+        캐시 조회 → 속도 제한 → 요청 → 캐시 저장
+
+        429 응답을 받으면 속도를 줄이고 MAX_ATTEMPTS까지 재시도합니다.
+
+        Args:
+            kind: 요청 종류 (캐시 키에 포함)
+            keywords: 검색어 목록
+            timeframe: 기간
+            geo: 지역 코드 ('' = 전 세계)
+            fetch: build_payload 이후 결과를 반환하는 함수
+        """
+        key = TTLDiskCache.make_key(kind, tuple(keywords), timeframe, geo)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            self.rate_limiter.acquire()
+            try:
+                with self._request_lock:
+                    self.pytrends.build_payload(keywords, cat=0, timeframe=timeframe, geo=geo, gprop='')
+                    result = fetch()
+            except Exception as e:
+                if _is_rate_limited(e) and attempt < MAX_ATTEMPTS:
+                    self.rate_limiter.on_throttle(_retry_after(e))
+                    print(f"⏳ Trends 429 응답, 속도를 낮춰 재시도합니다 ({attempt}/{MAX_ATTEMPTS - 1})")
+                    continue
+                raise
+
+            self.rate_limiter.on_success()
+            with self._request_lock:
+                self.fetch_count += 1
+            if self.cache:
+                self.cache.set(key, result)
+            return result
 
     def get_interest_over_time(
         self,
         keywords: List[str],
-        timeframe: str = 'today 3-m'
+        timeframe: str = 'today 3-m',
+        geo: str = ''
     ) -> pd.DataFrame:
         """
         검색어의 시간별 인기도 추이
@@ -30,6 +149,7 @@ class TrendsCollector:
         Args:
             keywords: 검색어 리스트 (최대 5개)
             timeframe: 기간 ('today 3-m', 'today 12-m', 'today 5-y')
+            geo: 지역 코드 ('' = 전 세계)
 
         Returns:
             시간별 인기도 DataFrame
@@ -41,16 +161,11 @@ class TrendsCollector:
         keywords = keywords[:5]
 
         try:
-            self.pytrends.build_payload(
-                keywords,
-                cat=0,
-                timeframe=timeframe,
-                geo='',  # 전 세계
-                gprop=''
+            df = self._request(
+                'interest_over_time', keywords, timeframe, geo,
+                self.pytrends.interest_over_time
             )
 
-            df = self.pytrends.interest_over_time()
-
             if df.empty:
                 print(f"⚠️  Trends: '{keywords}' 데이터 없음")
                 return pd.DataFrame()
@@ -66,19 +181,23 @@ class TrendsCollector:
             print(f"❌ Trends 수집 실패 ({keywords}): {str(e)}")
             return pd.DataFrame()
 
-    def get_related_queries(self, keyword: str) -> dict:
+    def get_related_queries(self, keyword: str, timeframe: str = 'today 3-m', geo: str = '') -> dict:
         """
         관련 검색어 및 급상승 검색어
 
         Args:
             keyword: 메인 검색어
+            timeframe: 기간
+            geo: 지역 코드 ('' = 전 세계)
 
         Returns:
             {'rising': DataFrame, 'top': DataFrame}
         """
         try:
-            self.pytrends.build_payload([keyword], cat=0, timeframe='today 3-m')
-            related = self.pytrends.related_queries()
+            related = self._request(
+                'related_queries', [keyword], timeframe, geo,
+                self.pytrends.related_queries
+            )
 
             result = related.get(keyword, {})
 
@@ -99,78 +218,114 @@ class TrendsCollector:
     def analyze_keyword_trends(
         self,
         keywords: List[str],
-        timeframe: str = 'today 3-m'
+        timeframe: str = 'today 3-m',
+        geo: str = '',
+        anchor: Optional[str] = None
     ) -> pd.DataFrame:
         """
         여러 키워드의 트렌드를 분석하여 요약
 
+        Google Trends는 요청마다 0-100으로 다시 정규화하므로, 모든 배치에 같은
+        기준(anchor) 키워드를 넣고 기준 키워드의 평균으로 나눠 하나의 척도로 맞춥니다.
+        척도는 기준 키워드별로 고정(기준 키워드 평균 = 100)이므로 호출이나 키워드 구성과 무관하게
+        같은 키워드는 같은 값을 가집니다. 같은 실행에서 이미 받아온 키워드는 다시 요청하지 않습니다.
+
         Args:
             keywords: 분석할 키워드 리스트
             timeframe: 기간
+            geo: 지역 코드 ('' = 전 세계)
+            anchor: 기준 키워드 (실행 전체에서 같은 값을 넘겨야 프로덕트 간 비교 가능, 없으면 keywords[0])
 
         Returns:
-            키워드별 트렌드 요약 DataFrame
+            키워드별 트렌드 요약 DataFrame (모든 값은 기준 키워드 평균 = 100인 척도, 100을 넘을 수 있음,
+            'anchor' 컬럼에 기준 키워드 기록)
         """
-        all_trends = []
-
-        # 5개씩 나누어 처리 (Google Trends 제한)
-        for i in range(0, len(keywords), 5):
-            batch = keywords[i:i+5]
-            df = self.get_interest_over_time(batch, timeframe)
-
-            if df.empty:
-                continue
-
-            # 각 키워드별 통계 계산
-            for keyword in batch:
-                if keyword not in df.columns:
-                    continue
-
-                series = df[keyword]
-
-                # 최근 값과 과거 값 비교하여 트렌드 계산
-                recent_avg = series.tail(4).mean()  # 최근 4주
-                past_avg = series.head(8).mean()    # 과거 8주
-
-                if past_avg > 0:
-                    trend_change = ((recent_avg - past_avg) / past_avg) * 100
-                else:
-                    trend_change = 0
-
-                all_trends.append({
-                    'keyword': keyword,
-                    'recent_avg': recent_avg,
-                    'past_avg': past_avg,
-                    'trend_change_pct': trend_change,
-                    'max_interest': series.max(),
-                    'current_interest': series.iloc[-1] if len(series) > 0 else 0
-                })
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return pd.DataFrame()
 
-            # API 제한 방지를 위한 딜레이
-            time.sleep(1)
+        anchor = anchor or keywords[0]
+        scale = _anchor_scale(timeframe, geo, anchor)
+        with scale.lock:
+            pending = [kw for kw in keywords if kw not in scale.series and kw != anchor]
+            if anchor not in scale.series and not pending:
+                pending = [anchor]
+
+        # 네트워크 요청 중에는 척도 잠금을 잡지 않음 (다른 프로덕트의 요청과 동시에 진행)
+        fetches_before = self.fetch_count
+        # 기준 키워드 1개 + 새 키워드 4개씩 (Google Trends 요청당 최대 5개)
+        for i in range(0, len(pending), ANCHOR_BATCH_SIZE):
+            batch = [kw for kw in pending[i:i + ANCHOR_BATCH_SIZE] if kw != anchor]
+            df = self.get_interest_over_time([anchor] + batch, timeframe, geo)
+            with scale.lock:
+                self._store_relative_series(scale, df, anchor, batch)
+
+        reused = len(keywords) - len(pending)
+        print(f"   Trends: 요청 {self.fetch_count - fetches_before}회, 재사용 {reused}개 키워드 (기준: '{anchor}')")
+
+        with scale.lock:
+            available = [kw for kw in keywords if kw in scale.series]
+            if not available:
+                return pd.DataFrame()
+            relative = pd.concat([scale.series[kw] for kw in available], axis=1, join='inner')
 
-        if not all_trends:
+        # 기준 키워드 평균 = 100인 실행 공통 척도 (호출마다 다시 정규화하지 않으므로 프로덕트 간 비교 가능)
+        values = relative.to_numpy(dtype=float) * 100.0
+        if values.size == 0:
             return pd.DataFrame()
 
-        result_df = pd.DataFrame(all_trends)
+        # 최근 4주 vs 과거 8주 비교 (벡터 연산)
+        recent_avg = values[-4:].mean(axis=0)
+        past_avg = values[:8].mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend_change = np.where(past_avg > 0, (recent_avg - past_avg) / past_avg * 100, 0.0)
+
+        result_df = pd.DataFrame({
+            'keyword': available,
+            'anchor': anchor,
+            'recent_avg': recent_avg,
+            'past_avg': past_avg,
+            'trend_change_pct': trend_change,
+            'max_interest': values.max(axis=0),
+            'current_interest': values[-1]
+        })
         result_df = result_df.sort_values('trend_change_pct', ascending=False)
 
         print(f"✅ Trends: {len(result_df)}개 키워드 트렌드 분석 완료")
         return result_df
 
-    def get_regional_interest(self, keyword: str) -> pd.DataFrame:
+    def _store_relative_series(self, scale: '_AnchorScale', df: pd.DataFrame, anchor: str, batch: List[str]) -> None:
+        """배치 결과를 기준 키워드 평균 대비 값으로 바꿔 저장 (scale.lock을 잡은 상태에서 호출)"""
+        if df.empty or anchor not in df.columns:
+            return
+
+        anchor_mean = float(df[anchor].mean())
+        if anchor_mean <= 0:
+            print(f"⚠️  Trends: 기준 키워드 '{anchor}' 관심도가 0이라 {batch} 배치를 척도에 맞출 수 없습니다")
+            return
+
+        columns = [anchor] + [kw for kw in batch if kw in df.columns]
+        relative = df[columns].astype(float) / anchor_mean
+        for keyword in columns:
+            scale.series.setdefault(keyword, relative[keyword])
+
+    def get_regional_interest(self, keyword: str, timeframe: str = 'today 3-m', geo: str = '') -> pd.DataFrame:
         """
         지역별 인기도
 
         Args:
             keyword: 검색어
+            timeframe: 기간
+            geo: 지역 코드 ('' = 전 세계)
 
         Returns:
             지역별 인기도 DataFrame
         """
         try:
-            self.pytrends.build_payload([keyword], cat=0, timeframe='today 3-m')
-            df = self.pytrends.interest_by_region(resolution='COUNTRY', inc_low_vol=True, inc_geo_code=False)
+            df = self._request(
+                'interest_by_region', [keyword], timeframe, geo,
+                lambda: self.pytrends.interest_by_region(resolution='COUNTRY', inc_low_vol=True, inc_geo_code=False)
+            )
 
             if df.empty:
                 return pd.DataFrame()
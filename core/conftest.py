@@ -0,0 +1,61 @@
+"""
+공용 테스트 픽스처
+
+Gemini를 호출하는 테스트가 함께 쓰는 가짜 genai.Client와, 실제 생성자로 ComparativeAnalyzer를 만드는 팩토리입니다.
+"""
+
+import threading
+from typing import Callable, Optional
+
+import pytest
+
+from core.analyzers.comparative_analyzer import ComparativeAnalyzer
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeGenAI:
+    """
+    받은 요청을 기록하고 정해진 응답을 돌려주는 가짜 genai.Client
+
+    Args:
+        text: 응답 텍스트
+        respond: 프롬프트를 받아 응답 텍스트를 돌려주는 함수 (주면 text 대신 사용, 예외를 던지면 그대로 전파)
+    """
+
+    def __init__(self, text: str = '응답', respond: Optional[Callable[[str], str]] = None):
+        self.text = text
+        self.respond = respond
+        self.calls = []
+        self.models = self
+        self._lock = threading.Lock()
+
+    @property
+    def prompts(self) -> list:
+        return [contents for _, contents, _ in self.calls]
+
+    @property
+    def configs(self) -> list:
+        return [config for _, _, config in self.calls]
+
+    def generate_content(self, model, contents, config=None):
+        with self._lock:
+            self.calls.append((model, contents, config))
+        return FakeResponse(self.respond(contents) if self.respond else self.text)
+
+
+@pytest.fixture
+def fake_genai():
+    """FakeGenAI 클래스 (fake_genai(text=...) 또는 fake_genai(respond=...)로 생성)"""
+    return FakeGenAI
+
+
+@pytest.fixture
+def make_analyzer():
+    """가짜 클라이언트를 주입해 실제 생성자로 ComparativeAnalyzer를 만드는 팩토리"""
+    def _make(client: Optional[FakeGenAI] = None, **options) -> ComparativeAnalyzer:
+        return ComparativeAnalyzer(api_key=None, client=client or FakeGenAI(), **options)
+    return _make
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List, Optional
 from google import genai
 
+from ..utils.llm_cache import LLMResponseCache, generate_text, get_llm_cache
+from .action_sidecar import load_action_sidecar
 from .models import Action
 
 
@@ -29,17 +31,25 @@ class ActionExtractor:
     ```
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        llm_cache: Optional[LLMResponseCache] = None,
+        client: Optional[genai.Client] = None
+    ):
         """
         Args:
             api_key: Google Gemini API Key (Gemini API fallback용, 선택사항)
+            llm_cache: Gemini 응답 캐시 (없으면 configure_llm_cache()로 설정한 공유 캐시)
+            client: 사용할 Gemini 클라이언트 (없으면 api_key로 생성, 테스트에서 가짜 클라이언트 주입용)
         """
         self.api_key = api_key
-        if api_key:
-            self.client = genai.Client(api_key=api_key)
+        self.llm_cache = llm_cache if llm_cache is not None else get_llm_cache()
+        if client is None and api_key:
+            client = genai.Client(api_key=api_key)
+        self.client = client
+        if client is not None:
             self.model_id = 'gemini-2.0-flash'
-        else:
-            self.client = None
 
     def extract_from_report(self, report_path: str) -> List[Action]:
         """
@@ -50,6 +60,12 @@ class ActionExtractor:
         if not report_file.exists():
             raise FileNotFoundError(f"Report file not found: {report_path}")
 
+        # 0. JSON 모드 분석이 남긴 사이드카가 있으면 파싱 없이 바로 로드
+        actions = load_action_sidecar(report_path)
+        if actions is not None:
+            print(f"✅ 액션 사이드카에서 액션 로드 ({len(actions)}개, 리포트 파싱 생략)")
+            return actions
+
         # 파일 읽기
         with open(report_file, "r", encoding="utf-8") as f:
             content = f.read()
@@ -403,14 +419,12 @@ class ActionExtractor:
 JSON만 출력하세요."""
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
+            # 같은 리포트로 다시 실행하면 저장된 응답을 재사용
+            response_text = generate_text(self.client, self.model_id, prompt, cache=self.llm_cache)
 
             # JSON 파싱
             import json
-            json_text = response.text.strip()
+            json_text = response_text.strip()
             # ```json ... ``` 제거
             json_text = re.sub(r'^```json\s*|\s*```$', '', json_text, flags=re.MULTILINE)
 
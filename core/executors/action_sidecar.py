@@ -0,0 +1,76 @@
+"""
+Action Sidecar
+
+JSON 모드 분석이 돌려준 액션 목록을 리포트 옆의 사이드카 파일(<리포트 이름>.actions.json)로 저장하고 읽습니다.
+ActionExtractor는 사이드카가 있으면 리포트를 파싱하지 않고 액션을 바로 불러옵니다.
+"""
+
+import json
+import os
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .models import Action
+
+
+SIDECAR_SUFFIX = '.actions.json'
+
+_ACTION_FIELDS = {f.name for f in fields(Action)}
+
+
+def sidecar_path(report_path: str) -> Path:
+    """리포트 경로에 대응하는 사이드카 경로 (예: 2024-01-01_report.md → 2024-01-01_report.actions.json)"""
+    report = Path(report_path)
+    return report.with_name(report.stem + SIDECAR_SUFFIX)
+
+
+def write_action_sidecar(report_path: str, records: List[Dict[str, Any]]) -> Path:
+    """
+    액션 목록을 사이드카 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        report_path: 리포트 파일 경로
+        records: Action 필드 딕셔너리 리스트
+
+    Returns:
+        사이드카 파일 경로
+    """
+    path = sidecar_path(report_path)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def remove_action_sidecar(report_path: str) -> None:
+    """이전 실행이 남긴 사이드카 삭제 (마크다운 모드로 리포트를 다시 쓸 때 오래된 액션을 읽지 않도록)"""
+    sidecar_path(report_path).unlink(missing_ok=True)
+
+
+def load_action_sidecar(report_path: str) -> Optional[List[Action]]:
+    """
+    사이드카 파일에서 액션 로드
+
+    Returns:
+        액션 리스트 (사이드카가 없거나 읽을 수 없으면 None, 검증에 실패한 항목은 건너뜀)
+    """
+    path = sidecar_path(report_path)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  액션 사이드카를 읽을 수 없습니다 ({path.name}): {e}")
+        return None
+
+    actions = []
+    for record in records:
+        try:
+            actions.append(Action(**{key: value for key, value in record.items() if key in _ACTION_FIELDS}))
+        except (TypeError, ValueError) as e:
+            print(f"   ⚠️  사이드카 액션 스킵 ({record.get('id')}): {e}")
+    return actions
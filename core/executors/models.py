@@ -9,6 +9,17 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 
 
+# 허용하는 우선순위 / 액션 타입
+VALID_PRIORITIES = ["high", "medium", "low"]
+VALID_ACTION_TYPES = [
+    "update_meta_title",
+    "update_meta_description",
+    "add_internal_link",
+    "update_canonical_url",
+    "update_og_tags"
+]
+
+
 @dataclass
 class Action:
     """
@@ -40,19 +51,11 @@ class Action:
 
     def __post_init__(self):
         """유효성 검증"""
-        valid_priorities = ["high", "medium", "low"]
-        if self.priority.lower() not in valid_priorities:
-            raise ValueError(f"Invalid priority: {self.priority}. Must be one of {valid_priorities}")
+        if self.priority.lower() not in VALID_PRIORITIES:
+            raise ValueError(f"Invalid priority: {self.priority}. Must be one of {VALID_PRIORITIES}")
 
-        valid_action_types = [
-            "update_meta_title",
-            "update_meta_description",
-            "add_internal_link",
-            "update_canonical_url",
-            "update_og_tags"
-        ]
-        if self.action_type not in valid_action_types:
-            raise ValueError(f"Invalid action_type: {self.action_type}. Must be one of {valid_action_types}")
+        if self.action_type not in VALID_ACTION_TYPES:
+            raise ValueError(f"Invalid action_type: {self.action_type}. Must be one of {VALID_ACTION_TYPES}")
 
 
 @dataclass
@@ -0,0 +1,9 @@
+"""
+Local Storage
+
+수집 결과를 로컬에 보관하고 API 호출 없이 다시 읽는 모듈들을 포함합니다.
+"""
+
+from .metrics_store import MetricsStore
+
+__all__ = ["MetricsStore"]
@@ -0,0 +1,463 @@
+"""
+Local Metrics Store
+
+collect_product_data()가 수집한 GSC / GA4 / Trends / AdSense 결과를
+프로덕트 / 데이터셋 / 스냅샷 날짜 단위의 Parquet 파일로 보관합니다.
+
+한 번 저장된 스냅샷은 API 호출 없이 다시 읽을 수 있으므로,
+이전 실행과의 비교나 몇 달치 이력 분석을 오프라인으로 할 수 있습니다.
+
+디렉토리 구조:
+    <data_dir>/<product_id>/<dataset>/<YYYY-MM-DD>.parquet
+
+데이터셋:
+    gsc_top_queries, gsc_opportunities, gsc_position_opportunities, gsc_page_performance,
+    gsc_country_performance, gsc_device_performance, gsc_cube (query x page x country x device x date),
+    ga4_pages, ga4_traffic, ga4_devices, ga4_events,
+    trends, adsense
+"""
+
+import hashlib
+import json
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..collectors.response_decoder import concat_frames, drop_unused_categories
+
+
+# 데이터셋 이름 → (수집 데이터 키, 하위 키)
+DATASETS = {
+    'gsc_top_queries': ('gsc', 'top_queries'),
+    'gsc_opportunities': ('gsc', 'opportunities'),
+    'gsc_position_opportunities': ('gsc', 'position_opportunities'),
+    'gsc_page_performance': ('gsc', 'page_performance'),
+    'gsc_country_performance': ('gsc', 'country_performance'),
+    'gsc_device_performance': ('gsc', 'device_performance'),
+    'gsc_cube': ('gsc', 'cube'),
+    'ga4_pages': ('ga4', 'pages'),
+    'ga4_traffic': ('ga4', 'traffic'),
+    'ga4_devices': ('ga4', 'devices'),
+    'ga4_events': ('ga4', 'events'),
+    'trends': ('trends', None),
+    'adsense': ('adsense', None),
+}
+
+SOURCES = ('gsc', 'ga4', 'trends', 'adsense')
+
+DateLike = Union[str, date, datetime]
+
+
+def _day_key(value: Optional[DateLike]) -> str:
+    """날짜 값을 'YYYY-MM-DD' 문자열로 변환 (None이면 오늘)"""
+    if value is None:
+        return date.today().strftime('%Y-%m-%d')
+    if isinstance(value, str):
+        return value
+    return value.strftime('%Y-%m-%d')
+
+
+class MetricsStore:
+    """프로덕트별 수집 결과를 날짜 단위로 보관하는 로컬 저장소"""
+
+    def __init__(self, data_dir: str):
+        """
+        Args:
+            data_dir: 저장소 루트 디렉토리
+        """
+        self.data_dir = Path(data_dir)
+
+    def _dataset_dir(self, product_id: str, dataset: str) -> Path:
+        if dataset not in DATASETS:
+            raise ValueError(f"Unknown dataset: {dataset}")
+        return self.data_dir / product_id / dataset
+
+    def path_for(self, product_id: str, dataset: str, snapshot_date: Optional[DateLike] = None) -> Path:
+        """스냅샷 파일 경로"""
+        return self._dataset_dir(product_id, dataset) / f"{_day_key(snapshot_date)}.parquet"
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def save(
+        self,
+        product_id: str,
+        dataset: str,
+        df: pd.DataFrame,
+        snapshot_date: Optional[DateLike] = None
+    ) -> Path:
+        """
+        데이터셋 하나의 스냅샷 저장 (같은 날 다시 저장하면 덮어씀)
+
+        다른 프로세스가 읽는 중에도 깨진 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체합니다.
+
+        Args:
+            product_id: 프로덕트 식별자
+            dataset: 데이터셋 이름 (DATASETS 참고)
+            df: 저장할 DataFrame
+            snapshot_date: 스냅샷 날짜 (기본: 오늘)
+
+        Returns:
+            저장된 파일 경로
+        """
+        path = self.path_for(product_id, dataset, snapshot_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        drop_unused_categories(df.reset_index(drop=True)).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def save_product_data(
+        self,
+        data: Dict,
+        snapshot_date: Optional[DateLike] = None,
+        sources: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        collect_product_data() 결과 전체를 저장 (수집되지 않은 소스는 건너뜀)
+
+        수집된 소스에서 비어 있거나 빠진 데이터셋은 같은 날짜에 이전에 저장한 파일을 지웁니다
+        (같은 날 재실행에서 리포트가 비어 돌아왔을 때 이전 데이터가 새 데이터와 섞이지 않도록).
+
+        Args:
+            data: collect_product_data()가 반환한 딕셔너리
+            snapshot_date: 스냅샷 날짜 (기본: 오늘)
+            sources: 저장할 소스 (기본: 전체)
+
+        Returns:
+            저장한 데이터셋 이름 목록
+        """
+        saved = []
+        for dataset, (source, key) in DATASETS.items():
+            if sources is not None and source not in sources:
+                continue
+            value = data.get(source)
+            if value is None:
+                continue
+            if key is not None:
+                value = value.get(key)
+
+            if isinstance(value, dict):
+                value = pd.DataFrame([value])
+            if not isinstance(value, pd.DataFrame) or value.empty:
+                self.path_for(data['id'], dataset, snapshot_date).unlink(missing_ok=True)
+                continue
+
+            self.save(data['id'], dataset, value, snapshot_date)
+            saved.append(dataset)
+
+        return saved
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def products(self) -> List[str]:
+        """저장된 프로덕트 목록"""
+        if not self.data_dir.exists():
+            return []
+        return sorted(p.name for p in self.data_dir.iterdir() if p.is_dir())
+
+    def snapshot_dates(self, product_id: str, dataset: Optional[str] = None) -> List[str]:
+        """
+        저장된 스냅샷 날짜 목록 (오름차순)
+
+        Args:
+            product_id: 프로덕트 식별자
+            dataset: 데이터셋 이름 (없으면 모든 데이터셋의 날짜 합집합)
+        """
+        datasets = [dataset] if dataset else list(DATASETS)
+        dates = set()
+        for name in datasets:
+            directory = self._dataset_dir(product_id, name)
+            if directory.exists():
+                dates.update(path.stem for path in directory.glob('*.parquet'))
+        return sorted(dates)
+
+    def load(
+        self,
+        product_id: str,
+        dataset: str,
+        snapshot_date: Optional[DateLike] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        스냅샷 하나 읽기
+
+        Args:
+            product_id: 프로덕트 식별자
+            dataset: 데이터셋 이름
+            snapshot_date: 스냅샷 날짜 (없으면 가장 최근 스냅샷)
+
+        Returns:
+            DataFrame (스냅샷이 없으면 None)
+        """
+        if snapshot_date is None:
+            dates = self.snapshot_dates(product_id, dataset)
+            if not dates:
+                return None
+            snapshot_date = dates[-1]
+
+        path = self.path_for(product_id, dataset, snapshot_date)
+        if not path.exists():
+            return None
+        return pd.read_parquet(path)
+
+    def history(
+        self,
+        product_id: str,
+        dataset: str,
+        start_date: Optional[DateLike] = None,
+        end_date: Optional[DateLike] = None
+    ) -> pd.DataFrame:
+        """
+        기간 내 모든 스냅샷을 'snapshot_date' 컬럼과 함께 합쳐서 반환
+
+        Args:
+            product_id: 프로덕트 식별자
+            dataset: 데이터셋 이름
+            start_date: 시작 날짜 (포함, 없으면 처음부터)
+            end_date: 종료 날짜 (포함, 없으면 끝까지)
+
+        Returns:
+            스냅샷을 이어 붙인 DataFrame (없으면 빈 DataFrame)
+        """
+        first = _day_key(start_date) if start_date is not None else None
+        last = _day_key(end_date) if end_date is not None else None
+
+        frames = []
+        for day in self.snapshot_dates(product_id, dataset):
+            if (first and day < first) or (last and day > last):
+                continue
+            df = pd.read_parquet(self.path_for(product_id, dataset, day))
+            df.insert(0, 'snapshot_date', day)
+            frames.append(df)
+
+        return concat_frames(frames, ignore_index=True)
+
+    def load_product_snapshot(
+        self,
+        product_id: str,
+        snapshot_date: Optional[DateLike] = None,
+        product_config: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        저장된 스냅샷을 collect_product_data()와 같은 구조로 복원
+
+        날짜를 지정하지 않으면 소스마다 가장 최근 스냅샷을 읽으므로,
+        마지막 실행에서 한 소스(예: GA4 시간 초과)만 빠졌어도 그 소스는 이전 스냅샷으로 채워집니다.
+
+        Args:
+            product_id: 프로덕트 식별자
+            snapshot_date: 스냅샷 날짜 (없으면 소스별 가장 최근 스냅샷)
+            product_config: products.yaml의 프로덕트 설정 (이름 등)
+
+        Returns:
+            프로덕트 데이터 딕셔너리 (스냅샷이 없으면 None).
+            'snapshot_date'는 가장 최근 날짜, 'source_dates'는 소스별로 읽은 날짜
+        """
+        if snapshot_date is not None:
+            source_dates = {source: _day_key(snapshot_date) for source in SOURCES}
+        else:
+            source_dates = {}
+            for source in SOURCES:
+                dates = [
+                    day
+                    for dataset, (dataset_source, _) in DATASETS.items() if dataset_source == source
+                    for day in self.snapshot_dates(product_id, dataset)
+                ]
+                if dates:
+                    source_dates[source] = max(dates)
+            if not source_dates:
+                return None
+        day = max(source_dates.values())
+
+        product_config = product_config or {}
+        data = {
+            'id': product_id,
+            'name': product_config.get('name', product_id),
+            'config': product_config,
+            'gsc': None,
+            'ga4': None,
+            'trends': None,
+            'adsense': None,
+            'timings': {},
+            'timed_out': [],
+            'snapshot_date': day,
+            'source_dates': source_dates
+        }
+
+        for source, source_day in source_dates.items():
+            data[source] = self.load_source(product_id, source, source_day)
+
+        if all(data[source] is None for source in SOURCES):
+            return None
+        return data
+
+    def load_source(self, product_id: str, source: str, snapshot_date: DateLike) -> Optional[Union[Dict, pd.DataFrame]]:
+        """
+        소스 하나를 collect_product_data()의 값과 같은 형태로 복원
+
+        Args:
+            product_id: 프로덕트 식별자
+            source: 'gsc' | 'ga4' | 'trends' | 'adsense'
+            snapshot_date: 스냅샷 날짜
+
+        Returns:
+            gsc/ga4는 리포트별 DataFrame 딕셔너리, trends는 DataFrame,
+            adsense는 딕셔너리 (저장된 데이터가 없으면 None)
+        """
+        value = None
+        for dataset, (dataset_source, key) in DATASETS.items():
+            if dataset_source != source:
+                continue
+            df = self.load(product_id, dataset, snapshot_date)
+            if df is None:
+                continue
+            if key is not None:
+                value = value or {}
+                value[key] = df
+            elif source == 'adsense':
+                value = df.iloc[0].to_dict()
+            else:
+                value = df
+
+        # 일부 리포트만 저장된 소스도 분석 코드가 키를 그대로 쓸 수 있도록 빈 DataFrame으로 채움
+        if isinstance(value, dict) and source in ('gsc', 'ga4'):
+            for dataset_source, key in DATASETS.values():
+                if dataset_source == source:
+                    value.setdefault(key, pd.DataFrame())
+
+        return value
+
+    # ------------------------------------------------------------------
+    # 신선도 (재실행 시 바뀌지 않은 소스/분석 재사용)
+    # ------------------------------------------------------------------
+
+    def _freshness_path(self, product_id: str) -> Path:
+        return self.data_dir / product_id / '_freshness.json'
+
+    def freshness(self, product_id: str) -> Dict[str, Dict]:
+        """
+        소스별 마지막 수집 정보
+
+        Returns:
+            {source: {'window': 수집 기간 키, 'hash': 내용 해시,
+                      'snapshot_date': 저장 날짜, 'collected_at': 수집 시각}}
+        """
+        path = self._freshness_path(product_id)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def mark_fresh(
+        self,
+        product_id: str,
+        source: str,
+        window: str,
+        content_hash: str,
+        snapshot_date: Optional[DateLike] = None
+    ) -> None:
+        """
+        소스 수집 정보 기록
+
+        Args:
+            product_id: 프로덕트 식별자
+            source: 'gsc' | 'ga4' | 'trends' | 'adsense'
+            window: 수집 기간과 설정을 나타내는 키 (이 값이 같으면 다시 수집해도 같은 데이터)
+            content_hash: 수집된 내용의 해시 (content_hash())
+            snapshot_date: 저장된 스냅샷 날짜 (기본: 오늘)
+        """
+        entries = self.freshness(product_id)
+        entries[source] = {
+            'window': window,
+            'hash': content_hash,
+            'snapshot_date': _day_key(snapshot_date),
+            'collected_at': datetime.now().isoformat(timespec='seconds')
+        }
+
+        path = self._freshness_path(product_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def load_fresh_source(self, product_id: str, source: str, window: str) -> Optional[Tuple[Any, str]]:
+        """
+        같은 기간으로 이미 수집해 둔 소스 데이터
+
+        Args:
+            product_id: 프로덕트 식별자
+            source: 'gsc' | 'ga4' | 'trends' | 'adsense'
+            window: 이번 실행의 수집 기간 키
+
+        Returns:
+            (저장된 값, 내용 해시) (기간이 바뀌었거나 저장된 데이터가 없으면 None)
+        """
+        entry = self.freshness(product_id).get(source)
+        if not entry or entry.get('window') != window:
+            return None
+        value = self.load_source(product_id, source, entry['snapshot_date'])
+        if value is None:
+            return None
+        return value, entry['hash']
+
+    def _analysis_path(self, input_hash: str) -> Path:
+        return self.data_dir / '_analysis' / f"{input_hash}.md"
+
+    def load_analysis(self, input_hash: str) -> Optional[str]:
+        """입력 해시가 같은 이전 분석 결과 (없으면 None)"""
+        path = self._analysis_path(input_hash)
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+
+    def save_analysis(self, input_hash: str, report: str) -> None:
+        """분석 결과를 입력 해시로 저장"""
+        path = self._analysis_path(input_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(report, encoding='utf-8')
+        os.replace(tmp_path, path)
+
+
+def content_hash(value: Any) -> str:
+    """
+    수집된 값의 내용 해시
+
+    DataFrame은 pd.util.hash_pandas_object로 행 단위 해시를 구해 합치므로
+    categorical/object 표현 차이와 무관하게 값이 같으면 같은 해시가 나옵니다.
+
+    Args:
+        value: DataFrame, 딕셔너리(키 순서 무관), 리스트 또는 기타 값
+
+    Returns:
+        sha256 16진 문자열
+    """
+    digest = hashlib.sha256()
+
+    def _update(item: Any) -> None:
+        if isinstance(item, pd.DataFrame):
+            digest.update(repr(list(item.columns)).encode('utf-8'))
+            if not item.empty:
+                digest.update(pd.util.hash_pandas_object(item, index=False).to_numpy().tobytes())
+        elif isinstance(item, dict):
+            for key in sorted(item):
+                digest.update(str(key).encode('utf-8'))
+                _update(item[key])
+        elif isinstance(item, (list, tuple)):
+            digest.update(f"[{len(item)}]".encode('utf-8'))
+            for element in item:
+                _update(element)
+        else:
+            digest.update(repr(item).encode('utf-8'))
+
+    _update(value)
+    return digest.hexdigest()
@@ -0,0 +1,128 @@
+"""
+MetricsStore 테스트
+
+수집 결과 저장 → 스냅샷 복원 → 이력 조회를 API 호출 없이 테스트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.storage.metrics_store import MetricsStore, content_hash
+
+
+def _product_data(clicks: int) -> dict:
+    return {
+        'id': 'qr-generator',
+        'name': 'QR Studio',
+        'gsc': {
+            'top_queries': pd.DataFrame({
+                'query': pd.Categorical(['qr code', 'qr maker']),
+                'clicks': [clicks, 5],
+                'impressions': [1000, 200],
+                'ctr': [clicks / 1000, 0.025],
+                'position': [3.2, 8.1]
+            }),
+            'opportunities': pd.DataFrame(),
+            'page_performance': None
+        },
+        'ga4': None,
+        'trends': None,
+        'adsense': {'revenue': 12.5, 'impressions': 5000, 'clicks': 20, 'ctr': 0.4, 'rpm': 2.5, 'source': 'manual'}
+    }
+
+
+def test_snapshot_round_trip(tmp_path):
+    """저장한 스냅샷을 collect_product_data()와 같은 구조로 복원한다"""
+    store = MetricsStore(str(tmp_path))
+
+    saved = store.save_product_data(_product_data(40), snapshot_date='2026-01-10')
+    restored = store.load_product_snapshot('qr-generator', product_config={'name': 'QR Studio'})
+
+    assert saved == ['gsc_top_queries', 'adsense']
+    assert restored['snapshot_date'] == '2026-01-10'
+    assert restored['name'] == 'QR Studio'
+    assert restored['ga4'] is None
+    assert restored['gsc']['opportunities'].empty
+    assert restored['adsense']['revenue'] == 12.5
+    pd.testing.assert_frame_equal(restored['gsc']['top_queries'], _product_data(40)['gsc']['top_queries'])
+
+
+def test_empty_report_replaces_same_day_snapshot(tmp_path):
+    """같은 날 다시 수집한 소스의 리포트가 비어 있으면 이전에 저장한 파일을 남기지 않는다"""
+    store = MetricsStore(str(tmp_path))
+    first = _product_data(40)
+    first['gsc']['opportunities'] = first['gsc']['top_queries']
+    store.save_product_data(first, snapshot_date='2026-01-10')
+
+    saved = store.save_product_data(_product_data(41), snapshot_date='2026-01-10', sources=['gsc'])
+    restored = store.load_source('qr-generator', 'gsc', '2026-01-10')
+
+    assert saved == ['gsc_top_queries']
+    assert restored['opportunities'].empty
+    assert restored['top_queries']['clicks'].tolist() == [41, 5]
+    # 다시 수집하지 않은 소스는 그대로
+    assert store.load('qr-generator', 'adsense', '2026-01-10') is not None
+
+
+def test_latest_snapshot_is_resolved_per_source(tmp_path):
+    """마지막 날 한 소스가 빠졌으면 그 소스는 이전 스냅샷에서 읽는다"""
+    store = MetricsStore(str(tmp_path))
+    store.save_product_data(_product_data(40), snapshot_date='2026-01-10')
+    store.save_product_data(_product_data(41), snapshot_date='2026-01-17', sources=['gsc'])
+
+    restored = store.load_product_snapshot('qr-generator')
+    pinned = store.load_product_snapshot('qr-generator', snapshot_date='2026-01-17')
+
+    assert restored['snapshot_date'] == '2026-01-17'
+    assert restored['source_dates'] == {'gsc': '2026-01-17', 'adsense': '2026-01-10'}
+    assert restored['gsc']['top_queries']['clicks'].tolist() == [41, 5]
+    assert restored['adsense']['revenue'] == 12.5
+    assert pinned['adsense'] is None
+
+
+def test_history_spans_snapshots(tmp_path):
+    """기간 내 스냅샷을 날짜 컬럼과 함께 이어 붙인다"""
+    store = MetricsStore(str(tmp_path))
+    for day, clicks in [('2026-01-01', 10), ('2026-01-08', 20), ('2026-01-15', 30)]:
+        store.save_product_data(_product_data(clicks), snapshot_date=day)
+
+    history = store.history('qr-generator', 'gsc_top_queries', start_date='2026-01-05')
+    qr_code = history[history['query'] == 'qr code']
+
+    assert store.snapshot_dates('qr-generator') == ['2026-01-01', '2026-01-08', '2026-01-15']
+    assert qr_code['snapshot_date'].tolist() == ['2026-01-08', '2026-01-15']
+    assert qr_code['clicks'].tolist() == [20, 30]
+    assert store.load('qr-generator', 'gsc_top_queries')['clicks'].iloc[0] == 30
+    assert store.load('unknown-product', 'trends') is None
+
+
+def test_fresh_source_is_reused_only_for_same_window(tmp_path):
+    """같은 수집 기간이면 저장된 소스와 해시를 돌려주고, 기간이 바뀌면 다시 수집하게 한다"""
+    store = MetricsStore(str(tmp_path))
+    data = _product_data(40)
+    value_hash = content_hash(data['gsc'])
+
+    store.save_product_data(data, sources=['gsc'])
+    store.mark_fresh('qr-generator', 'gsc', '2026-01-01~2026-01-07|cfg', value_hash)
+
+    value, cached_hash = store.load_fresh_source('qr-generator', 'gsc', '2026-01-01~2026-01-07|cfg')
+    assert cached_hash == value_hash
+    assert value['top_queries']['clicks'].tolist() == [40, 5]
+    assert store.load_fresh_source('qr-generator', 'gsc', '2026-01-02~2026-01-08|cfg') is None
+    assert store.load_fresh_source('qr-generator', 'adsense', '2026-01-01~2026-01-07|cfg') is None
+    assert store.load('qr-generator', 'adsense') is None
+
+
+def test_content_hash_ignores_representation():
+    """값이 같으면 categorical/object 표현과 무관하게 같은 해시, 값이 다르면 다른 해시"""
+    df = _product_data(40)['gsc']['top_queries']
+    as_object = df.assign(query=df['query'].astype(str))
+
+    assert content_hash(df) == content_hash(as_object)
+    assert content_hash(df) != content_hash(_product_data(41)['gsc']['top_queries'])
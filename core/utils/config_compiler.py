@@ -0,0 +1,520 @@
+"""
+Config Compiler
+
+products.yaml을 스키마로 검증하고 기본값(analysis_days, priority, framework 등)을 채운
+컴파일 결과(CompiledConfig)를 만듭니다.
+
+- 목표/임계값/가중치의 오타나 잘못된 값은 분석 단계까지 가지 않고 로드 시점에 ConfigError로 알려줍니다.
+  (비슷한 키가 있으면 함께 제안)
+- 컴파일 결과는 파일 mtime과 내용 해시로 캐시합니다.
+  같은 프로세스에서는 mtime/크기가 같으면 파일을 다시 읽지 않고,
+  cache_dir을 주면 내용 해시가 같은 한 짧게 끝나는 CLI 실행 간에도 YAML 파싱과 검증을 건너뜁니다.
+
+사용 예시:
+    compiled = compile_products_config('config/products.yaml', cache_dir='data/config_cache')
+    compiled.products['qr-generator'].analysis_days   # 7
+    compiled.as_dict()                                # load_products_config()와 같은 dict 구조
+"""
+
+import difflib
+import hashlib
+import os
+import pickle
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+
+# 스키마나 정규화 규칙이 바뀌면 올려서 디스크 캐시를 무효화
+SCHEMA_VERSION = 2
+
+PRIORITIES = ('high', 'medium', 'low')
+FRAMEWORKS = ('nextjs', 'vite', 'unknown')
+
+# 프로덕트 기본값
+DEFAULT_ANALYSIS_DAYS = 7
+DEFAULT_PRIORITY = 'medium'
+DEFAULT_FRAMEWORK = 'unknown'
+
+GOAL_KEYS = (
+    'weekly_sessions', 'monthly_sessions',
+    'weekly_gsc_clicks', 'monthly_gsc_clicks',
+    'target_ctr_percent', 'target_engagement_rate',
+    'weekly_revenue_usd', 'monthly_revenue_usd', 'target_rpm_usd'
+)
+
+# 임계값을 둘 수 있는 지표 (metrics_frame.METRIC_COLUMNS와 같은 이름)
+THRESHOLD_METRICS = (
+    'gsc_clicks', 'gsc_impressions', 'ctr_percent', 'avg_position',
+    'sessions', 'engagement_rate', 'revenue', 'adsense_rpm'
+)
+LOWER_IS_BETTER = ('avg_position',)
+THRESHOLD_LEVELS = ('critical', 'warning')
+
+HEALTH_COMPONENTS = ('traffic', 'engagement', 'seo', 'revenue')
+
+PRODUCT_KEYS = (
+    'name', 'framework', 'gsc_property_url', 'ga4_property_id', 'has_adsense', 'adsense_client_id',
+    'priority', 'analysis_days', 'goals', 'thresholds', 'health_score_weights'
+)
+
+# global 섹션: 키 → (허용 타입, 기본값)
+GLOBAL_SCHEMA: Dict[str, Tuple[Tuple[type, ...], Any]] = {
+    'report_frequency': ((str,), 'biweekly'),
+    'max_workers': ((int,), 4),
+    'process_workers': ((int,), 1),
+    'gsc_cache_dir': ((str,), None),
+    'trends_cache_dir': ((str,), None),
+    'trends_cache_ttl_hours': ((int, float), 24),
+    'trends_anchor_keyword': ((str,), None),
+    'data_dir': ((str,), None),
+    'llm_cache_dir': ((str,), None),
+    'llm_cache_ttl_hours': ((int, float), 168),
+    'llm_cache_max_mb': ((int, float), 64),
+    'delta_windows': ((int,), 4),
+    'prompt_token_budget': ((int,), None),
+    'analysis_mode': ((str,), 'single'),
+    'analysis_workers': ((int,), 4),
+    'analysis_output': ((str,), 'markdown'),
+    'call_timeout_seconds': ((int, float), None),
+    'run_deadline_seconds': ((int, float), None),
+    'notifications': ((dict,), None),
+}
+REPORT_FREQUENCIES = ('daily', 'weekly', 'biweekly', 'monthly')
+ANALYSIS_MODES = ('single', 'map_reduce')
+ANALYSIS_OUTPUTS = ('markdown', 'json')
+
+
+class ConfigError(ValueError):
+    """products.yaml 검증 실패 (발견된 문제를 모두 담음)"""
+
+    def __init__(self, path: str, problems: List[str]):
+        self.path = path
+        self.problems = problems
+        details = "\n".join(f"  - {problem}" for problem in problems)
+        super().__init__(f"{path}: 설정 오류 {len(problems)}건\n{details}")
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """지표 임계값 (critical: 🔴 위험, warning: 🟡 주의 기준)"""
+
+    critical: float = 0
+    warning: float = 0
+
+
+@dataclass
+class ProductConfig:
+    """
+    검증과 기본값 정규화를 마친 프로덕트 설정
+
+    Attributes:
+        id: 프로덕트 식별자 (products 섹션의 키)
+        name: 표시 이름 (기본: id)
+        framework: 'nextjs', 'vite' 또는 'unknown'
+        priority: 'high', 'medium', 'low'
+        analysis_days: 수집 일수
+        goals: 목표 값 (GOAL_KEYS 중 설정한 것만)
+        thresholds: 지표별 임계값 (설정한 것만, 파일 순서 유지)
+        health_score_weights: Health Score 가중치 (HEALTH_COMPONENTS 중 설정한 것만)
+        extra: 스키마에 없는 추가 키 (그대로 보존)
+    """
+
+    id: str
+    name: str
+    framework: str = DEFAULT_FRAMEWORK
+    priority: str = DEFAULT_PRIORITY
+    analysis_days: int = DEFAULT_ANALYSIS_DAYS
+    gsc_property_url: Optional[str] = None
+    ga4_property_id: Optional[str] = None
+    has_adsense: bool = False
+    adsense_client_id: Optional[str] = None
+    goals: Dict[str, float] = field(default_factory=dict)
+    thresholds: Dict[str, Threshold] = field(default_factory=dict)
+    health_score_weights: Dict[str, float] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 코드가 쓰던 product_config 딕셔너리 형태 (기본값 포함, 값이 없는 선택 키는 생략)"""
+        config: Dict[str, Any] = {
+            'name': self.name,
+            'framework': self.framework,
+            'priority': self.priority,
+            'analysis_days': self.analysis_days,
+            'has_adsense': self.has_adsense,
+        }
+        for key in ('gsc_property_url', 'ga4_property_id', 'adsense_client_id'):
+            if getattr(self, key) is not None:
+                config[key] = getattr(self, key)
+        if self.goals:
+            config['goals'] = dict(self.goals)
+        if self.thresholds:
+            config['thresholds'] = {
+                metric: {'critical': t.critical, 'warning': t.warning} for metric, t in self.thresholds.items()
+            }
+        if self.health_score_weights:
+            config['health_score_weights'] = dict(self.health_score_weights)
+        config.update(self.extra)
+        return config
+
+
+@dataclass
+class CompiledConfig:
+    """
+    컴파일된 products.yaml
+
+    Attributes:
+        products: 프로덕트 id → ProductConfig (파일 순서 유지)
+        global_config: 기본값을 채운 global 섹션
+        source_hash: 원본 파일 내용 sha256
+        warnings: 오류는 아니지만 확인이 필요한 항목 (예: 스키마에 없는 키)
+    """
+
+    products: Dict[str, ProductConfig]
+    global_config: Dict[str, Any]
+    source_hash: str
+    warnings: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """yaml.safe_load() 결과와 같은 {'products': ..., 'global': ...} 구조"""
+        return {
+            'products': {product_id: product.to_dict() for product_id, product in self.products.items()},
+            'global': dict(self.global_config)
+        }
+
+
+def _suggest(key: str, choices) -> str:
+    matches = difflib.get_close_matches(key, list(choices), n=1)
+    return f" (혹시 '{matches[0]}'?)" if matches else ""
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _number_map(section: Any, where: str, allowed, problems: List[str]) -> Dict[str, float]:
+    """{키: 0 이상 숫자} 섹션 검증 (goals, health_score_weights)"""
+    if section is None:
+        return {}
+    if not isinstance(section, dict):
+        problems.append(f"{where}: 매핑이어야 합니다 (현재: {type(section).__name__})")
+        return {}
+    values = {}
+    for key, value in section.items():
+        if key not in allowed:
+            problems.append(f"{where}.{key}: 알 수 없는 키{_suggest(str(key), allowed)}")
+        elif not _is_number(value) or value < 0:
+            problems.append(f"{where}.{key}: 0 이상의 숫자여야 합니다 (현재: {value!r})")
+        else:
+            values[key] = value
+    return values
+
+
+def _compile_thresholds(section: Any, where: str, problems: List[str]) -> Dict[str, Threshold]:
+    if section is None:
+        return {}
+    if not isinstance(section, dict):
+        problems.append(f"{where}: 매핑이어야 합니다 (현재: {type(section).__name__})")
+        return {}
+    thresholds = {}
+    for metric, levels in section.items():
+        path = f"{where}.{metric}"
+        if metric not in THRESHOLD_METRICS:
+            problems.append(f"{path}: 알 수 없는 지표{_suggest(str(metric), THRESHOLD_METRICS)}")
+            continue
+        if not isinstance(levels, dict):
+            problems.append(f"{path}: critical/warning 매핑이어야 합니다 (현재: {levels!r})")
+            continue
+        valid = True
+        for level, value in levels.items():
+            if level not in THRESHOLD_LEVELS:
+                problems.append(f"{path}.{level}: 알 수 없는 키{_suggest(str(level), THRESHOLD_LEVELS)}")
+                valid = False
+            elif not _is_number(value):
+                problems.append(f"{path}.{level}: 숫자여야 합니다 (현재: {value!r})")
+                valid = False
+        if not valid:
+            continue
+        threshold = Threshold(critical=levels.get('critical', 0), warning=levels.get('warning', 0))
+        # 낮을수록 좋은 지표는 critical이 warning 이상, 나머지는 이하여야 단계가 뒤집히지 않음
+        if 'critical' in levels and 'warning' in levels:
+            if metric in LOWER_IS_BETTER and threshold.critical < threshold.warning:
+                problems.append(f"{path}: 낮을수록 좋은 지표이므로 critical({threshold.critical})이 "
+                                f"warning({threshold.warning}) 이상이어야 합니다")
+                continue
+            if metric not in LOWER_IS_BETTER and threshold.critical > threshold.warning:
+                problems.append(f"{path}: critical({threshold.critical})이 warning({threshold.warning}) 이하여야 합니다")
+                continue
+        thresholds[metric] = threshold
+    return thresholds
+
+
+def _optional_str(raw: Dict, key: str, where: str, problems: List[str], coerce: bool = False) -> Optional[str]:
+    value = raw.get(key)
+    if value is None:
+        return None
+    if coerce and _is_number(value):
+        return str(value)
+    if not isinstance(value, str):
+        problems.append(f"{where}.{key}: 문자열이어야 합니다 (현재: {value!r})")
+        return None
+    return value
+
+
+def _compile_product(product_id: str, raw: Any, problems: List[str], warnings: List[str]) -> Optional[ProductConfig]:
+    where = f"products.{product_id}"
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        problems.append(f"{where}: 매핑이어야 합니다 (현재: {type(raw).__name__})")
+        return None
+
+    extra = {}
+    for key in raw:
+        if key not in PRODUCT_KEYS:
+            suggestion = _suggest(str(key), PRODUCT_KEYS)
+            if suggestion:
+                # 알려진 키와 비슷하면 오타로 보고 중단
+                problems.append(f"{where}.{key}: 알 수 없는 키{suggestion}")
+            else:
+                warnings.append(f"{where}.{key}: 스키마에 없는 키 (그대로 보존)")
+                extra[key] = raw[key]
+
+    name = raw.get('name', product_id)
+    if not isinstance(name, str) or not name.strip():
+        problems.append(f"{where}.name: 비어 있지 않은 문자열이어야 합니다 (현재: {name!r})")
+
+    framework = raw.get('framework') or DEFAULT_FRAMEWORK
+    if framework not in FRAMEWORKS:
+        problems.append(f"{where}.framework: {FRAMEWORKS} 중 하나여야 합니다 (현재: {framework!r})")
+
+    priority = raw.get('priority') or DEFAULT_PRIORITY
+    if isinstance(priority, str):
+        priority = priority.lower()
+    if priority not in PRIORITIES:
+        problems.append(f"{where}.priority: {PRIORITIES} 중 하나여야 합니다 (현재: {priority!r}){_suggest(str(priority), PRIORITIES)}")
+
+    analysis_days = raw.get('analysis_days', DEFAULT_ANALYSIS_DAYS)
+    if not isinstance(analysis_days, int) or isinstance(analysis_days, bool) or analysis_days < 1:
+        problems.append(f"{where}.analysis_days: 1 이상의 정수여야 합니다 (현재: {analysis_days!r})")
+
+    has_adsense = raw.get('has_adsense', False)
+    if not isinstance(has_adsense, bool):
+        problems.append(f"{where}.has_adsense: true/false여야 합니다 (현재: {has_adsense!r})")
+
+    return ProductConfig(
+        id=product_id,
+        name=name,
+        framework=framework,
+        priority=priority,
+        analysis_days=analysis_days,
+        gsc_property_url=_optional_str(raw, 'gsc_property_url', where, problems),
+        ga4_property_id=_optional_str(raw, 'ga4_property_id', where, problems, coerce=True),
+        has_adsense=has_adsense,
+        adsense_client_id=_optional_str(raw, 'adsense_client_id', where, problems),
+        goals=_number_map(raw.get('goals'), f"{where}.goals", GOAL_KEYS, problems),
+        thresholds=_compile_thresholds(raw.get('thresholds'), f"{where}.thresholds", problems),
+        health_score_weights=_number_map(
+            raw.get('health_score_weights'), f"{where}.health_score_weights", HEALTH_COMPONENTS, problems
+        ),
+        extra=extra
+    )
+
+
+def _compile_global(raw: Any, problems: List[str], warnings: List[str]) -> Dict[str, Any]:
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        problems.append(f"global: 매핑이어야 합니다 (현재: {type(raw).__name__})")
+        return {key: default for key, (_, default) in GLOBAL_SCHEMA.items()}
+
+    compiled = {}
+    for key, (types, default) in GLOBAL_SCHEMA.items():
+        value = raw.get(key, default)
+        if value is not None and (not isinstance(value, types) or isinstance(value, bool)):
+            problems.append(f"global.{key}: {'/'.join(t.__name__ for t in types)} 값이어야 합니다 (현재: {value!r})")
+        elif _is_number(value) and value <= 0:
+            problems.append(f"global.{key}: 0보다 커야 합니다 (현재: {value!r})")
+        compiled[key] = value
+
+    if compiled['report_frequency'] not in REPORT_FREQUENCIES:
+        problems.append(f"global.report_frequency: {REPORT_FREQUENCIES} 중 하나여야 합니다 "
+                        f"(현재: {compiled['report_frequency']!r})")
+    if compiled['analysis_mode'] not in ANALYSIS_MODES:
+        problems.append(f"global.analysis_mode: {ANALYSIS_MODES} 중 하나여야 합니다 "
+                        f"(현재: {compiled['analysis_mode']!r})")
+    if compiled['analysis_output'] not in ANALYSIS_OUTPUTS:
+        problems.append(f"global.analysis_output: {ANALYSIS_OUTPUTS} 중 하나여야 합니다 "
+                        f"(현재: {compiled['analysis_output']!r})")
+
+    for key, value in raw.items():
+        if key not in GLOBAL_SCHEMA:
+            suggestion = _suggest(str(key), GLOBAL_SCHEMA)
+            if suggestion:
+                problems.append(f"global.{key}: 알 수 없는 키{suggestion}")
+            else:
+                warnings.append(f"global.{key}: 스키마에 없는 키 (그대로 보존)")
+                compiled[key] = value
+    return compiled
+
+
+def compile_config(raw: Any, source_hash: str = '', path: str = 'products.yaml') -> CompiledConfig:
+    """
+    파싱된 products.yaml 내용을 검증하고 정규화
+
+    Args:
+        raw: yaml.safe_load() 결과
+        source_hash: 원본 내용 해시 (캐시 식별용)
+        path: 오류 메시지에 표시할 파일 경로
+
+    Returns:
+        CompiledConfig
+
+    Raises:
+        ConfigError: 스키마와 맞지 않는 항목이 하나라도 있을 때 (모든 문제를 한 번에 보고)
+    """
+    problems: List[str] = []
+    warnings: List[str] = []
+
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ConfigError(path, [f"최상위는 products/global 매핑이어야 합니다 (현재: {type(raw).__name__})"])
+
+    for key in raw:
+        if key not in ('products', 'global'):
+            problems.append(f"{key}: 알 수 없는 최상위 키{_suggest(str(key), ('products', 'global'))}")
+
+    raw_products = raw.get('products') or {}
+    products: Dict[str, ProductConfig] = {}
+    if not isinstance(raw_products, dict):
+        problems.append(f"products: 매핑이어야 합니다 (현재: {type(raw_products).__name__})")
+    else:
+        for product_id, product_raw in raw_products.items():
+            product = _compile_product(str(product_id), product_raw, problems, warnings)
+            if product is not None:
+                products[str(product_id)] = product
+
+    global_config = _compile_global(raw.get('global'), problems, warnings)
+
+    if problems:
+        raise ConfigError(path, problems)
+    return CompiledConfig(products=products, global_config=global_config, source_hash=source_hash, warnings=warnings)
+
+
+# 프로세스 내 캐시: 절대 경로 → (mtime_ns, 크기, 컴파일 결과)
+_memory_cache: Dict[str, Tuple[int, int, CompiledConfig]] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def _disk_cache_path(cache_dir: str, config_path: str) -> Path:
+    name = hashlib.sha256(config_path.encode('utf-8')).hexdigest()[:16]
+    return Path(cache_dir) / f"{Path(config_path).stem}-{name}.pkl"
+
+
+def _load_disk_cache(path: Path, source_hash: str) -> Optional[CompiledConfig]:
+    try:
+        with open(path, 'rb') as f:
+            version, cached_hash, compiled = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError, AttributeError):
+        return None
+    if version != SCHEMA_VERSION or cached_hash != source_hash:
+        return None
+    return compiled
+
+
+def _save_disk_cache(path: Path, compiled: CompiledConfig) -> None:
+    """컴파일 결과 저장 (임시 파일에 쓴 뒤 교체, 실패해도 무시)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}-{threading.get_ident()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((SCHEMA_VERSION, compiled.source_hash, compiled), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  설정 캐시 저장 실패 (무시): {e}")
+
+
+def compile_products_config(config_path: str, cache_dir: Optional[str] = None) -> CompiledConfig:
+    """
+    products.yaml을 컴파일 (mtime/내용 해시 기준 캐시)
+
+    1. 같은 프로세스에서 mtime과 크기가 지난번과 같으면 파일을 읽지 않고 재사용
+    2. 내용 해시가 같으면 (메모리 또는 cache_dir) YAML 파싱과 검증을 건너뜀
+    3. 그 외에는 파싱/검증 후 캐시에 저장
+
+    Args:
+        config_path: products.yaml 경로
+        cache_dir: 컴파일 결과를 저장할 디렉토리 (None이면 프로세스 내 캐시만 사용)
+
+    Returns:
+        CompiledConfig
+
+    Raises:
+        FileNotFoundError: 설정 파일이 없을 때
+        ConfigError: 검증 실패 시
+    """
+    config_path = os.path.abspath(config_path)
+    stat = os.stat(config_path)
+
+    with _memory_cache_lock:
+        cached = _memory_cache.get(config_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    source_hash = hashlib.sha256(content).hexdigest()
+
+    compiled = None
+    if cached is not None and cached[2].source_hash == source_hash:
+        # 파일을 저장만 다시 한 경우 (내용 동일)
+        compiled = cached[2]
+    disk_path = _disk_cache_path(cache_dir, config_path) if cache_dir else None
+    if compiled is None and disk_path is not None:
+        compiled = _load_disk_cache(disk_path, source_hash)
+    if compiled is None:
+        compiled = compile_config(yaml.safe_load(content), source_hash=source_hash, path=config_path)
+        if disk_path is not None:
+            _save_disk_cache(disk_path, compiled)
+
+    with _memory_cache_lock:
+        _memory_cache[config_path] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+
+def clear_config_cache() -> None:
+    """프로세스 내 컴파일 캐시 비우기 (테스트용)"""
+    with _memory_cache_lock:
+        _memory_cache.clear()
+
+
+# 테스트용 실행 코드
+if __name__ == '__main__':
+    import sys
+    import time
+
+    default_path = Path(__file__).resolve().parent.parent.parent / 'config' / 'products.yaml'
+    path = sys.argv[1] if len(sys.argv) > 1 else str(default_path)
+
+    try:
+        start = time.perf_counter()
+        compiled = compile_products_config(path)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compile_products_config(path)
+        second = time.perf_counter() - start
+    except ConfigError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"✅ {len(compiled.products)}개 프로덕트 설정 검증 완료 (컴파일 {first * 1000:.1f}ms, 캐시 {second * 1000:.3f}ms)")
+    for product in compiled.products.values():
+        print(f"   - {product.name} ({product.id}): {product.framework}, 우선순위 {product.priority}, "
+              f"{product.analysis_days}일, 임계값 {len(product.thresholds)}개")
+    for warning in compiled.warnings:
+        print(f"   ⚠️  {warning}")
@@ -0,0 +1,60 @@
+"""
+TTL Disk Cache
+
+키별로 파이썬 객체(DataFrame 등)를 pickle 파일로 저장하고,
+지정한 유효 시간(TTL)이 지나면 만료된 것으로 취급하는 간단한 디스크 캐시입니다.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class TTLDiskCache:
+    """유효 시간이 있는 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float):
+        """
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉토리
+            ttl_seconds: 항목 유효 시간 (초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """키 구성 요소를 안정적인 해시 문자열로 변환"""
+        return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값 조회
+
+        Returns:
+            유효한 값 (없거나 만료되었거나 읽을 수 없으면 None)
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """값 저장 (임시 파일에 쓴 뒤 교체하여 동시 읽기에도 안전)"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}-{threading.get_ident()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
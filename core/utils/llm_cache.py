@@ -0,0 +1,253 @@
+"""
+LLM Response Cache
+
+(모델, 프롬프트, 생성 설정)의 해시를 키로 Gemini 응답 텍스트를 디스크에 저장합니다.
+바이트 단위로 같은 프롬프트를 다시 보내면(예: GitHub 단계 실패 후 재실행) API를 호출하지 않고
+저장된 응답을 돌려주므로 호출당 10~30초와 토큰 비용이 들지 않습니다.
+
+- 만료: 저장 시각 기준 TTL이 지나면 다시 생성
+- 용량 제한: 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU, 파일 mtime = 마지막 사용 시각)
+- 우회: bypass=True이면 캐시를 읽지 않고 항상 새로 생성 (새 응답은 저장)
+
+ComparativeAnalyzer와 ActionExtractor는 configure_llm_cache()로 설정한 프로세스 공유 캐시를 함께 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+# 기본 유효 시간 / 최대 용량
+DEFAULT_TTL_HOURS = 24 * 7
+DEFAULT_MAX_MB = 64
+
+_shared_cache: Optional['LLMResponseCache'] = None
+
+
+class LLMResponseCache:
+    """내용 주소 기반 LLM 응답 디스크 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_seconds: float = DEFAULT_TTL_HOURS * 3600,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        bypass: bool = False
+    ):
+        """
+        Args:
+            cache_dir: 응답 파일을 저장할 디렉토리
+            ttl_seconds: 응답 유효 시간 (초, 저장 시각 기준)
+            max_bytes: 캐시 전체 최대 크기 (넘으면 LRU 삭제)
+            bypass: True면 캐시를 읽지 않음 (새 응답은 저장)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_id: str, prompt: Any, config: Any = None) -> str:
+        """
+        (모델, 프롬프트, 생성 설정)을 안정적인 해시 문자열로 변환
+
+        설정 객체(pydantic 모델 등)는 model_dump()로, 나머지는 JSON(키 정렬)으로 직렬화합니다.
+        """
+        if hasattr(config, 'model_dump'):
+            config = config.model_dump(exclude_none=True)
+        payload = json.dumps(
+            {'model': model_id, 'prompt': prompt, 'config': config},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        저장된 응답 조회 (조회하면 LRU 순서상 가장 최근으로 갱신)
+
+        Returns:
+            응답 텍스트 (우회 중이거나, 없거나, 만료되었거나, 읽을 수 없으면 None)
+        """
+        if self.bypass:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['created_at'] > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            os.utime(path)
+            return entry['text']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, text: str, model_id: Optional[str] = None) -> None:
+        """응답 저장 (임시 파일에 쓴 뒤 교체), 저장 후 용량을 넘으면 LRU 삭제"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}-{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'model': model_id, 'created_at': time.time(), 'text': text}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 삭제"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob('*/*.json'):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def generate(self, client, model_id: str, contents: Any, config: Any = None) -> str:
+        """
+        캐시를 거쳐 generate_content 호출
+
+        Args:
+            client: google.genai.Client
+            model_id: 모델 ID
+            contents: 프롬프트
+            config: 생성 설정 (GenerateContentConfig 또는 dict, 선택)
+
+        Returns:
+            응답 텍스트 (빈 응답은 저장하지 않음)
+        """
+        key = self.make_key(model_id, contents, config)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            print(f"   ♻️  같은 프롬프트의 저장된 응답 재사용 ({key[:12]})")
+            return cached
+
+        self.misses += 1
+        text = _generate(client, model_id, contents, config)
+        if text:
+            self.set(key, text, model_id)
+        return text
+
+    def generate_stream(self, client, model_id: str, contents: Any, on_text: Callable[[str], None],
+                        config: Any = None) -> str:
+        """
+        캐시를 거쳐 generate_content_stream 호출
+
+        저장된 응답이 있으면 on_text를 한 번 호출하고, 없으면 청크마다 호출한 뒤 전체 응답을 저장합니다.
+
+        Returns:
+            전체 응답 텍스트
+        """
+        key = self.make_key(model_id, contents, config)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            print(f"   ♻️  같은 프롬프트의 저장된 응답 재사용 ({key[:12]})")
+            on_text(cached)
+            return cached
+
+        self.misses += 1
+        text = _generate_stream(client, model_id, contents, on_text, config)
+        if text:
+            self.set(key, text, model_id)
+        return text
+
+
+def _generate(client, model_id: str, contents: Any, config: Any = None) -> str:
+    kwargs = {'config': config} if config is not None else {}
+    response = client.models.generate_content(model=model_id, contents=contents, **kwargs)
+    return response.text
+
+
+def _generate_stream(client, model_id: str, contents: Any, on_text: Callable[[str], None], config: Any = None) -> str:
+    kwargs = {'config': config} if config is not None else {}
+    parts = []
+    for chunk in client.models.generate_content_stream(model=model_id, contents=contents, **kwargs):
+        text = chunk.text
+        if text:
+            parts.append(text)
+            on_text(text)
+    return ''.join(parts)
+
+
+def configure_llm_cache(
+    cache_dir: Optional[str],
+    ttl_hours: float = DEFAULT_TTL_HOURS,
+    max_mb: float = DEFAULT_MAX_MB,
+    bypass: bool = False
+) -> Optional[LLMResponseCache]:
+    """
+    프로세스 공유 LLM 응답 캐시 설정
+
+    Args:
+        cache_dir: 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        ttl_hours: 응답 유효 시간 (시간)
+        max_mb: 최대 용량 (MB)
+        bypass: True면 저장된 응답을 읽지 않음
+
+    Returns:
+        설정된 캐시 (cache_dir가 없으면 None)
+    """
+    global _shared_cache
+    _shared_cache = LLMResponseCache(
+        cache_dir, ttl_seconds=ttl_hours * 3600, max_bytes=int(max_mb * 1024 * 1024), bypass=bypass
+    ) if cache_dir else None
+    return _shared_cache
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """configure_llm_cache()로 설정한 공유 캐시 (설정하지 않았으면 None)"""
+    return _shared_cache
+
+
+def generate_text(client, model_id: str, contents: Any, config: Any = None,
+                  cache: Optional[LLMResponseCache] = None) -> str:
+    """
+    generate_content 호출 후 응답 텍스트 반환 (cache가 있으면 캐시를 거침)
+
+    Args:
+        client: google.genai.Client
+        model_id: 모델 ID
+        contents: 프롬프트
+        config: 생성 설정 (선택)
+        cache: LLMResponseCache (없으면 바로 호출)
+    """
+    if cache is None:
+        return _generate(client, model_id, contents, config)
+    return cache.generate(client, model_id, contents, config)
+
+
+def stream_text(client, model_id: str, contents: Any, on_text: Callable[[str], None], config: Any = None,
+                cache: Optional[LLMResponseCache] = None) -> str:
+    """
+    generate_content_stream 호출, 청크마다 on_text 호출 후 전체 응답 텍스트 반환 (cache가 있으면 캐시를 거침)
+
+    Args:
+        client: google.genai.Client
+        model_id: 모델 ID
+        contents: 프롬프트
+        on_text: 청크 텍스트를 받을 함수 (예: ReportStream.write)
+        config: 생성 설정 (선택)
+        cache: LLMResponseCache (없으면 바로 호출)
+    """
+    if cache is None:
+        return _generate_stream(client, model_id, contents, on_text, config)
+    return cache.generate_stream(client, model_id, contents, on_text, config)
@@ -0,0 +1,121 @@
+"""
+Thread-local output capture
+
+병렬 실행 중 각 스레드의 print() 출력을 개별 버퍼에 모읍니다.
+프로덕트 단위로 로그를 모은 뒤 정해진 순서대로 출력하면
+여러 스레드의 출력이 뒤섞이지 않습니다.
+
+한 스레드(이벤트 루프)에서 여러 asyncio 작업이 번갈아 실행될 때는
+capture_task_output()으로 작업(context)별 버퍼를 지정할 수 있습니다.
+"""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_local = threading.local()
+_task_buffer: ContextVar[Optional[io.StringIO]] = ContextVar('log_capture_task_buffer', default=None)
+_install_lock = threading.Lock()
+_install_count = 0
+_original_stdout = None
+
+
+class _ThreadRoutedStream:
+    """현재 작업/스레드에 버퍼가 지정되어 있으면 그 버퍼로, 아니면 원래 stdout으로 쓰는 스트림"""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, text: str) -> int:
+        buffer = current_buffer()
+        if buffer is not None:
+            return buffer.write(text)
+        return self._fallback.write(text)
+
+    def flush(self):
+        if current_buffer() is None:
+            self._fallback.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._fallback, name)
+
+
+def current_buffer() -> Optional[io.StringIO]:
+    """현재 asyncio 작업 또는 스레드에 바인딩된 출력 버퍼 (없으면 None)"""
+    buffer = _task_buffer.get()
+    if buffer is not None:
+        return buffer
+    return getattr(_local, 'buffer', None)
+
+
+def _install() -> None:
+    global _install_count, _original_stdout
+
+    with _install_lock:
+        if _install_count == 0:
+            _original_stdout = sys.stdout
+            sys.stdout = _ThreadRoutedStream(_original_stdout)
+        _install_count += 1
+
+
+def _uninstall() -> None:
+    global _install_count, _original_stdout
+
+    with _install_lock:
+        _install_count -= 1
+        if _install_count == 0:
+            sys.stdout = _original_stdout
+            _original_stdout = None
+
+
+@contextmanager
+def capture_output(buffer: Optional[io.StringIO] = None) -> Iterator[io.StringIO]:
+    """
+    현재 스레드의 stdout 출력을 버퍼로 모읍니다.
+
+    Args:
+        buffer: 출력을 모을 버퍼 (없으면 새로 생성).
+            부모 스레드의 버퍼를 넘기면 자식 스레드 출력도 같은 곳에 모입니다.
+
+    Yields:
+        출력이 기록되는 StringIO 버퍼
+    """
+    if buffer is None:
+        buffer = io.StringIO()
+
+    _install()
+    previous = getattr(_local, 'buffer', None)
+    _local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _local.buffer = previous
+        _uninstall()
+
+
+@contextmanager
+def capture_task_output(buffer: Optional[io.StringIO] = None) -> Iterator[io.StringIO]:
+    """
+    현재 asyncio 작업(context)의 stdout 출력을 버퍼로 모읍니다.
+
+    같은 이벤트 루프의 다른 작업 출력과 섞이지 않으며, 스레드 단위 버퍼보다 우선합니다.
+
+    Args:
+        buffer: 출력을 모을 버퍼 (없으면 새로 생성)
+
+    Yields:
+        출력이 기록되는 StringIO 버퍼
+    """
+    if buffer is None:
+        buffer = io.StringIO()
+
+    _install()
+    token = _task_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _task_buffer.reset(token)
+        _uninstall()
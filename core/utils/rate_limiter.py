@@ -0,0 +1,90 @@
+"""
+Adaptive Rate Limiter
+
+토큰 버킷 기반 요청 속도 제한기입니다.
+요청이 성공하면 허용 속도를 조금씩 올리고(additive increase),
+429(Too Many Requests)를 받으면 절반으로 줄입니다(multiplicative decrease).
+
+고정 sleep 대신 사용하면 여유가 있을 때는 바로 요청하고,
+제한에 걸렸을 때만 기다립니다.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class AdaptiveRateLimiter:
+    """429 응답에 따라 속도를 조절하는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 3,
+        min_rate: float = 0.05,
+        max_rate: float = 5.0,
+        increase: float = 0.1,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Args:
+            rate: 초기 허용 속도 (초당 요청 수)
+            burst: 버킷 크기 (쉬고 있다가 연속으로 보낼 수 있는 요청 수)
+            min_rate: 최소 허용 속도
+            max_rate: 최대 허용 속도
+            increase: 요청 성공 시 증가시킬 속도
+            decrease_factor: 429 응답 시 곱할 비율
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 얻을 때까지 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+            waited += wait
+
+    def on_success(self) -> None:
+        """요청 성공: 허용 속도를 조금 올림"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        429 응답: 허용 속도를 줄이고 남은 토큰을 비움
+
+        Args:
+            retry_after: 서버가 알려준 재시도 대기 시간 (초)
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0.0
+            backoff = retry_after if retry_after is not None else 1 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + backoff)
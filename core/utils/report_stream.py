@@ -0,0 +1,95 @@
+"""
+Report Stream
+
+스트리밍 응답 청크를 받는 즉시 리포트 파일에 이어 쓰고, 진행 상황을 콜백으로 알립니다.
+전체 응답을 기다렸다가 한 번에 쓰는 대신 첫 청크가 도착하자마자 파일에 내용이 생기므로
+운영자는 진행 상황을 바로 볼 수 있고, 다음 단계는 완료된 섹션(## 제목 단위)부터 먼저 처리할 수 있습니다.
+
+사용 예시:
+    with open(path, 'w', encoding='utf-8') as f:
+        stream = ReportStream(f, on_section=lambda title, body: print(f"✅ {title}"))
+        for chunk in chunks:
+            stream.write(chunk)
+        stream.close()
+"""
+
+import time
+from typing import Callable, List, Optional, TextIO, Tuple
+
+
+# 섹션 경계로 취급하는 마크다운 제목 접두사
+SECTION_PREFIX = '## '
+
+
+class ReportStream:
+    """청크를 파일에 바로 쓰고 완료된 섹션을 알리는 스트림"""
+
+    def __init__(
+        self,
+        file: TextIO,
+        on_chunk: Optional[Callable[[str, 'ReportStream'], None]] = None,
+        on_section: Optional[Callable[[str, str], None]] = None
+    ):
+        """
+        Args:
+            file: 리포트 파일 (열린 텍스트 파일)
+            on_chunk: 청크마다 호출 (청크, 스트림)
+            on_section: 섹션이 끝날 때마다 호출 (제목, 본문)
+        """
+        self.file = file
+        self.on_chunk = on_chunk
+        self.on_section = on_section
+        self.chars = 0
+        self.chunks = 0
+        self.sections: List[Tuple[str, str]] = []
+        self.first_chunk_seconds: Optional[float] = None
+        self._started = time.monotonic()
+        self._partial_line = ''
+        self._title: Optional[str] = None
+        self._body: List[str] = []
+
+    def write(self, text: str) -> None:
+        """청크를 파일에 이어 쓰고(flush) 콜백 호출"""
+        if not text:
+            return
+        if self.first_chunk_seconds is None:
+            self.first_chunk_seconds = time.monotonic() - self._started
+
+        self.file.write(text)
+        self.file.flush()
+        self.chars += len(text)
+        self.chunks += 1
+
+        # 청크가 줄 중간에서 끊길 수 있으므로 완성된 줄만 섹션 판별에 사용
+        lines = (self._partial_line + text).split('\n')
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._feed_line(line)
+
+        if self.on_chunk is not None:
+            self.on_chunk(text, self)
+
+    def _feed_line(self, line: str) -> None:
+        if line.startswith(SECTION_PREFIX):
+            self._finish_section()
+            self._title = line[len(SECTION_PREFIX):].strip()
+            self._body = []
+        elif self._title is not None:
+            self._body.append(line)
+
+    def _finish_section(self) -> None:
+        if self._title is None:
+            return
+        body = '\n'.join(self._body).strip()
+        self.sections.append((self._title, body))
+        if self.on_section is not None:
+            self.on_section(self._title, body)
+        self._title = None
+        self._body = []
+
+    def close(self) -> None:
+        """마지막 줄과 마지막 섹션을 마무리 (파일은 닫지 않음)"""
+        if self._partial_line:
+            self._feed_line(self._partial_line)
+            self._partial_line = ''
+        self._finish_section()
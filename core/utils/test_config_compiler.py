@@ -0,0 +1,108 @@
+"""
+Config Compiler 테스트
+
+products.yaml 스키마 검증, 기본값 정규화, mtime/해시 캐시를 테스트합니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils import config_compiler
+from core.utils.config_compiler import ConfigError, Threshold, compile_config, compile_products_config
+
+
+def test_repository_config_compiles_to_compatible_dict():
+    """저장소의 products.yaml은 검증을 통과하고, 원래 값은 그대로 유지한 채 기본값만 채운다"""
+    path = project_root / 'config' / 'products.yaml'
+    raw = yaml.safe_load(path.read_text(encoding='utf-8'))
+
+    compiled = compile_config(raw)
+    as_dict = compiled.as_dict()
+
+    assert list(compiled.products) == list(raw['products'])
+    assert compiled.products['qr-generator'].thresholds['avg_position'] == Threshold(critical=50, warning=30)
+    for product_id, product_raw in raw['products'].items():
+        for key, value in product_raw.items():
+            assert as_dict['products'][product_id][key] == value
+    for key, value in raw['global'].items():
+        assert as_dict['global'][key] == value
+
+
+def test_defaults_are_normalised():
+    """빠진 항목은 analysis_days, priority, framework 등 기본값으로 채운다"""
+    compiled = compile_config({'products': {'new-tool': {'gsc_property_url': 'sc-domain:new.tool', 'ga4_property_id': 1234}}})
+    product = compiled.products['new-tool']
+
+    assert (product.name, product.analysis_days, product.priority, product.framework) == ('new-tool', 7, 'medium', 'unknown')
+    assert product.ga4_property_id == '1234'
+    assert product.has_adsense is False
+    assert compiled.global_config['max_workers'] == 4
+    assert compiled.global_config['delta_windows'] == 4
+    assert compiled.global_config['analysis_mode'] == 'single'
+
+
+def test_all_problems_are_reported_with_suggestions():
+    """목표/임계값/가중치 오타와 잘못된 값을 한 번에 모아 알려준다"""
+    raw = {
+        'products': {
+            'qr-generator': {
+                'priority': 'urgent',
+                'analysis_days': 0,
+                'goals': {'weekly_sesions': 250},
+                'thresholds': {
+                    'ctr_percent': {'critical': 1.0, 'warnig': 2.0},
+                    'avg_position': {'critical': 10, 'warning': 30},
+                    'sessions': {'critical': 'low'}
+                },
+                'health_score_weights': {'trafic': 30}
+            }
+        },
+        'global': {'max_worker': 4}
+    }
+
+    with pytest.raises(ConfigError) as excinfo:
+        compile_config(raw)
+
+    problems = "\n".join(excinfo.value.problems)
+    assert len(excinfo.value.problems) == 8
+    assert "goals.weekly_sesions: 알 수 없는 키 (혹시 'weekly_sessions'?)" in problems
+    assert "ctr_percent.warnig: 알 수 없는 키 (혹시 'warning'?)" in problems
+    assert "health_score_weights.trafic: 알 수 없는 키 (혹시 'traffic'?)" in problems
+    assert "global.max_worker: 알 수 없는 키 (혹시 'max_workers'?)" in problems
+    assert "avg_position: 낮을수록 좋은 지표" in problems
+
+
+def test_compiled_config_is_cached_by_mtime_and_hash(tmp_path, monkeypatch):
+    """mtime이 같으면 파일을 다시 읽지 않고, 내용이 같으면 다른 실행에서도 파싱하지 않는다"""
+    config_path = tmp_path / 'products.yaml'
+    config_path.write_text("products:\n  tool:\n    name: Tool\n", encoding='utf-8')
+    cache_dir = tmp_path / 'cache'
+
+    parses = []
+    real_safe_load = yaml.safe_load
+    monkeypatch.setattr(config_compiler.yaml, 'safe_load', lambda content: parses.append(1) or real_safe_load(content))
+    config_compiler.clear_config_cache()
+
+    first = compile_products_config(str(config_path), cache_dir=str(cache_dir))
+    assert compile_products_config(str(config_path), cache_dir=str(cache_dir)) is first
+
+    # 새 프로세스처럼 메모리 캐시를 비워도 디스크 캐시로 파싱을 건너뜀
+    config_compiler.clear_config_cache()
+    assert compile_products_config(str(config_path), cache_dir=str(cache_dir)).products['tool'].name == 'Tool'
+    assert len(parses) == 1
+
+    # 내용이 바뀌면 다시 컴파일
+    config_path.write_text("products:\n  tool:\n    name: Tool 2\n", encoding='utf-8')
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert compile_products_config(str(config_path), cache_dir=str(cache_dir)).products['tool'].name == 'Tool 2'
+    assert len(parses) == 2
+    config_compiler.clear_config_cache()
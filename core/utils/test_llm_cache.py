@@ -0,0 +1,80 @@
+"""
+LLM Response Cache 테스트
+
+같은 (모델, 프롬프트, 설정)은 API를 다시 호출하지 않고, TTL / LRU 용량 제한 / 우회가 동작하는지 테스트합니다.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.executors.action_extractor import ActionExtractor
+from core.utils.llm_cache import LLMResponseCache
+
+
+def test_identical_prompt_is_served_from_cache(tmp_path, fake_genai):
+    """같은 모델/프롬프트/설정은 한 번만 호출하고, 하나라도 다르면 새로 호출한다"""
+    client = fake_genai()
+    cache = LLMResponseCache(str(tmp_path))
+
+    first = cache.generate(client, 'gemini-2.0-flash', '프롬프트')
+    second = LLMResponseCache(str(tmp_path)).generate(client, 'gemini-2.0-flash', '프롬프트')
+    cache.generate(client, 'gemini-2.0-flash', '프롬프트', config={'temperature': 0.2})
+    cache.generate(client, 'gemini-2.5-flash', '프롬프트')
+
+    assert first == second == '응답'
+    assert len(client.calls) == 3
+    assert cache.hits == 0 and cache.misses == 3
+
+
+def test_ttl_bypass_and_empty_responses(tmp_path, fake_genai):
+    """만료된 응답과 우회 모드는 새로 호출하고, 빈 응답은 저장하지 않는다"""
+    client = fake_genai()
+    cache = LLMResponseCache(str(tmp_path), ttl_seconds=60)
+    cache.generate(client, 'm', 'p')
+
+    expired = LLMResponseCache(str(tmp_path), ttl_seconds=0)
+    expired.generate(client, 'm', 'p')
+    LLMResponseCache(str(tmp_path), bypass=True).generate(client, 'm', 'p')
+    assert len(client.calls) == 3
+
+    client.text = ''
+    cache.generate(client, 'm', 'empty')
+    cache.generate(client, 'm', 'empty')
+    assert len(client.calls) == 5
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    """용량을 넘으면 가장 오래 사용하지 않은 응답부터 지운다"""
+    cache = LLMResponseCache(str(tmp_path), max_bytes=2500)
+    keys = [cache.make_key('m', f'prompt {i}') for i in range(3)]
+    for age, key in zip((30, 20), keys[:2]):
+        cache.set(key, 'x' * 1000)
+        past = time.time() - age
+        os.utime(cache._path(key), (past, past))
+
+    assert cache.get(keys[0]) is not None  # 사용하면 가장 최근 항목이 됨
+    cache.set(keys[2], 'x' * 1000)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+
+
+def test_action_extractor_fallback_shares_cache(tmp_path, fake_genai):
+    """ActionExtractor의 Gemini fallback도 같은 리포트면 저장된 응답을 재사용한다"""
+    client = fake_genai(
+        '[{"product_id": "qr-generator", "action_type": "update_meta_title", '
+        '"target_file": "src/app/layout.tsx", "parameters": {"new_title": "Free QR Code Generator"}}]'
+    )
+    extractor = ActionExtractor(llm_cache=LLMResponseCache(str(tmp_path)), client=client)
+
+    first = extractor._parse_with_gemini('리포트 본문')
+    second = extractor._parse_with_gemini('리포트 본문')
+
+    assert len(client.calls) == 1
+    assert [a.target_file for a in first] == [a.target_file for a in second] == ['src/app/layout.tsx']
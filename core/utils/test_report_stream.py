@@ -0,0 +1,75 @@
+"""
+Report Stream 테스트
+
+스트리밍 청크가 도착하는 즉시 파일에 쓰이고, 청크 경계와 무관하게 완료된 섹션을 알리는지 테스트합니다.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils.llm_cache import LLMResponseCache, stream_text
+from core.utils.report_stream import ReportStream
+
+
+REPORT = "# Report\n\n## 📊 Executive Summary\n요약 내용\n\n## ✅ Action Plan\n1. 액션\n"
+
+
+class _FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeStreamingGenAI:
+    """응답을 일정 크기 청크로 나눠 돌려주는 가짜 genai.Client"""
+
+    def __init__(self, text: str, size: int = 7):
+        self.text = text
+        self.size = size
+        self.calls = 0
+        self.models = self
+
+    def generate_content_stream(self, model, contents, config=None):
+        self.calls += 1
+        for start in range(0, len(self.text), self.size):
+            yield _FakeChunk(self.text[start:start + self.size])
+        yield _FakeChunk(None)
+
+
+def test_chunks_are_written_as_they_arrive_and_sections_reported():
+    """청크마다 파일에 바로 쓰이고, 줄 중간에서 끊긴 제목도 섹션으로 인식한다"""
+    out = io.StringIO()
+    written_when_called = []
+    finished = []
+    stream = ReportStream(
+        out,
+        on_chunk=lambda chunk, s: written_when_called.append(len(out.getvalue())),
+        on_section=lambda title, body: finished.append((title, body))
+    )
+
+    text = stream_text(_FakeStreamingGenAI(REPORT), 'm', 'prompt', on_text=stream.write)
+    stream.close()
+
+    assert text == out.getvalue() == REPORT
+    assert written_when_called == sorted(written_when_called) and written_when_called[0] == 7
+    assert stream.chunks == len(written_when_called) and stream.first_chunk_seconds is not None
+    assert finished == [('📊 Executive Summary', '요약 내용'), ('✅ Action Plan', '1. 액션')]
+
+
+def test_cached_stream_writes_once_without_calling_api(tmp_path):
+    """같은 프롬프트는 저장된 응답을 한 번에 쓰고 API를 다시 호출하지 않는다"""
+    client = _FakeStreamingGenAI(REPORT)
+    cache = LLMResponseCache(str(tmp_path))
+    stream_text(client, 'm', 'prompt', on_text=ReportStream(io.StringIO()).write, cache=cache)
+
+    out = io.StringIO()
+    stream = ReportStream(out)
+    text = stream_text(client, 'm', 'prompt', on_text=stream.write, cache=cache)
+
+    assert client.calls == 1
+    assert text == out.getvalue() == REPORT
+    assert stream.chunks == 1
@@ -9,6 +9,10 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
 
+from core.storage.metrics_store import MetricsStore
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'metrics')
+
 def get_daily_traffic(property_id, credentials_path, days=4):
     credentials = service_account.Credentials.from_service_account_file(
         credentials_path,
@@ -119,8 +123,24 @@ def get_traffic_sources(property_id, credentials_path, start_date_str, end_date_
     except Exception as e:
         return f"Error: {str(e)}"
 
+def get_stored_history(product_id, dataset, start_date=None, end_date=None, data_dir=DEFAULT_DATA_DIR):
+    # main.py가 저장한 스냅샷 이력 (API 호출 없음)
+    return MetricsStore(data_dir).history(product_id, dataset, start_date, end_date)
+
+def get_stored_traffic_sources(product_id, snapshot_date=None, data_dir=DEFAULT_DATA_DIR):
+    # snapshot_date가 없으면 가장 최근 스냅샷
+    return MetricsStore(data_dir).load(product_id, 'ga4_traffic', snapshot_date)
+
 if __name__ == '__main__':
     load_dotenv()
+
+    if '--offline' in sys.argv:
+        print("\n--- QR Studio Traffic Sources (stored snapshots) ---")
+        print(get_stored_history('qr-generator', 'ga4_traffic'))
+        print("\n--- QR Studio Top Queries (stored snapshots) ---")
+        print(get_stored_history('qr-generator', 'gsc_top_queries'))
+        sys.exit(0)
+
     credentials_path = '/Users/comento/agent-product/unified-agent/config/gsc_credentials.json'
     qr_property_id = "517636540"
     
@@ -9,25 +9,50 @@ Unified Multi-Product Agent
 
 import os
 import sys
+import time
+import traceback
 import yaml
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from dotenv import load_dotenv
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
 from core.collectors.gsc_collector import GSCCollector
+from core.collectors.gsc_cube import GSCCube
 from core.collectors.ga4_collector import GA4Collector
 from core.collectors.trends_collector import TrendsCollector
 from core.collectors.adsense_collector import AdSenseCollector
+from core.collectors.async_engine import CollectionEngine, close_thread_runner
+from core.collectors.client_pool import close_ga4_async_clients
 from core.analyzers.comparative_analyzer import ComparativeAnalyzer
+from core.analyzers.product_summary import summarize_product
+from core.analyzers.structured_output import dump_structured_report, parse_structured_report
+from core.executors.action_sidecar import remove_action_sidecar, write_action_sidecar
+from core.storage.metrics_store import SOURCES, MetricsStore, content_hash
+from core.utils.config_compiler import CompiledConfig, ConfigError, compile_products_config
+from core.utils.llm_cache import configure_llm_cache
 from core.utils.formatter import format_report_header, format_report_footer, save_report
+from core.utils.log_capture import capture_output
+from core.utils.report_stream import ReportStream
 from core.level2_agent import Level2Agent
 from core.level2_agent_v2 import Level2AgentV2
 
 
-def load_products_config():
-    """products.yaml 설정 파일 로드"""
+# 컴파일된 products.yaml 캐시 (짧게 끝나는 실행 간에도 파싱/검증을 건너뜀)
+CONFIG_CACHE_DIR = os.path.join('data', 'config_cache')
+
+
+def load_compiled_config() -> CompiledConfig:
+    """
+    products.yaml을 스키마로 검증하고 기본값을 채운 컴파일 결과 로드
+
+    파일 mtime/내용 해시가 같으면 캐시된 결과를 재사용합니다.
+    설정 오류가 있으면 모든 문제를 출력하고 종료합니다.
+    """
     config_path = os.path.join(os.path.dirname(__file__), 'config', 'products.yaml')
 
     if not os.path.exists(config_path):
@@ -35,24 +60,228 @@ def load_products_config():
         print("   config/products.yaml 파일을 생성해주세요.")
         sys.exit(1)
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    try:
+        compiled = compile_products_config(config_path, cache_dir=_resolve_data_path(CONFIG_CACHE_DIR))
+    except (ConfigError, yaml.YAMLError) as e:
+        print(f"❌ 설정 파일 오류: {e}")
+        sys.exit(1)
+
+    for warning in compiled.warnings:
+        print(f"⚠️  {warning}")
+    return compiled
+
+
+def load_products_config():
+    """products.yaml 설정 파일 로드 (검증/기본값 정규화를 거친 {'products': ..., 'global': ...} 딕셔너리)"""
+    return load_compiled_config().as_dict()
+
+
+def _resolve_data_path(path: str) -> str:
+    """설정 파일의 상대 경로를 프로젝트 루트 기준 절대 경로로 변환"""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+
+def _trends_anchor(global_config: dict, products: dict) -> str:
+    """
+    실행 전체의 Trends 기준 키워드
+
+    global.trends_anchor_keyword가 없으면 설정 파일의 첫 번째 프로덕트 이름을 사용합니다.
+    수집 전에 부모 프로세스에서 한 번 정하므로, 어느 프로덕트의 수집이 먼저 끝나든 같은 척도가 됩니다.
+    """
+    configured = global_config.get('trends_anchor_keyword')
+    if configured:
+        return configured
+    product_id, product_config = next(iter(products.items()))
+    return product_config.get('name', product_id).lower()
+
+
+def _with_trends_anchor(global_config: dict, products: dict) -> dict:
+    """기준 키워드를 정해 global 설정에 기록한 사본 (이미 정해져 있으면 그대로)"""
+    global_config = dict(global_config or {})
+    if products and not global_config.get('trends_anchor_keyword'):
+        global_config['trends_anchor_keyword'] = _trends_anchor(global_config, products)
+    return global_config
 
 
-def collect_product_data(product_id: str, product_config: dict, credentials_path: str):
+def _source_windows(product_config: dict, days: int, trends_anchor: str = None) -> dict:
+    """
+    설정된 소스별 수집 기간 키
+
+    키가 지난 수집 때와 같으면 다시 수집해도 같은 데이터이므로 재사용할 수 있습니다.
+    (기간은 날짜가 바뀌면 넘어가고, 프로덕트 설정이 바뀌어도 키가 달라집니다.
+    Trends는 기준 키워드가 바뀌어도 척도가 달라지므로 키에 기준 키워드를 포함합니다.)
+    """
+    today = datetime.now().date()
+    gsc_end = today - timedelta(days=3)  # GSC는 최근 3일 데이터가 확정되지 않음
+    config_hash = content_hash(product_config)[:12]
+
+    def _window(start, end):
+        return f"{start}~{end}|{config_hash}"
+
+    windows = {}
+    gsc_url = product_config.get('gsc_property_url')
+    if gsc_url and not gsc_url.startswith('REPLACE'):
+        windows['gsc'] = _window(gsc_end - timedelta(days=days), gsc_end)
+        windows['trends'] = f"{_window(today, today)}|anchor={trends_anchor}"
+    ga4_id = product_config.get('ga4_property_id')
+    if ga4_id and not str(ga4_id).startswith('REPLACE'):
+        windows['ga4'] = _window(today - timedelta(days=days), today)
+    if product_config.get('has_adsense'):
+        windows['adsense'] = _window(today - timedelta(days=days), today)
+    return windows
+
+
+def _collect_gsc(credentials_path: str, gsc_url: str, days: int, cache_dir: str = None):
+    """GSC 검색 데이터 수집 (실패 시 None)"""
+    try:
+        print(f"\n  🔍 GSC 데이터 수집...")
+        collector = GSCCollector(credentials_path, gsc_url, cache_dir=cache_dir)
+        # 헤드라인 지표와 순위는 query x page 요청 그대로 사용
+        # (차원이 많을수록 Search Console이 드문 검색어를 더 많이 생략하므로 큐브 롤업 합계는 더 작음)
+        df_all = collector.fetch_search_analytics(days=days)
+
+        if df_all.empty:
+            print(f"     ⚠️  수집된 데이터 없음")
+            return None
+
+        # 상위 검색어 / 기회 키워드 / 순위 구간 기회를 한 번의 스캔으로 계산
+        rankings = collector.build_opportunity_index(df_all, top_limit=20, opportunity_limit=10, band_limit=10)
+        gsc = {
+            'top_queries': rankings.top_queries(),
+            'opportunities': rankings.opportunities(),
+            'position_opportunities': rankings.position_band_opportunities(),
+            'page_performance': collector.get_page_performance(df_all)
+        }
+
+        # 국가 / 디바이스 / 페이지 일별 조합은 최소 단위(query x page x country x device x date) 큐브에서 롤업
+        try:
+            cube = collector.fetch_cube(days=days)
+        except Exception as e:
+            print(f"     ⚠️  GSC 큐브 수집 실패 (국가/디바이스 분석 건너뜀): {str(e)}")
+            cube = GSCCube(None)
+        gsc['country_performance'] = cube.country_performance()
+        gsc['device_performance'] = cube.device_ctr()
+        gsc['cube'] = cube.facts
+
+        print(f"     ✓ {len(df_all)}개 검색어 수집 완료 "
+              f"(국가 {len(gsc['country_performance'])}개, 디바이스 {len(gsc['device_performance'])}개)")
+        return gsc
+
+    except Exception as e:
+        print(f"     ❌ GSC 수집 실패: {str(e)}")
+        return None
+
+
+async def _collect_ga4(credentials_path: str, property_id: str, days: int):
+    """GA4 리포트 수집 (네이티브 async 클라이언트, 실패 시 None)"""
+    try:
+        print(f"\n  📈 GA4 데이터 수집...")
+        ga4_collector = GA4Collector(credentials_path, property_id)
+        ga4 = await ga4_collector.fetch_all_async(days=days)
+        print(f"     ✓ GA4 데이터 수집 완료")
+        return ga4
+
+    except Exception as e:
+        print(f"     ❌ GA4 수집 실패: {str(e)}")
+        return None
+
+
+def _trends_keywords(gsc: dict) -> list:
+    """Google Trends로 분석할 GSC 상위 검색어 (최대 10개)"""
+    if not gsc or gsc.get('top_queries') is None:
+        return []
+    return gsc['top_queries']['query'].head(10).tolist()
+
+
+def _collect_trends(keywords: list, cache_dir: str = None, cache_ttl_hours: float = 24, anchor: str = None):
+    """검색어 목록의 Google Trends 수집 (anchor: 실행 공통 기준 키워드, 검색어가 없거나 실패 시 None)"""
+    if not keywords:
+        return None
+
+    try:
+        print(f"\n  📊 Google Trends 데이터 수집...")
+        trends_collector = TrendsCollector(cache_dir=cache_dir, cache_ttl_hours=cache_ttl_hours)
+
+        trends = trends_collector.analyze_keyword_trends(
+            keywords,
+            timeframe='today 3-m',
+            anchor=anchor
+        )
+        print(f"     ✓ {len(keywords)}개 키워드 트렌드 분석 완료")
+        return trends
+
+    except Exception as e:
+        print(f"     ⚠️  Trends 수집 실패 (건너뜀): {str(e)}")
+        return None
+
+
+def _collect_adsense(product_config: dict, days: int):
+    """AdSense 수익 데이터 수집 (실패 시 None)"""
+    try:
+        print(f"\n  💰 AdSense 데이터 수집...")
+        client_id = product_config.get('adsense_client_id', '')
+        adsense_collector = AdSenseCollector(client_id)
+        adsense = adsense_collector.get_revenue_data(days=days)
+
+        if adsense['source'] == 'manual':
+            print(f"     ℹ️  환경변수에서 읽음 (ADSENSE_REVENUE, ADSENSE_IMPRESSIONS, ADSENSE_CLICKS)")
+        print(f"     ✓ 수익: ${adsense['revenue']:.2f}, RPM: ${adsense['rpm']:.2f}")
+        return adsense
+
+    except Exception as e:
+        print(f"     ❌ AdSense 수집 실패: {str(e)}")
+        return None
+
+
+def collect_product_data(
+    product_id: str,
+    product_config: dict,
+    credentials_path: str,
+    global_config: dict = None,
+    deadline: float = None,
+    store: MetricsStore = None,
+    collect_trends: bool = True
+):
     """
     단일 프로덕트의 데이터 수집
 
+    GSC, GA4, AdSense는 서로 독립적이므로 동시에 수집하고,
+    Trends는 GSC 상위 검색어가 준비되는 즉시 시작합니다.
+    소스별 제한 시간(call_timeout_seconds)이나 전체 마감 시각을 넘긴 소스는
+    취소하고 나머지 데이터만으로 진행합니다.
+
+    저장소가 주어지면 수집 기간과 설정이 지난 수집 때와 같은 소스는 API를 호출하지 않고
+    저장된 데이터를 재사용하며, 새로 수집한 소스만 저장합니다.
+
     Args:
         product_id: 프로덕트 식별자 (예: 'qr-generator')
         product_config: 프로덕트 설정
         credentials_path: Google 인증 파일 경로
+        global_config: products.yaml의 global 섹션 (캐시 경로, 제한 시간 등)
+        deadline: 전체 실행 마감 시각 (time.monotonic() 기준, None이면 제한 없음)
+        store: 수집 결과 저장소 (None이면 재사용/저장하지 않음)
+        collect_trends: False면 Trends를 수집하지 않고 분석할 검색어만 'trends_keywords'에 기록
+            (샤딩 실행에서 부모 프로세스가 collect_shared_trends()로 모아서 수집)
 
     Returns:
-        수집된 데이터 딕셔너리
+        수집된 데이터 딕셔너리 (소스별 소요 시간은 'timings',
+        시간 초과로 빠진 소스는 'timed_out', 소스별 내용 해시는 'content_hashes'에 기록)
     """
     product_name = product_config.get('name', product_id)
     days = product_config.get('analysis_days', 7)
+    global_config = global_config or {}
+
+    gsc_cache_dir = global_config.get('gsc_cache_dir')
+    if gsc_cache_dir:
+        gsc_cache_dir = _resolve_data_path(gsc_cache_dir)
+
+    trends_cache_dir = global_config.get('trends_cache_dir')
+    if trends_cache_dir:
+        trends_cache_dir = _resolve_data_path(trends_cache_dir)
+    trends_cache_ttl_hours = global_config.get('trends_cache_ttl_hours', 24)
+    trends_anchor = global_config.get('trends_anchor_keyword')
 
     print(f"\n{'='*60}")
     print(f"📊 {product_name} ({product_id}) 데이터 수집 중...")
@@ -65,87 +294,392 @@ def collect_product_data(product_id: str, product_config: dict, credentials_path
         'gsc': None,
         'ga4': None,
         'trends': None,
-        'adsense': None
+        'adsense': None,
+        'timings': {},
+        'timed_out': [],
+        'content_hashes': {}
     }
 
+    # 같은 기간으로 이미 수집해 둔 소스는 저장소에서 재사용
+    windows = _source_windows(product_config, days, trends_anchor)
+    if not collect_trends:
+        windows.pop('trends', None)
+    reused = {}
+    if store is not None:
+        for source, window in windows.items():
+            cached = store.load_fresh_source(product_id, source, window)
+            if cached is not None:
+                reused[source] = cached
+                print(f"  ♻️  {source}: 같은 기간({window.split('|')[0]}) 데이터 재사용")
+
+    graph = CollectionEngine(
+        call_timeout=global_config.get('call_timeout_seconds'),
+        deadline=deadline
+    )
+
     # 1. Google Search Console 데이터
     gsc_url = product_config.get('gsc_property_url')
-    if gsc_url and not gsc_url.startswith('REPLACE'):
-        try:
-            print(f"\n  🔍 GSC 데이터 수집...")
-            collector = GSCCollector(credentials_path, gsc_url)
-            df_all = collector.fetch_search_analytics(days=days)
-
-            if not df_all.empty:
-                data['gsc'] = {
-                    'top_queries': collector.get_top_queries(df_all, limit=20),
-                    'opportunities': collector.get_opportunity_keywords(df_all, limit=10),
-                    'page_performance': collector.get_page_performance(df_all)
-                }
-                print(f"     ✓ {len(df_all)}개 검색어 수집 완료")
-            else:
-                print(f"     ⚠️  수집된 데이터 없음")
-
-        except Exception as e:
-            print(f"     ❌ GSC 수집 실패: {str(e)}")
-    else:
+    if 'gsc' not in windows:
         print(f"  ⏭️  GSC 수집 건너뜀 (설정 필요)")
+    elif 'gsc' not in reused:
+        graph.add('gsc', lambda: _collect_gsc(credentials_path, gsc_url, days, gsc_cache_dir))
 
-    # 2. Google Analytics 4 데이터
+    # 2. Google Analytics 4 데이터 (batchRunReports 1회로 4개 리포트)
     ga4_id = product_config.get('ga4_property_id')
-    if ga4_id and not str(ga4_id).startswith('REPLACE'):
-        try:
-            print(f"\n  📈 GA4 데이터 수집...")
-            ga4_collector = GA4Collector(credentials_path, str(ga4_id))
+    if 'ga4' not in windows:
+        print(f"  ⏭️  GA4 수집 건너뜀 (설정 필요)")
+    elif 'ga4' not in reused:
+        graph.add('ga4', partial(_collect_ga4, credentials_path, str(ga4_id), days))
+
+    # 3. Google Trends 데이터 (GSC 상위 검색어에 의존, 재사용한 Trends는 위에서 이미 안내)
+    trends_pending = 'trends' in windows and 'trends' not in reused
+    if trends_pending and 'gsc' in reused:
+        trends_keywords = _trends_keywords(reused['gsc'][0])
+        graph.add('trends', lambda: _collect_trends(trends_keywords, trends_cache_dir, trends_cache_ttl_hours, trends_anchor))
+    elif trends_pending and 'gsc' in graph:
+        graph.add(
+            'trends',
+            lambda gsc: _collect_trends(_trends_keywords(gsc), trends_cache_dir, trends_cache_ttl_hours, trends_anchor),
+            depends_on=['gsc']
+        )
 
-            data['ga4'] = {
-                'pages': ga4_collector.fetch_page_performance(days=days),
-                'traffic': ga4_collector.fetch_traffic_sources(days=days),
-                'devices': ga4_collector.fetch_device_breakdown(days=days),
-                'events': ga4_collector.get_conversion_events(days=days)
-            }
-            print(f"     ✓ GA4 데이터 수집 완료")
+    # 4. AdSense 데이터 (있는 경우)
+    if 'adsense' in windows and 'adsense' not in reused:
+        graph.add('adsense', lambda: _collect_adsense(product_config, days))
 
-        except Exception as e:
-            print(f"     ❌ GA4 수집 실패: {str(e)}")
-    else:
-        print(f"  ⏭️  GA4 수집 건너뜀 (설정 필요)")
+    result = graph.run()
 
-    # 3. Google Trends 데이터
-    if data['gsc'] and data['gsc']['top_queries'] is not None:
-        try:
-            print(f"\n  📊 Google Trends 데이터 수집...")
-            trends_collector = TrendsCollector()
-
-            top_keywords = data['gsc']['top_queries']['query'].head(10).tolist()
-            if top_keywords:
-                data['trends'] = trends_collector.analyze_keyword_trends(
-                    top_keywords,
-                    timeframe='today 3-m'
-                )
-                print(f"     ✓ {len(top_keywords)}개 키워드 트렌드 분석 완료")
+    for name, error in result.errors.items():
+        print(f"     ❌ {name} 수집 실패: {str(error)}")
 
-        except Exception as e:
-            print(f"     ⚠️  Trends 수집 실패 (건너뜀): {str(e)}")
+    for name in result.skipped:
+        print(f"     ⏭️  {name} 건너뜀 (선행 소스 실패 또는 시간 초과)")
 
-    # 4. AdSense 데이터 (있는 경우)
-    if product_config.get('has_adsense'):
-        try:
-            print(f"\n  💰 AdSense 데이터 수집...")
-            client_id = product_config.get('adsense_client_id', '')
-            adsense_collector = AdSenseCollector(client_id)
-            data['adsense'] = adsense_collector.get_revenue_data(days=days)
+    data['timed_out'] = result.timed_out
+    if data['timed_out']:
+        print(f"\n  ⚠️  시간 초과로 제외된 소스: {', '.join(data['timed_out'])} (부분 데이터로 분석)")
 
-            if data['adsense']['source'] == 'manual':
-                print(f"     ℹ️  환경변수에서 읽음 (ADSENSE_REVENUE, ADSENSE_IMPRESSIONS, ADSENSE_CLICKS)")
-            print(f"     ✓ 수익: ${data['adsense']['revenue']:.2f}, RPM: ${data['adsense']['rpm']:.2f}")
+    for source, (value, value_hash) in reused.items():
+        data[source] = value
+        data['content_hashes'][source] = value_hash
 
-        except Exception as e:
-            print(f"     ❌ AdSense 수집 실패: {str(e)}")
+    refreshed = [source for source in SOURCES if result.results.get(source) is not None]
+    for source in refreshed:
+        data[source] = result.results[source]
+        data['content_hashes'][source] = content_hash(data[source])
+
+    # 새로 수집한 소스만 저장하고, 저장이 끝난 뒤 신선도 정보를 기록
+    if store is not None and refreshed:
+        saved = store.save_product_data(data, sources=refreshed)
+        for source in refreshed:
+            store.mark_fresh(product_id, source, windows[source], data['content_hashes'][source])
+        print(f"\n  💾 {len(saved)}개 데이터셋 저장 (새로 수집: {', '.join(refreshed)})")
+
+    if not collect_trends:
+        data['trends_keywords'] = _trends_keywords(data['gsc'])
+
+    # 소스별 소요 시간 (가장 늦게 끝난 소스가 프로덕트 전체 수집 시간을 결정)
+    data['timings'] = {name: timing.duration for name, timing in result.timings.items()}
+    if result.timings:
+        timing_str = ", ".join(f"{name} {duration:.2f}s" for name, duration in data['timings'].items())
+        print(f"\n  ⏱️  소스별 소요 시간: {timing_str}")
+        print(f"     병목 소스: {result.bottleneck} ({result.timings[result.bottleneck].finished_at:.2f}s)")
 
     return data
 
 
+def collect_all_products(
+    products: dict,
+    credentials_path: str,
+    max_workers: int = 4,
+    global_config: dict = None,
+    store: MetricsStore = None,
+    collect_trends: bool = True
+) -> list:
+    """
+    여러 프로덕트의 데이터를 제한된 워커 풀에서 동시에 수집
+
+    각 프로덕트의 출력은 별도 버퍼에 모았다가 products.yaml 순서대로 출력하므로
+    병렬로 실행해도 로그가 뒤섞이지 않습니다. 한 프로덕트의 실패는 다른 프로덕트에
+    영향을 주지 않습니다. global 섹션의 run_deadline_seconds가 지나면
+    아직 끝나지 않은 소스는 취소되고 수집된 부분 데이터만 반환합니다.
+
+    Args:
+        products: products.yaml의 products 섹션
+        credentials_path: Google 인증 파일 경로
+        max_workers: 동시에 수집할 최대 프로덕트 수
+        global_config: products.yaml의 global 섹션
+        store: 수집 결과 저장소 (같은 기간 데이터 재사용 및 저장)
+        collect_trends: False면 Trends 대신 분석할 검색어만 기록 (collect_product_data() 참고)
+
+    Returns:
+        수집에 성공한 프로덕트 데이터 리스트 (설정 파일 순서 유지)
+    """
+    global_config = _with_trends_anchor(global_config, products)
+    run_deadline_seconds = global_config.get('run_deadline_seconds')
+    deadline = time.monotonic() + run_deadline_seconds if run_deadline_seconds else None
+
+    def _collect(product_id: str, product_config: dict):
+        with capture_output() as log:
+            try:
+                product_data = collect_product_data(
+                    product_id, product_config, credentials_path, global_config, deadline, store, collect_trends
+                )
+            except Exception as e:
+                product_data = None
+                print(f"\n❌ {product_id} 데이터 수집 중 오류: {str(e)}")
+                traceback.print_exc(file=sys.stdout)
+            finally:
+                # 이 스레드의 이벤트 루프와 루프에 묶인 GA4 async 클라이언트(gRPC 채널) 정리
+                close_thread_runner(close_ga4_async_clients)
+        return product_data, log.getvalue()
+
+    if not products:
+        return []
+
+    workers = max(1, min(int(max_workers), len(products)))
+    print(f"\n⚙️  병렬 수집: 최대 {workers}개 프로덕트 동시 실행")
+
+    all_data = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='collect') as executor:
+        futures = [
+            executor.submit(_collect, product_id, product_config)
+            for product_id, product_config in products.items()
+        ]
+        # 완료 순서가 아닌 설정 순서대로 결과와 로그를 출력
+        for future in futures:
+            product_data, log = future.result()
+            sys.stdout.write(log)
+            if product_data is not None:
+                all_data.append(product_data)
+
+    return all_data
+
+
+def _collect_shard(
+    shard: dict,
+    credentials_path: str,
+    max_workers: int,
+    global_config: dict,
+    data_dir: str = None
+):
+    """
+    프로세스 풀 워커: 프로덕트 묶음을 수집하고 비교 분석용 요약만 반환
+
+    전체 데이터는 워커 안에서 저장소에 저장하고, 부모 프로세스로는 summarize_product() 결과만 보냅니다.
+    Trends는 수집하지 않고 분석할 검색어('trends_keywords')만 요약에 담습니다 (collect_shared_trends() 참고).
+
+    Returns:
+        (요약 리스트, 묶음 전체 출력)
+    """
+    store = MetricsStore(data_dir) if data_dir else None
+    with capture_output() as log:
+        all_data = collect_all_products(
+            shard, credentials_path, max_workers=max_workers, global_config=global_config, store=store,
+            collect_trends=False
+        )
+        summaries = [summarize_product(data) for data in all_data]
+    return summaries, log.getvalue()
+
+
+def collect_shared_trends(
+    all_data: list,
+    global_config: dict = None,
+    store: MetricsStore = None,
+    deadline: float = None
+) -> None:
+    """
+    샤드 요약을 합친 뒤 부모 프로세스에서 모든 프로덕트의 Trends를 수집해 요약에 채움
+
+    속도 제한기와 기준 키워드 척도는 프로세스 단위이므로, 워커마다 Trends를 수집하면
+    요청 속도가 프로세스 수만큼 늘고 샤드 간 중복 키워드도 다시 요청하게 됩니다.
+    여기서는 한 프로세스의 제한기와 척도로 모든 프로덕트를 수집합니다.
+
+    Args:
+        all_data: 'trends_keywords'를 담은 프로덕트 요약 리스트 (제자리에서 갱신)
+        global_config: products.yaml의 global 섹션 (기준 키워드가 정해져 있어야 함)
+        store: 수집 결과 저장소 (같은 기준 키워드로 수집해 둔 Trends 재사용 및 저장)
+        deadline: 전체 실행 마감 시각 (time.monotonic() 기준, None이면 제한 없음)
+    """
+    global_config = global_config or {}
+    trends_cache_dir = global_config.get('trends_cache_dir')
+    if trends_cache_dir:
+        trends_cache_dir = _resolve_data_path(trends_cache_dir)
+    trends_cache_ttl_hours = global_config.get('trends_cache_ttl_hours', 24)
+    anchor = global_config.get('trends_anchor_keyword')
+
+    def _collect_product_trends(product_name: str, keywords: list):
+        print(f"\n  📦 {product_name}")
+        return _collect_trends(keywords, trends_cache_dir, trends_cache_ttl_hours, anchor)
+
+    engine = CollectionEngine(call_timeout=global_config.get('call_timeout_seconds'), deadline=deadline)
+    windows = {}
+    for data in all_data:
+        keywords = data.pop('trends_keywords', None)
+        product_config = data.get('config', {})
+        window = _source_windows(product_config, product_config.get('analysis_days', 7), anchor).get('trends')
+        if not keywords or window is None:
+            continue
+        windows[data['id']] = window
+
+        cached = store.load_fresh_source(data['id'], 'trends', window) if store is not None else None
+        if cached is not None:
+            data['trends'], data['content_hashes']['trends'] = cached
+            print(f"  ♻️  {data['name']} trends: 같은 기준 키워드 데이터 재사용")
+            continue
+        engine.add(data['id'], partial(_collect_product_trends, data['name'], keywords))
+
+    if not len(engine):
+        return
+
+    print(f"\n📊 Google Trends 수집: {len(engine)}개 프로덕트 (기준 키워드: '{anchor}')")
+    try:
+        result = engine.run()
+    finally:
+        close_thread_runner()
+
+    for name, error in result.errors.items():
+        print(f"     ❌ {name} Trends 수집 실패: {str(error)}")
+
+    for data in all_data:
+        if data['id'] in result.timed_out:
+            data['timed_out'] = data.get('timed_out', []) + ['trends']
+        trends = result.results.get(data['id'])
+        if trends is None:
+            continue
+        data['trends'] = trends
+        data['content_hashes']['trends'] = content_hash(trends)
+        if store is not None:
+            store.save_product_data(data, sources=['trends'])
+            store.mark_fresh(data['id'], 'trends', windows[data['id']], data['content_hashes']['trends'])
+
+
+def _shard_products(products: dict, shards: int) -> list:
+    """설정 순서를 유지한 채 프로덕트를 거의 같은 크기의 연속 묶음으로 분할"""
+    items = list(products.items())
+    size, remainder = divmod(len(items), shards)
+    result = []
+    start = 0
+    for index in range(shards):
+        end = start + size + (1 if index < remainder else 0)
+        if end > start:
+            result.append(dict(items[start:end]))
+        start = end
+    return result
+
+
+def collect_sharded(
+    products: dict,
+    credentials_path: str,
+    process_workers: int,
+    max_workers: int = 4,
+    global_config: dict = None,
+    data_dir: str = None
+) -> list:
+    """
+    프로덕트를 여러 프로세스로 나눠 수집 (대규모 포트폴리오용)
+
+    각 워커 프로세스는 자기 묶음을 collect_all_products()로 수집/저장한 뒤
+    요약(summarize_product())만 돌려주며, 결과와 로그는 설정 순서대로 합칩니다.
+    Google Trends는 요약을 합친 뒤 부모 프로세스에서 한 번에 수집합니다
+    (하나의 속도 제한기와 기준 키워드 척도, 샤드 간 중복 키워드는 한 번만 요청).
+    gRPC 클라이언트는 fork 이후 안전하지 않으므로 워커는 spawn으로 시작합니다.
+    한 묶음의 실패는 다른 묶음에 영향을 주지 않습니다.
+
+    Args:
+        products: products.yaml의 products 섹션
+        credentials_path: Google 인증 파일 경로
+        process_workers: 프로세스 수
+        max_workers: 프로세스마다 동시에 수집할 최대 프로덕트 수
+        global_config: products.yaml의 global 섹션
+        data_dir: 워커가 수집 결과를 저장할 저장소 경로 (None이면 저장하지 않음)
+
+    Returns:
+        수집에 성공한 프로덕트 요약 리스트 (설정 파일 순서 유지)
+    """
+    if not products:
+        return []
+
+    run_deadline_seconds = (global_config or {}).get('run_deadline_seconds')
+    deadline = time.monotonic() + run_deadline_seconds if run_deadline_seconds else None
+
+    # 기준 키워드는 모든 프로세스가 같은 값을 쓰도록 나누기 전에 정함
+    global_config = _with_trends_anchor(global_config, products)
+    shards = _shard_products(products, max(1, min(int(process_workers), len(products))))
+    print(f"\n⚙️  프로세스 샤딩: {len(products)}개 프로덕트 → {len(shards)}개 프로세스 "
+          f"(프로세스당 최대 {max_workers}개 동시 수집)")
+
+    all_data = []
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        futures = [
+            executor.submit(_collect_shard, shard, credentials_path, max_workers, global_config, data_dir)
+            for shard in shards
+        ]
+        for shard, future in zip(shards, futures):
+            try:
+                summaries, log = future.result()
+            except Exception as e:
+                print(f"\n❌ 프로세스 수집 실패 ({', '.join(shard)}): {str(e)}")
+                continue
+            sys.stdout.write(log)
+            all_data.extend(summaries)
+
+    collect_shared_trends(all_data, global_config, MetricsStore(data_dir) if data_dir else None, deadline)
+    return all_data
+
+
+def _analysis_input_hash(all_data: list, model_id: str, delta_windows: int, prompt_token_budget: int = None,
+                         analysis_mode: str = 'single', analysis_output: str = 'markdown') -> str:
+    """비교 분석 입력 해시 (프로덕트별 소스 내용 해시 + 설정 + 모델 + 프롬프트 예산 + 분석 방식/응답 형식)"""
+    inputs = []
+    for data in all_data:
+        hashes = data.get('content_hashes') or {
+            source: content_hash(data.get(source)) for source in SOURCES
+        }
+        inputs.append({
+            'id': data['id'],
+            'config': data.get('config', {}),
+            'hashes': hashes,
+            'timed_out': data.get('timed_out', [])
+        })
+    return content_hash({
+        'model': model_id,
+        'delta_windows': delta_windows,
+        'prompt_token_budget': prompt_token_budget,
+        'analysis_mode': analysis_mode,
+        'analysis_output': analysis_output,
+        'products': inputs
+    })
+
+
+def load_stored_products(products: dict, store: MetricsStore) -> list:
+    """
+    저장소에 남아 있는 가장 최근 스냅샷으로 프로덕트 데이터 복원 (API 호출 없음)
+
+    Args:
+        products: products.yaml의 products 섹션
+        store: 로컬 지표 저장소
+
+    Returns:
+        스냅샷이 있는 프로덕트 데이터 리스트 (설정 파일 순서 유지)
+    """
+    all_data = []
+    for product_id, product_config in products.items():
+        product_data = store.load_product_snapshot(product_id, product_config=product_config)
+        if product_data is None:
+            print(f"   ⚠️  {product_id}: 저장된 스냅샷 없음")
+            continue
+        older = [
+            f"{source} {day}" for source, day in product_data['source_dates'].items()
+            if day != product_data['snapshot_date']
+        ]
+        older_str = f" (이전 스냅샷: {', '.join(older)})" if older else ""
+        print(f"   📂 {product_data['name']}: {product_data['snapshot_date']} 스냅샷 사용{older_str}")
+        all_data.append(product_data)
+    return all_data
+
+
 def main():
     """메인 실행 함수"""
     print("=" * 60)
@@ -173,73 +707,150 @@ def main():
     for product_id, product_config in products.items():
         print(f"   - {product_config.get('name', product_id)} ({product_id})")
 
-    # 3. Google 인증 파일 확인
-    credentials_path = os.path.join(
-        os.path.dirname(__file__),
-        'config',
-        'gsc_credentials.json'
+    global_config = config.get('global', {})
+    data_dir = global_config.get('data_dir')
+    store = MetricsStore(_resolve_data_path(data_dir)) if data_dir else None
+    offline = os.getenv('OFFLINE_ANALYSIS', 'false').lower() == 'true'
+
+    # Gemini 응답 캐시 (비교 분석과 Level 2 액션 추출이 함께 사용)
+    llm_cache_dir = global_config.get('llm_cache_dir')
+    llm_cache = configure_llm_cache(
+        _resolve_data_path(llm_cache_dir) if llm_cache_dir else None,
+        ttl_hours=global_config.get('llm_cache_ttl_hours', 168),
+        max_mb=global_config.get('llm_cache_max_mb', 64),
+        bypass=os.getenv('LLM_CACHE_BYPASS', 'false').lower() == 'true'
     )
-
-    if not os.path.exists(credentials_path):
-        print(f"\n❌ Google 인증 파일을 찾을 수 없습니다: {credentials_path}")
-        print("   README.md의 설정 가이드를 참고해주세요.")
-        return 1
-
-    # 4. 각 프로덕트 데이터 수집
-    all_data = []
-    for product_id, product_config in products.items():
-        try:
-            product_data = collect_product_data(product_id, product_config, credentials_path)
-            all_data.append(product_data)
-        except Exception as e:
-            print(f"\n❌ {product_id} 데이터 수집 중 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+    if llm_cache is not None and llm_cache.bypass:
+        print("\n⚠️  LLM_CACHE_BYPASS=true: 저장된 Gemini 응답을 사용하지 않습니다.")
+
+    if offline:
+        # 저장된 스냅샷만으로 분석 (네트워크 호출 없음)
+        if store is None:
+            print("❌ OFFLINE_ANALYSIS=true는 products.yaml의 global.data_dir 설정이 필요합니다.")
+            return 1
+        print(f"\n📂 오프라인 분석: 저장소에서 데이터 로드 ({store.data_dir})")
+        all_data = load_stored_products(products, store)
+    else:
+        # 3. Google 인증 파일 확인
+        credentials_path = os.path.join(
+            os.path.dirname(__file__),
+            'config',
+            'gsc_credentials.json'
+        )
+
+        if not os.path.exists(credentials_path):
+            print(f"\n❌ Google 인증 파일을 찾을 수 없습니다: {credentials_path}")
+            print("   README.md의 설정 가이드를 참고해주세요.")
+            return 1
+
+        # 4. 각 프로덕트 데이터 수집 (병렬, process_workers > 1이면 프로세스별로 나눠 수집)
+        process_workers = global_config.get('process_workers') or 1
+        if process_workers > 1:
+            all_data = collect_sharded(
+                products,
+                credentials_path,
+                process_workers,
+                max_workers=global_config.get('max_workers', 4),
+                global_config=global_config,
+                data_dir=str(store.data_dir) if store is not None else None
+            )
+        else:
+            all_data = collect_all_products(
+                products,
+                credentials_path,
+                max_workers=global_config.get('max_workers', 4),
+                global_config=global_config,
+                store=store
+            )
 
     if not all_data:
         print("\n❌ 수집된 데이터가 없습니다.")
         return 1
 
+    # 비교 분석에 필요한 만큼만 남겨 메모리 해제 (저장소에는 전체 데이터가 남아 있음)
+    all_data = [summarize_product(data) for data in all_data]
+
     # 5. 비교 분석
     print("\n" + "=" * 60)
     print("🤖 Gemini AI 통합 비교 분석 중...")
     print("=" * 60)
 
-    analyzer = ComparativeAnalyzer(google_api_key)
-    comparison_report = analyzer.analyze_products(all_data)
-
-    # 6. 리포트 저장
-    print("\n📝 리포트 저장 중...")
+    analyzer = ComparativeAnalyzer(
+        google_api_key,
+        metrics_store=store,
+        delta_windows=global_config.get('delta_windows', 4),
+        prompt_token_budget=global_config.get('prompt_token_budget'),
+        analysis_mode=global_config.get('analysis_mode', 'single'),
+        analysis_workers=global_config.get('analysis_workers', 4),
+        analysis_output=global_config.get('analysis_output', 'markdown')
+    )
 
-    # 통합 리포트
+    # 통합 리포트 경로와 헤더 (분석 응답은 도착하는 대로 이 파일에 이어 씀)
     timestamp = datetime.now().strftime('%Y-%m-%d')
     comparison_dir = os.path.join(os.path.dirname(__file__), 'reports', 'comparison')
     os.makedirs(comparison_dir, exist_ok=True)
 
     comparison_path = os.path.join(comparison_dir, f'{timestamp}_multi_product_analysis.md')
 
-    # 리포트 헤더 추가
     product_names = ", ".join([d['name'] for d in all_data])
     end_date = datetime.now() - timedelta(days=3)
     start_date = end_date - timedelta(days=7)
     date_range = f"{start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}"
 
-    full_report = f"""# Multi-Product Analysis Report
+    report_header = f"""# Multi-Product Analysis Report
 생성일: {timestamp}
 분석 프로덕트: {product_names}
 데이터 기간: {date_range}
 
 ---
 
-{comparison_report}
+"""
+    report_footer = """
 
 ---
 
 *Generated by Unified Multi-Product Agent*
 """
 
+    # 입력(수집 데이터 해시, 설정, 모델)이 지난 분석과 같으면 Gemini를 다시 호출하지 않음
+    input_hash = _analysis_input_hash(
+        all_data, analyzer.model_id, global_config.get('delta_windows', 4), analyzer.prompt_token_budget,
+        analyzer.analysis_mode, analyzer.analysis_output
+    )
+    comparison_report = store.load_analysis(input_hash) if store is not None else None
+
+    print(f"\n📝 리포트 작성 중... ({comparison_path})")
+    # 이전 실행이 남긴 액션 사이드카는 JSON 모드에서 새로 쓸 때까지 쓰지 않도록 삭제
+    remove_action_sidecar(comparison_path)
     with open(comparison_path, 'w', encoding='utf-8') as f:
-        f.write(full_report)
+        f.write(report_header)
+
+        if analyzer.analysis_output == 'json':
+            # JSON 모드: 리포트와 액션 목록을 함께 받아 액션은 사이드카로 저장
+            if comparison_report is not None:
+                print(f"   ♻️  입력 데이터가 지난 분석과 같아 이전 분석 결과를 재사용합니다 ({input_hash[:12]})")
+                comparison_report, actions = parse_structured_report(comparison_report)
+            else:
+                comparison_report, actions = analyzer.analyze_products_structured(all_data)
+                if not comparison_report.startswith('❌') and store is not None:
+                    store.save_analysis(input_hash, dump_structured_report(comparison_report, actions))
+            f.write(comparison_report)
+            if not comparison_report.startswith('❌'):
+                sidecar = write_action_sidecar(comparison_path, actions)
+                print(f"   💾 액션 {len(actions)}개 저장: {sidecar}")
+        elif comparison_report is not None:
+            print(f"   ♻️  입력 데이터가 지난 분석과 같아 이전 분석 결과를 재사용합니다 ({input_hash[:12]})")
+            f.write(comparison_report)
+        else:
+            stream = ReportStream(f, on_section=lambda title, body: print(f"   ✍️  섹션 완료: {title}"))
+            comparison_report = analyzer.analyze_products(all_data, stream=stream)
+            if comparison_report.startswith('❌'):
+                # 스트리밍 도중 실패하면 받은 부분 뒤에 오류를 덧붙임
+                f.write(("\n\n" if stream.chars else "") + comparison_report)
+            elif store is not None:
+                store.save_analysis(input_hash, comparison_report)
+
+        f.write(report_footer)
 
     print(f"✅ 통합 리포트 저장: {comparison_path}")
 
@@ -258,9 +869,10 @@ def main():
     print(f"\n📊 수집된 프로덕트:")
 
     for data in all_data:
-        gsc_count = len(data['gsc']['top_queries']) if data['gsc'] and data['gsc']['top_queries'] is not None else 0
-        ga4_count = len(data['ga4']['pages']) if data['ga4'] and data['ga4']['pages'] is not None else 0
-        print(f"   • {data['name']}: GSC {gsc_count}개, GA4 {ga4_count}개 페이지")
+        gsc_count = data['row_counts'].get('gsc_top_queries', 0)
+        ga4_count = data['row_counts'].get('ga4_pages', 0)
+        timed_out = f" (시간 초과: {', '.join(data['timed_out'])})" if data.get('timed_out') else ""
+        print(f"   • {data['name']}: GSC {gsc_count}개, GA4 {ga4_count}개 페이지{timed_out}")
 
     print(f"\n💡 다음 실행 권장: {config.get('global', {}).get('report_frequency', 'biweekly')}")
 